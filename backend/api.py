@@ -0,0 +1,463 @@
+# ================================
+# 뉴스/검색 API (ASGI, FastAPI)
+# ================================
+# 파이프라인이 만든 기사 스냅샷(article_snapshot)을 열어 카테고리별 기사 목록, 검색, 기사 상세를 JSON으로 제공한다.
+# 실행: uvicorn api:app --host 0.0.0.0 --port 8000 (스냅샷 폴더는 NEWS_SNAPSHOT_PATH 환경 변수로 지정)
+# - 스냅샷은 바뀌지 않으므로 (스냅샷의 조각 목록, 요청)이 같으면 응답도 같다. 이 값으로 ETag를 만들어
+#   응답을 만들기 전에 If-None-Match를 확인하고(304), 만든 응답은 압축한 상태로 LRU 캐시에 넣어 둔다.
+# - 응답은 클라이언트가 받을 수 있으면 brotli, 아니면 gzip으로 압축한다. (캐시에는 압축 방식별로 따로 저장)
+# - 많은 기사를 한 번에 요청하면 캐시하지 않고 기사를 나누어 읽으면서 바로 보낸다. (스트리밍)
+# - 파이프라인이 스냅샷에 조각을 덧붙이면 감시 스레드가 새 스냅샷과 빈 캐시로 한 번에 바꿔 끼운다.
+# - /feed는 프론트엔드의 뉴스 목록이 쓰는 엔드포인트로, 카테고리/언론사/신뢰도/기간으로 거르고 정렬한 한 쪽만 반환한다.
+#   (기사가 아무리 쌓여도 응답 크기는 쪽의 크기만큼이고, 스냅샷에 미리 정렬해 둔 목록에서 그만큼만 읽음)
+# - 응답을 만드는 일(스냅샷 읽기, JSON 변환, 검색, 압축)은 이벤트 루프를 막지 않도록 엔드포인트를 일반 함수로 두어
+#   FastAPI의 스레드 풀에서 실행한다. (느린 검색 하나가 다른 요청을 모두 기다리게 하지 않음)
+import gzip  # 응답 압축
+import hashlib  # ETag 생성
+import json  # 응답 JSON
+import os  # 스냅샷 폴더 설정
+import threading  # 요청 스레드들이 함께 쓰는 응답 캐시의 잠금
+import zlib  # 스트리밍 응답의 gzip 압축
+from collections import OrderedDict  # LRU 캐시
+from contextlib import asynccontextmanager  # 서버 시작/종료 시 스냅샷 열기/감시 중지
+from datetime import datetime  # 기간 조건의 날짜 확인
+
+from fastapi import FastAPI, Query, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+try:
+    import brotli  # gzip보다 작게 압축 (없으면 gzip만 사용)
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+from article_snapshot import ArticleSnapshot, SnapshotWatcher, SnapshotCompactor  # 파이프라인이 만든 기사 스냅샷
+from search_index import encode_cursor  # 거른 검색 결과의 다음 쪽 커서
+
+# ================================
+# 1. 설정
+# ================================
+SNAPSHOT_PATH = os.environ.get('NEWS_SNAPSHOT_PATH', 'C:/Users/admin/Desktop/news/test1/output/snapshot')
+# 브라우저에서 API를 직접 부르는 프론트엔드의 주소 (쉼표로 구분, '*'이면 모든 주소)
+CORS_ORIGINS = os.environ.get('NEWS_CORS_ORIGINS', 'http://localhost:3000').split(',')
+LANGUAGES = ('ko', 'en', 'ja', 'fr', 'zh-Hans')  # lang으로 고를 수 있는 언어 (파이프라인의 번역 언어 + 한국어)
+PAGE_SIZE = 20  # 한 쪽의 기본 기사 수
+MAX_PAGE_SIZE = 1000  # 기사 목록에서 한 번에 요청할 수 있는 최대 기사 수
+SEARCH_MAX_PAGE_SIZE = 100  # 검색에서 한 번에 요청할 수 있는 최대 기사 수
+FEED_SEARCH_MAX_SCAN = 2000  # /feed에서 검색어와 조건을 함께 줄 때 한 쪽을 채우려고 읽는 최대 검색 결과 수
+STREAM_THRESHOLD = 100  # 이보다 많은 기사를 요청하면 캐시하지 않고 이만큼씩 읽어서 바로 보냄
+CACHE_MAX_ENTRIES = 4096  # 응답 캐시에 보관할 최대 응답 수
+CACHE_MAX_BYTES = 64 * 1024 * 1024  # 응답 캐시에 보관할 최대 바이트 수 (압축한 크기)
+COMPRESS_MIN_BYTES = 1024  # 이보다 작은 응답은 압축하지 않음
+GZIP_LEVEL = 6  # gzip 압축 수준 (1~9)
+BROTLI_QUALITY = 4  # brotli 압축 품질 (0~11, 5부터는 훨씬 느려지고 크기는 조금만 줄어듦)
+CACHE_CONTROL = 'public, max-age=60'  # 브라우저/프록시가 다시 확인하지 않고 쓸 시간 (이후에는 ETag로 확인)
+SNAPSHOT_POLL_SECONDS = 5  # 파이프라인이 스냅샷에 새 조각을 덧붙였는지 확인하는 간격
+SNAPSHOT_COMPACT_SECONDS = 600  # 쌓인 스냅샷 조각을 합치는 간격
+
+_JSON_TYPE = 'application/json; charset=utf-8'
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'  # 스냅샷의 발행 시간 형식
+
+
+# ================================
+# 2. 응답 캐시
+# ================================
+class ResponseCache:
+    """
+    (요청, 압축 방식)을 키로 압축한 응답 본문을 보관하는 LRU 캐시입니다. (여러 요청 스레드가 함께 사용)
+    - max_entries, max_bytes: 넘으면 가장 오래 사용하지 않은 응답부터 지움
+    - stats: hits, misses, evicted
+    """
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()  # 순서 갱신과 지우기가 겹치지 않도록
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'evicted': 0}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry
+
+    def put(self, key, encoding, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous[1])
+            self._entries[key] = (encoding, body)
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.stats['evicted'] += 1
+
+
+# 스냅샷과 그 스냅샷의 응답 캐시 (새 스냅샷으로 바꿀 때 한 번의 대입으로 함께 바꿈)
+_state = (None, ResponseCache())
+
+
+def swap_snapshot(snapshot):
+    """새 조각을 반영한 스냅샷과 빈 캐시로 바꿉니다. (SnapshotWatcher가 호출)"""
+    global _state
+    _state = (snapshot, ResponseCache())
+    print(f"[API] 스냅샷 갱신: 조각 {len(snapshot.segments)}개, 뉴스 기사 {len(snapshot)}개")
+
+
+@asynccontextmanager
+async def lifespan(app):
+    snapshot = ArticleSnapshot(SNAPSHOT_PATH)
+    swap_snapshot(snapshot)
+    watcher = SnapshotWatcher(snapshot, swap_snapshot, SNAPSHOT_POLL_SECONDS).start()
+    compactor = SnapshotCompactor(SNAPSHOT_PATH, SNAPSHOT_COMPACT_SECONDS).start()
+    yield
+    watcher.stop()
+    compactor.stop()
+
+
+app = FastAPI(title='News API', lifespan=lifespan)
+app.add_middleware(CORSMiddleware, allow_origins=CORS_ORIGINS, allow_methods=['GET'], expose_headers=['ETag'])
+
+
+# ================================
+# 3. 응답 만들기 (ETag, 압축, 캐시, 스트리밍)
+# ================================
+def _accepted_encoding(header):
+    # Accept-Encoding에서 사용할 압축 방식을 고름 (brotli > gzip > 압축 안 함)
+    accepted = set()
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        quality = params.strip()
+        if quality.startswith('q=') and quality[2:].strip() in ('0', '0.0', '0.00', '0.000'):
+            continue
+        accepted.add(name.strip().lower())
+    if BROTLI_AVAILABLE and ('br' in accepted or '*' in accepted):
+        return 'br'
+    if 'gzip' in accepted or '*' in accepted:
+        return 'gzip'
+    return 'identity'
+
+
+def _compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return body
+
+
+def _compressor(encoding):
+    # 스트리밍 응답을 조각마다 압축하는 (압축 함수, 마무리 함수)
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        return compressor.process, compressor.finish
+    if encoding == 'gzip':
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # 31: gzip 머리말과 꼬리말을 붙임
+        return compressor.compress, compressor.flush
+    return (lambda chunk: chunk), (lambda: b'')
+
+
+def _headers(etag, encoding):
+    headers = {'ETag': etag, 'Cache-Control': CACHE_CONTROL, 'Vary': 'Accept-Encoding'}
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    return headers
+
+
+def _etag(snapshot, key):
+    # 스냅샷이 바뀌지 않으면 같은 요청의 응답은 같으므로, 응답을 만들지 않고 (조각 목록, 요청)으로 ETag를 만듦
+    digest = hashlib.blake2b(repr((snapshot.names, key)).encode('utf-8'), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _not_modified(request, etag):
+    header = request.headers.get('if-none-match')
+    return header is not None and (header.strip() == '*' or etag in (tag.strip() for tag in header.split(',')))
+
+
+def _error(status_code, message):
+    return JSONResponse({"error": message}, status_code=status_code)
+
+
+def respond(request, key, build):
+    """
+    요청 key의 응답을 반환합니다. build(snapshot)는 응답 JSON 바이트(찾는 것이 없으면 None)를 만드는 함수입니다.
+    ETag가 같으면 304, 캐시에 있으면 캐시의 응답을 그대로 보내고, 없으면 만들어서 압축한 뒤 캐시에 넣습니다.
+    """
+    snapshot, cache = _state
+    etag = _etag(snapshot, key)
+    requested = _accepted_encoding(request.headers.get('accept-encoding', ''))
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_headers(etag, 'identity'))
+    cached = cache.get((key, requested))
+    if cached is None:
+        try:
+            body = build(snapshot)
+        except ValueError as e:  # 잘못된 커서
+            return _error(400, str(e))
+        if body is None:
+            return _error(404, "기사를 찾을 수 없습니다.")
+        encoding = requested if len(body) >= COMPRESS_MIN_BYTES else 'identity'
+        cached = (encoding, _compress(body, encoding))
+        cache.put((key, requested), *cached)
+    encoding, body = cached
+    return Response(body, media_type=_JSON_TYPE, headers=_headers(etag, encoding))
+
+
+def stream(request, key, chunks):
+    """
+    chunks(snapshot)가 차례로 내놓는 JSON 바이트 조각을 압축하면서 바로 보냅니다. (캐시하지 않음, ETag는 respond와 같음)
+    응답을 보내기 시작한 뒤에는 상태 코드를 바꿀 수 없으므로, 잘못된 커서는 chunks를 만들 때 ValueError로 알려야 합니다.
+    """
+    snapshot, _ = _state
+    etag = _etag(snapshot, key)
+    encoding = _accepted_encoding(request.headers.get('accept-encoding', ''))
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_headers(etag, 'identity'))
+    try:
+        parts = chunks(snapshot)
+    except ValueError as e:
+        return _error(400, str(e))
+    process, finish = _compressor(encoding)
+
+    def body():
+        for part in parts:
+            compressed = process(part)
+            if compressed:
+                yield compressed
+        yield finish()
+
+    return StreamingResponse(body(), media_type=_JSON_TYPE, headers=_headers(etag, encoding))
+
+
+# ================================
+# 4. 기사 JSON
+# ================================
+def _localized(article, lang):
+    # lang 언어의 제목과 요약만 남긴 기사 (번역이 없으면 한국어)
+    article = dict(article)
+    titles = article.pop('translatedTitles', None) or {}
+    summaries = article.pop('translatedSummaries', None) or {}
+    article['title'] = titles.get(lang) or article.get('title')
+    article['summary'] = summaries.get(lang) or article.get('summary')
+    article['language'] = lang
+    return article
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _articles_json(raws, lang):
+    # 스냅샷의 기사 JSON 바이트를 쉼표로 이음 (lang이 없으면 분석하지 않고 그대로 씀)
+    if lang is None:
+        return b','.join(raws)
+    return b','.join(_dumps(_localized(json.loads(raw), lang)) for raw in raws)
+
+
+def _page_json(raws, next_cursor, lang):
+    return b'{"results":[' + _articles_json(raws, lang) + b'],"nextCursor":' + _dumps(next_cursor) + b'}'
+
+
+def _check_language(lang):
+    if lang is not None and lang not in LANGUAGES:
+        raise ValueError(f"지원하지 않는 언어입니다: {lang} (가능한 값: {', '.join(LANGUAGES)})")
+
+
+def _date_bound(value, end):
+    # 기간 조건('2025-09-01', '2025-09-01 09:00:00', '2025-09-01T09:00:00')을 스냅샷의 발행 시간 형식으로 바꿈
+    # 날짜만 주면 기간의 끝(end)은 그날의 마지막 시각
+    if value is None:
+        return None
+    try:
+        date = datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise ValueError(f"날짜 형식이 잘못되었습니다: {value} (예: 2025-09-01, 2025-09-01 09:00:00)") from None
+    if end and len(value.strip()) == 10:
+        date = date.replace(hour=23, minute=59, second=59)
+    return date.strftime(_DATE_FORMAT)
+
+
+def _matches(article, main_category=None, sub_category=None, source=None, reliability=None, since=None,
+             until=None, oldest=False):
+    # 검색 결과의 기사가 /feed의 조건(snapshot.list와 같은 인자)에 맞는지 확인 (oldest는 검색 결과에는 쓰지 않음)
+    if main_category and not any(main == main_category and (not sub_category or sub == sub_category)
+                                 for main, sub in article.get('categories', ())):
+        return False
+    if source and article.get('source') != source or reliability and article.get('reliability') != reliability:
+        return False
+    date = article.get('date') or ''
+    return (since is None or date >= since) and (until is None or date <= until)
+
+
+def _search_page(snapshot, query, filters, limit, cursor):
+    # 관련도 순 검색 결과를 조건으로 거르면서 limit개를 모음
+    # 조건에 맞는 기사가 드물면 FEED_SEARCH_MAX_SCAN개까지만 읽고, 그때까지 모은 기사와 읽은 곳의 커서를 반환
+    results, scanned = [], 0
+    while True:
+        hits, next_cursor = snapshot.search(query, limit=SEARCH_MAX_PAGE_SIZE, cursor=cursor)
+        for i, (score, article) in enumerate(hits):
+            if _matches(article, **filters):
+                results.append(article)
+                if len(results) == limit:
+                    more = i < len(hits) - 1 or next_cursor is not None
+                    return results, encode_cursor(score, article['id']) if more else None
+        scanned += len(hits)
+        cursor = next_cursor
+        if cursor is None or scanned >= FEED_SEARCH_MAX_SCAN:
+            return results, cursor
+
+
+# ================================
+# 5. API 엔드포인트
+# ================================
+def list_news(request, filters, limit, cursor, lang):
+    """
+    조건(filters: snapshot.list의 카테고리, 언론사, 신뢰도, 기간, 정렬 인자)에 맞는 기사를 발행 시간 순서로 limit개 반환합니다.
+    다음 쪽은 응답의 nextCursor를 cursor로 넘겨 요청합니다.
+    """
+    try:
+        _check_language(lang)
+    except ValueError as e:
+        return _error(400, str(e))
+    key = ('news', tuple(filters.items()), limit, cursor, lang)
+    if limit <= STREAM_THRESHOLD:
+        return respond(request, key, lambda snapshot: _page_json(
+            *snapshot.list(limit=limit, cursor=cursor, raw=True, **filters), lang))
+
+    def chunks(snapshot):
+        # 첫 조각은 바로 읽어서 잘못된 커서를 응답을 보내기 전에 알아냄
+        raws, next_cursor = snapshot.list(limit=min(limit, STREAM_THRESHOLD), cursor=cursor, raw=True, **filters)
+
+        def parts(raws, next_cursor):
+            remaining = limit - len(raws)
+            yield b'{"results":[' + _articles_json(raws, lang)
+            while remaining > 0 and next_cursor is not None:
+                raws, next_cursor = snapshot.list(limit=min(remaining, STREAM_THRESHOLD), cursor=next_cursor,
+                                                  raw=True, **filters)
+                remaining -= len(raws)
+                if raws:
+                    yield b',' + _articles_json(raws, lang)
+            yield b'],"nextCursor":' + _dumps(next_cursor) + b'}'
+
+        return parts(raws, next_cursor)
+
+    return stream(request, key, chunks)
+
+
+@app.get('/news')
+def all_news(request: Request, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+             cursor: str | None = None, lang: str | None = None):
+    """모든 카테고리의 기사를 최신순으로 반환합니다."""
+    return list_news(request, {}, limit, cursor, lang)
+
+
+@app.get('/news/{category}')
+def category_news(category: str, request: Request, limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                  cursor: str | None = None, lang: str | None = None):
+    """대분류의 기사를 최신순으로 반환합니다."""
+    return list_news(request, {'main_category': category}, limit, cursor, lang)
+
+
+@app.get('/news/{category}/{sub_category:path}')
+def sub_category_news(category: str, sub_category: str, request: Request,
+                      limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                      cursor: str | None = None, lang: str | None = None):
+    """소분류의 기사를 최신순으로 반환합니다. (소분류 이름에 '/'가 들어갈 수 있음: /news/정치/국방/북한)"""
+    return list_news(request, {'main_category': category, 'sub_category': sub_category}, limit, cursor, lang)
+
+
+@app.get('/feed')
+def feed(request: Request, category: str | None = None, sub_category: str | None = Query(None, alias='subCategory'),
+         source: str | None = None, reliability: str | None = None,
+         date_from: str | None = Query(None, alias='from'), date_to: str | None = Query(None, alias='to'),
+         sort: str = Query('newest', pattern='^(newest|oldest)$'), q: str = '',
+         limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), cursor: str | None = None, lang: str | None = None):
+    """
+    조건에 맞는 기사를 한 쪽씩 반환합니다. (프론트엔드의 뉴스 목록)
+    - category, subCategory: 대분류, 소분류 / source: 언론사 / reliability: 신뢰도
+    - from, to: 발행 시간 범위 (양 끝 포함, 날짜만 주면 그날 전체) / sort: newest(최신순) 또는 oldest(오래된 순)
+    - q: 검색어 (주면 sort 대신 관련도 순이고, limit은 최대 SEARCH_MAX_PAGE_SIZE)
+    - lang: 제목과 요약의 언어 / cursor: 이전 응답의 nextCursor (같은 조건으로 요청해야 함)
+    """
+    if sub_category and not category:
+        return _error(400, "소분류에는 대분류(category)가 필요합니다.")
+    try:
+        filters = {'main_category': category, 'sub_category': sub_category, 'source': source, 'reliability': reliability,
+                   'since': _date_bound(date_from, False), 'until': _date_bound(date_to, True), 'oldest': sort == 'oldest'}
+    except ValueError as e:
+        return _error(400, str(e))
+    query = q.lower().strip()
+    if not query:
+        return list_news(request, filters, limit, cursor, lang)
+    if limit > SEARCH_MAX_PAGE_SIZE:
+        return _error(400, f"검색어를 주면 limit은 {SEARCH_MAX_PAGE_SIZE} 이하여야 합니다.")
+    try:
+        _check_language(lang)
+    except ValueError as e:
+        return _error(400, str(e))
+
+    def build(snapshot):
+        articles, next_cursor = _search_page(snapshot, query, filters, limit, cursor)
+        articles = [article if lang is None else _localized(article, lang) for article in articles]
+        return _dumps({"results": articles, "nextCursor": next_cursor})
+
+    return respond(request, ('feed', query, tuple(filters.items()), limit, cursor, lang), build)
+
+
+@app.get('/sources')
+def sources(request: Request, category: str | None = None,
+            sub_category: str | None = Query(None, alias='subCategory')):
+    """카테고리의 언론사와 기사 수(대략적인 수)를 기사가 많은 순서로 반환합니다. (/feed의 source로 고를 언론사 목록)"""
+    def build(snapshot):
+        counts = snapshot.sources(category, sub_category)
+        return _dumps({"results": [{"source": source, "count": count} for source, count in counts.items() if source]})
+
+    return respond(request, ('sources', category, sub_category), build)
+
+
+@app.get('/search')
+def search(request: Request, q: str = '', limit: int = Query(PAGE_SIZE, ge=1, le=SEARCH_MAX_PAGE_SIZE),
+           cursor: str | None = None, lang: str | None = None):
+    """검색어의 토큰이 모두 나오는 기사를 관련도 순으로 반환합니다. (test/app.py의 /search에 limit이나 cursor를 줄 때와 같은 형식)"""
+    query = q.lower().strip()
+    if not query:
+        return _error(400, "검색어가 필요합니다.")
+    try:
+        _check_language(lang)
+    except ValueError as e:
+        return _error(400, str(e))
+
+    def build(snapshot):
+        hits, next_cursor = snapshot.search(query, limit=limit, cursor=cursor)
+        articles = [article if lang is None else _localized(article, lang) for _, article in hits]
+        return _dumps({"results": articles, "nextCursor": next_cursor})
+
+    return respond(request, ('search', query, limit, cursor, lang), build)
+
+
+@app.get('/articles/{article_id}')
+def article_detail(article_id: int, request: Request, lang: str | None = None):
+    """id로 기사 하나를 반환합니다."""
+    try:
+        _check_language(lang)
+    except ValueError as e:
+        return _error(400, str(e))
+
+    def build(snapshot):
+        raw = snapshot.get(article_id, raw=True)
+        if raw is None:
+            return None
+        return raw if lang is None else _dumps(_localized(json.loads(raw), lang))
+
+    return respond(request, ('article', article_id, lang), build)
@@ -0,0 +1,496 @@
+# ================================
+# 기사 스냅샷 (JSONL + 위치 색인 + 검색 색인, 조각 단위)
+# ================================
+# 검색 서버가 시작할 때마다 HTML 파일을 모두 다시 분석하면 기사가 쌓일수록 시작이 느려진다.
+# 파이프라인이 실행을 마치면 기사 저장소의 기사를 한 줄에 하나씩 JSON으로 쓴 파일(articles.jsonl),
+# 각 줄의 시작 위치를 담은 이진 색인(articles.idx), 검색 색인(search.idx)을 함께 만들어 둔다.
+# 서버는 파일들을 메모리 매핑(mmap)하고 기사를 요청받을 때 그 줄만 읽어 분석하므로, 기사 수와 관계없이 바로 시작하고
+# 모든 기사를 딕셔너리로 메모리에 들고 있지 않는다.
+# 이 세 파일의 묶음을 조각(segment)이라 하고, 스냅샷은 MANIFEST 파일에 적힌 조각들(오래된 것부터)로 이루어진다.
+# 실행마다 전체를 다시 쓰지 않고 새로 추가되거나 바뀐 기사만 새 조각으로 써서 MANIFEST에 덧붙이며,
+# 같은 기사(id)가 여러 조각에 있으면 가장 새 조각의 기사가 보인다.
+# 조각은 다 쓴 뒤에 MANIFEST를 한 번에 바꾸므로 읽는 쪽은 항상 완성된 조각만 보고, 이미 연 조각은 바뀌지 않는다.
+# 조각이 쌓이면 compact()가 작은 조각들을 하나로 합친다.
+# 조각마다 카테고리(전체, 대분류, 대분류/소분류)별, 카테고리와 언론사별로 발행 시간 최신순으로 정렬한 기사 번호 목록(listing.idx)도
+# 함께 저장해, 카테고리의 최신(또는 가장 오래된) 기사를 조각마다 필요한 만큼만 읽어 합친다.
+# 발행 시간 범위는 정렬된 목록에서 이진 탐색으로 찾고, 신뢰도는 목록을 읽으면서 기사 번호별 신뢰도 코드로 거른다.
+import heapq  # 여러 조각의 카테고리 목록 합치기
+import json  # 기사 한 줄씩 저장, MANIFEST
+import mmap  # 파일을 읽지 않고 필요한 부분만 사용
+import os  # 폴더 생성, 파일 교체
+import shutil  # 쓰지 않는 조각 삭제
+import struct  # 위치 색인의 머리말
+import threading  # 스냅샷 감시, 조각 합치기를 백그라운드에서 실행
+import time  # MANIFEST 잠금 대기, 조각 삭제 유예 시간
+import uuid  # 조각 이름이 겹치지 않도록 함
+from array import array  # 각 줄의 시작 위치
+from bisect import bisect_left, bisect_right  # 카테고리 목록에서 커서 위치, 발행 시간 범위 찾기
+from contextlib import contextmanager  # MANIFEST 잠금
+from datetime import datetime  # 조각 이름, 발행 시간
+from itertools import islice  # 합친 카테고리 목록에서 한 쪽만 꺼내기
+
+from search_index import SearchIndex, IndexView, encode_cursor, decode_cursor  # 조각마다 저장하는 검색 색인, 여러 조각을 함께 검색
+
+ARTICLES_FILE = 'articles.jsonl'
+OFFSETS_FILE = 'articles.idx'
+SEARCH_FILE = 'search.idx'
+LISTING_FILE = 'listing.idx'
+MANIFEST_FILE = 'MANIFEST'  # 스냅샷을 이루는 조각 목록 (JSON)
+LOCK_FILE = 'MANIFEST.lock'  # MANIFEST를 고치는 동안 만들어 두는 잠금 파일
+SEGMENTS_DIR = 'segments'
+SNAPSHOT_VERSION = 3  # 조각의 파일 구성이 바뀌면 올림 (버전이 다른 스냅샷은 전체를 다시 만들어야 함)
+LOCK_STALE_SECONDS = 120  # 이보다 오래된 잠금 파일은 잠근 프로세스가 죽은 것으로 보고 지움
+GRACE_SECONDS = 600  # MANIFEST에서 빠진 조각을 지우기 전에 기다리는 시간 (이전 MANIFEST로 조각을 여는 서버를 위해)
+
+_OFFSETS_MAGIC = b'NEWSOFS1'
+_OFFSETS_HEADER = struct.Struct('<8sQ')  # 식별자, 기사 수 (그 뒤에 기사 수 + 1개의 줄 시작 위치 'Q')
+_LISTING_MAGIC = b'NEWSLST2'
+# 식별자, 기사 수, 목록 표의 길이 (그 뒤에 8바이트 단위로 채운 목록 표, 기사 번호 순서의 발행 시각('q', 초),
+# 8바이트 단위로 채운 기사 번호 순서의 신뢰도 코드('B'), 모든 목록의 기사 번호('I')가 차례로 이어짐)
+# 목록 표(JSON): {'lists': {목록 키: [시작 위치, 개수]}, 'sources': {카테고리 목록 키: {언론사: 기사 수}},
+#                'reliabilities': [신뢰도 코드 순서의 신뢰도]}
+_LISTING_HEADER = struct.Struct('<8sQQ')
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'  # 기사 저장소의 발행 시간 형식
+
+
+def listing_key(main_category=None, sub_category=None, source=None):
+    """
+    카테고리 목록의 키를 반환합니다. (대분류가 없으면 전체 기사, 소분류가 없으면 대분류의 모든 기사)
+    source를 주면 그 카테고리에서 언론사가 source인 기사의 목록입니다.
+    """
+    key = '' if not main_category else f"{main_category}/{sub_category}" if sub_category else main_category
+    return f"{key}|{source}" if source else key
+
+
+def _date_value(date):
+    # 발행 시간 문자열을 정렬용 정수(초)로 바꿈 (형식이 다르면 가장 오래된 기사로 봄)
+    try:
+        return int((datetime.strptime(date, _DATE_FORMAT) - datetime(1970, 1, 1)).total_seconds())
+    except (TypeError, ValueError):
+        return 0
+
+
+def _write_listing(path, records):
+    # 카테고리별, 카테고리와 언론사별로 (발행 시각, id)가 큰 순서로 정렬한 기사 번호 목록과 기사별 신뢰도 코드를 저장
+    dates = array('q', (_date_value(record.get('date')) for record in records))
+    reliabilities = sorted({record.get('reliability') or '' for record in records})
+    codes = {reliability: code for code, reliability in enumerate(reliabilities)}
+    reliability_codes = array('B', (codes[record.get('reliability') or ''] for record in records))
+    reliability_codes.extend([0] * (-len(reliability_codes) % 8))
+    lists, sources = {}, {}
+    for doc_id, record in enumerate(records):
+        categories = {(None, None), *((main_category, None) for main_category, _ in record.get('categories', ()))}
+        categories.update((main_category, sub_category) for main_category, sub_category in record.get('categories', ()))
+        source = record.get('source') or ''
+        for main_category, sub_category in categories:
+            key = listing_key(main_category, sub_category)
+            lists.setdefault(key, []).append(doc_id)
+            counts = sources.setdefault(key, {})
+            counts[source] = counts.get(source, 0) + 1
+            if source:
+                lists.setdefault(listing_key(main_category, sub_category, source), []).append(doc_id)
+    table, docs = {}, array('I')
+    for key, members in sorted(lists.items()):
+        members.sort(key=lambda doc_id: (dates[doc_id], records[doc_id]['id']), reverse=True)
+        table[key] = [len(docs), len(members)]
+        docs.extend(members)
+    encoded = json.dumps({'lists': table, 'sources': sources, 'reliabilities': reliabilities},
+                         ensure_ascii=False).encode('utf-8')
+    encoded += b' ' * (-len(encoded) % 8)
+    with open(path, 'wb') as f:
+        f.write(_LISTING_HEADER.pack(_LISTING_MAGIC, len(records), len(encoded)))
+        f.write(encoded)
+        f.write(dates)
+        f.write(reliability_codes)
+        f.write(docs)
+
+
+def _write_segment(directory, records):
+    # 기사 목록으로 조각을 만들고 이름을 반환 (목록의 순서가 조각과 검색 색인의 기사 번호, 기사의 'id'가 기사 키)
+    name = f"{datetime.now():%Y%m%d-%H%M%S-%f}-{uuid.uuid4().hex[:6]}"
+    segments = os.path.join(directory, SEGMENTS_DIR)
+    temporary = os.path.join(segments, f".{name}.tmp")
+    os.makedirs(temporary)
+    offsets = array('Q', [0])
+    with open(os.path.join(temporary, ARTICLES_FILE), 'wb') as f:
+        for record in records:
+            line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+            f.write(line)
+            offsets.append(offsets[-1] + len(line))
+    with open(os.path.join(temporary, OFFSETS_FILE), 'wb') as f:
+        f.write(_OFFSETS_HEADER.pack(_OFFSETS_MAGIC, len(records)))
+        f.write(offsets)
+    SearchIndex(records, keys=[record['id'] for record in records]).save(os.path.join(temporary, SEARCH_FILE))
+    _write_listing(os.path.join(temporary, LISTING_FILE), records)
+    os.replace(temporary, os.path.join(segments, name))
+    return name
+
+
+@contextmanager
+def _manifest_lock(directory, timeout=30):
+    # 여러 프로세스(파이프라인, 검색 서버의 조각 합치기)가 MANIFEST를 동시에 고치지 않도록 잠금 파일을 만들어 둠
+    path = os.path.join(directory, LOCK_FILE)
+    deadline = time.time() + timeout
+    while True:
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > LOCK_STALE_SECONDS:
+                    os.remove(path)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.time() > deadline:
+                raise TimeoutError(f"스냅샷 잠금을 얻지 못했습니다: {path}")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.remove(path)
+
+
+def read_manifest(directory):
+    """
+    MANIFEST를 {'version': 버전, 'segments': [조각 이름, ...(오래된 것부터)], 'watermark': 값}으로 반환합니다.
+    스냅샷이 없으면 None입니다.
+    """
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _replace_manifest(directory, manifest):
+    # 임시 파일에 쓴 뒤 한 번에 바꿔서, 읽는 쪽이 이전 목록이나 새 목록 중 하나만 보도록 함
+    temporary = os.path.join(directory, MANIFEST_FILE + '.tmp')
+    with open(temporary, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(temporary, os.path.join(directory, MANIFEST_FILE))
+
+
+def _remove_unused(directory, grace_seconds):
+    # MANIFEST에 없는 조각(합쳐진 조각, 중단된 쓰기)을 지움
+    # 막 이전 MANIFEST를 읽고 조각을 열려는 서버가 있을 수 있으므로 grace_seconds보다 오래된 것만 지움
+    manifest = read_manifest(directory) or {'segments': []}
+    listed = set(manifest['segments'])
+    segments = os.path.join(directory, SEGMENTS_DIR)
+    for name in os.listdir(segments):
+        path = os.path.join(segments, name)
+        if name in listed or time.time() - os.path.getmtime(path) < grace_seconds:
+            continue
+        # Windows에서는 서버가 열고 있는 조각을 지울 수 없으므로, 실패하면 다음에 다시 지움
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def write_snapshot(directory, records, watermark=None):
+    """
+    기사 목록(JSON으로 바꿀 수 있고 정수 'id'를 가진 딕셔너리) 전체로 조각 하나짜리 새 스냅샷을 만듭니다. 조각 이름을 반환합니다.
+    watermark는 이 스냅샷에 들어간 기사의 기준 값(기사 저장소의 마지막 갱신 시각 등)으로, MANIFEST에 함께 기록됩니다.
+    """
+    os.makedirs(os.path.join(directory, SEGMENTS_DIR), exist_ok=True)
+    name = _write_segment(directory, list(records))
+    with _manifest_lock(directory):
+        _replace_manifest(directory, {'version': SNAPSHOT_VERSION, 'segments': [name], 'watermark': watermark})
+    _remove_unused(directory, GRACE_SECONDS)
+    return name
+
+
+def append_snapshot(directory, records, watermark=None):
+    """
+    새로 추가되거나 바뀐 기사 목록을 새 조각으로 써서 스냅샷에 덧붙입니다. 조각 이름(기사가 없으면 None)을 반환합니다.
+    같은 id의 기사가 이전 조각에 있으면 이 조각의 기사가 대신 보입니다. 스냅샷이 없으면 FileNotFoundError가 발생합니다.
+    """
+    records = list(records)
+    name = _write_segment(directory, records) if records else None
+    with _manifest_lock(directory):
+        manifest = read_manifest(directory)
+        if manifest is None:
+            raise FileNotFoundError(f"스냅샷이 없습니다: {directory}")
+        if manifest.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"스냅샷 버전이 다릅니다. 전체를 다시 만들어야 합니다: {directory}")
+        if name is not None:
+            manifest['segments'].append(name)
+        manifest['watermark'] = watermark
+        _replace_manifest(directory, manifest)
+    return name
+
+
+def compact(directory, max_segments=8, grace_seconds=GRACE_SECONDS):
+    """
+    조각이 max_segments개보다 많으면 조각들을 하나로 합칩니다. 합친 조각 이름을 반환합니다. (합치지 않았으면 None)
+    처음 조각(전체 스냅샷)은 크므로 보통 나머지 조각들만 합치고, 나머지 조각들의 기사 수가 처음 조각의 절반 이상이 되면 모두 합칩니다.
+    합치는 동안 다른 프로세스가 조각을 덧붙여도 되며, 그사이 합친 조각들이 MANIFEST에서 바뀌었으면 합친 결과는 버립니다.
+    """
+    manifest = read_manifest(directory)
+    if manifest is None or manifest.get('version') != SNAPSHOT_VERSION:
+        return None
+    merged = None
+    names = manifest['segments']
+    if len(names) > max_segments:
+        segments = [ArticleSegment(os.path.join(directory, SEGMENTS_DIR, name)) for name in names]
+        if sum(map(len, segments[1:])) * 2 < len(segments[0]):
+            segments = segments[1:]
+        articles = {}
+        for segment in segments:  # 오래된 조각부터 읽으므로 같은 id는 새 조각의 기사가 남음
+            for article in segment:
+                articles[article['id']] = article
+        records = sorted(articles.values(), key=lambda article: (article['date'], article['id']), reverse=True)
+        merged = _write_segment(directory, records)
+        start = names.index(segments[0].name)
+        with _manifest_lock(directory):
+            current = read_manifest(directory)
+            replaced = [segment.name for segment in segments]
+            if current is not None and current['segments'][start:start + len(replaced)] == replaced:
+                current['segments'][start:start + len(replaced)] = [merged]
+                _replace_manifest(directory, current)
+            else:
+                merged = None
+    _remove_unused(directory, grace_seconds)
+    return merged
+
+
+def _map(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # 빈 파일은 매핑할 수 없음
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ArticleSegment:
+    """
+    스냅샷 조각 하나를 읽는 목록입니다. 기사는 번호로 꺼낼 때마다 그 줄만 읽어 분석합니다.
+    - path: 조각 폴더, name: 조각 이름
+    - len(), segment[i], 반복: 기사 딕셔너리
+    - raw(i): 기사 한 줄의 JSON 바이트 (분석하지 않고 그대로 응답에 쓸 때)
+    - index: 함께 저장된 검색 색인 (SearchIndex)
+    - dates: 기사 번호 순서의 발행 시각(초), listing(key): 카테고리 목록의 기사 번호 (최신순)
+    - reliability_codes: 기사 번호 순서의 신뢰도 코드, reliability_code(reliability): 신뢰도의 코드 (이 조각에 없으면 None)
+    - sources(key): 카테고리 목록의 언론사별 기사 수
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self._articles = _map(os.path.join(path, ARTICLES_FILE))
+        self._offsets_file = _map(os.path.join(path, OFFSETS_FILE))
+        magic, self._count = _OFFSETS_HEADER.unpack_from(self._offsets_file)
+        if magic != _OFFSETS_MAGIC:
+            raise ValueError(f"기사 위치 색인 파일 형식이 아닙니다: {path}")
+        self._offsets = memoryview(self._offsets_file)[_OFFSETS_HEADER.size:].cast('Q')
+        self.index = SearchIndex.load(os.path.join(path, SEARCH_FILE), self)
+        listing = memoryview(_map(os.path.join(path, LISTING_FILE)))
+        magic, count, table_size = _LISTING_HEADER.unpack_from(listing)
+        if magic != _LISTING_MAGIC or count != self._count:
+            raise ValueError(f"카테고리 목록 파일 형식이 아닙니다: {path}")
+        position = _LISTING_HEADER.size + table_size
+        table = json.loads(bytes(listing[_LISTING_HEADER.size:position]))
+        self._lists, self._sources = table['lists'], table['sources']
+        self._reliabilities = {reliability: code for code, reliability in enumerate(table['reliabilities'])}
+        self.dates = listing[position:position + count * 8].cast('q')
+        position += count * 8
+        self.reliability_codes = listing[position:position + count]
+        position += count + -count % 8
+        self._list_docs = listing[position:].cast('I')
+
+    def __len__(self):
+        return self._count
+
+    def listing(self, key):
+        start, count = self._lists.get(key, (0, 0))
+        return self._list_docs[start:start + count]
+
+    def sources(self, key):
+        return self._sources.get(key, {})
+
+    def reliability_code(self, reliability):
+        return self._reliabilities.get(reliability)
+
+    def raw(self, i):
+        if not -self._count <= i < self._count:
+            raise IndexError(i)
+        i %= self._count
+        return self._articles[self._offsets[i]:self._offsets[i + 1] - 1]  # 줄바꿈 문자는 뺌
+
+    def __getitem__(self, i):
+        return json.loads(self.raw(i))
+
+    def __iter__(self):
+        return (self[i] for i in range(self._count))
+
+
+class ArticleSnapshot:
+    """
+    MANIFEST에 적힌 조각들을 하나의 기사 목록과 검색 색인으로 보여 줍니다. 만든 뒤에는 바뀌지 않으므로,
+    새 조각을 보려면 refresh()가 반환하는 새 스냅샷으로 바꿔 끼웁니다. (이전 스냅샷으로 처리 중인 요청은 그대로 끝남)
+    - directory: write_snapshot에 넘긴 폴더, opened: 이미 연 조각({이름: ArticleSegment}, 다시 열지 않고 함께 씀)
+    - len(), 반복: 보이는 기사 (같은 id는 가장 새 조각의 기사만)
+    - search(query, limit, cursor): 모든 조각을 함께 검색 (IndexView.search 참고)
+    - list(main_category, sub_category, limit, cursor, ...): 카테고리의 기사를 발행 시간 순서로 반환 (언론사, 신뢰도, 기간으로 거름)
+    - sources(main_category, sub_category): 카테고리의 언론사별 기사 수
+    - get(article_id): id로 기사 찾기
+    - names, watermark: MANIFEST의 조각 목록과 기준 값
+    list와 get에 raw=True를 주면 기사 딕셔너리 대신 기사 한 줄의 JSON 바이트를 반환합니다. (응답에 그대로 쓸 때)
+    """
+
+    def __init__(self, directory, opened=None):
+        manifest = read_manifest(directory)
+        if manifest is None:
+            raise FileNotFoundError(f"스냅샷이 없습니다: {directory}")
+        if manifest.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"스냅샷 버전이 다릅니다. 파이프라인이 전체를 다시 만들어야 합니다: {directory}")
+        opened = opened or {}
+        self.directory = directory
+        self.names = manifest['segments']
+        self.watermark = manifest.get('watermark')
+        self.segments = [opened.get(name) or ArticleSegment(os.path.join(directory, SEGMENTS_DIR, name))
+                         for name in self.names]
+        self.view = IndexView([segment.index for segment in self.segments])
+
+    def __len__(self):
+        return len(self.view)
+
+    def __iter__(self):
+        for number in reversed(range(len(self.segments))):  # 새 조각부터
+            hidden = self.view.hidden(number)
+            for i, article in enumerate(self.segments[number]):
+                if i not in hidden:
+                    yield article
+
+    def search(self, query, limit=20, cursor=None):
+        return self.view.search(query, limit, cursor)
+
+    def _article(self, number, doc_id, raw):
+        segment = self.segments[number]
+        return segment.raw(doc_id) if raw else segment[doc_id]
+
+    def get(self, article_id, raw=False):
+        """id가 article_id인 기사를 반환합니다. 없으면 None입니다."""
+        for number in reversed(range(len(self.segments))):  # 새 조각의 기사가 보이는 기사
+            doc_id = self.segments[number].index.find(article_id)
+            if doc_id is not None:
+                return self._article(number, doc_id, raw)
+        return None
+
+    def _listing(self, number, key, after, reliability, since, until, oldest):
+        # 조각 하나의 카테고리 목록을 커서 다음부터 (정렬 키, 정렬 키, 조각 번호, 기사 번호)로 반환 (가려진 기사, 거른 기사는 뺌)
+        # 정렬 키는 최신순이면 (-발행 시각, -id), 오래된 순이면 (발행 시각, id)로, 모든 조각에서 작은 것부터 합침
+        segment = self.segments[number]
+        docs, dates, keys, hidden = segment.listing(key), segment.dates, segment.index.keys, self.view.hidden(number)
+        codes, code = segment.reliability_codes, None
+        if reliability is not None:
+            code = segment.reliability_code(reliability)
+            if code is None:  # 이 조각에는 그 신뢰도의 기사가 없음
+                return
+        sign, first, last = (1, since, until) if oldest else (-1, until, since)
+        if oldest:
+            docs = docs[::-1]
+        order = lambda doc_id: (sign * dates[doc_id], sign * keys[doc_id])
+        start = 0 if after is None else bisect_right(docs, (sign * after[0], sign * after[1]), key=order)
+        if first is not None:  # 기간의 시작 (최신순이면 끝 시각)보다 앞선 기사는 이진 탐색으로 건너뜀
+            start = max(start, bisect_left(docs, (sign * first, float('-inf')), key=order))
+        for doc_id in docs[start:]:
+            if last is not None and sign * dates[doc_id] > sign * last:
+                return
+            if doc_id not in hidden and (code is None or codes[doc_id] == code):
+                yield sign * dates[doc_id], sign * keys[doc_id], number, doc_id
+
+    def list(self, main_category=None, sub_category=None, limit=20, cursor=None, raw=False,
+             source=None, reliability=None, since=None, until=None, oldest=False):
+        """
+        카테고리의 기사를 발행 시간 최신순(같으면 id가 큰 순서)으로 최대 limit개 찾아 기사 목록과 다음 쪽의 커서를 반환합니다.
+        대분류가 없으면 모든 기사, 소분류가 없으면 대분류의 모든 기사입니다. 조각마다 미리 정렬해 둔 목록을 합치므로
+        쪽의 크기만큼만 읽습니다. 커서가 잘못되면 ValueError가 발생합니다.
+        - source, reliability: 언론사, 신뢰도가 같은 기사만 (언론사는 따로 정렬해 둔 목록을 읽음)
+        - since, until: 발행 시간이 이 범위('%Y-%m-%d %H:%M:%S', 양 끝 포함)인 기사만
+        - oldest: True면 발행 시간이 오래된 순서 (커서는 같은 정렬 순서로 받은 것을 넘겨야 함)
+        """
+        after = decode_cursor(cursor) if cursor else None
+        key = listing_key(main_category, sub_category, source)
+        since = None if since is None else _date_value(since)
+        until = None if until is None else _date_value(until)
+        entries = list(islice(heapq.merge(*(self._listing(number, key, after, reliability, since, until, oldest)
+                                            for number in range(len(self.segments)))), limit + 1))
+        page = entries[:limit]
+        sign = 1 if oldest else -1
+        next_cursor = encode_cursor(sign * page[-1][0], sign * page[-1][1]) if len(entries) > limit else None
+        return [self._article(number, doc_id, raw) for _, _, number, doc_id in page], next_cursor
+
+    def sources(self, main_category=None, sub_category=None):
+        """
+        카테고리의 언론사별 기사 수를 기사가 많은 순서로 반환합니다. 조각마다 세어 둔 수를 더하므로,
+        여러 조각에 있는 같은 기사는 여러 번 세어질 수 있습니다. (대략적인 수)
+        """
+        counts = {}
+        key = listing_key(main_category, sub_category)
+        for segment in self.segments:
+            for source, count in segment.sources(key).items():
+                counts[source] = counts.get(source, 0) + count
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+    def refresh(self):
+        """MANIFEST가 바뀌었으면 바뀐 조각만 새로 연 새 스냅샷을, 그대로면 이 스냅샷을 반환합니다."""
+        manifest = read_manifest(self.directory)
+        if manifest is None or manifest['segments'] == self.names:
+            return self
+        return ArticleSnapshot(self.directory, {segment.name: segment for segment in self.segments})
+
+
+class _Periodic:
+    # interval초마다 백그라운드 스레드에서 run_once()를 호출 (오류는 세어 두고 다음 주기에 다시 시도)
+    def __init__(self, interval):
+        self.interval = interval
+        self.stats = {'runs': 0, 'errors': 0}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name=type(self).__name__, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _loop(self):
+        while True:
+            try:
+                self.run_once()
+                self.stats['runs'] += 1
+            except (OSError, ValueError) as e:  # 파일 읽기/쓰기 실패, 잠금 대기 시간 초과, 잘못된 파일 형식
+                self.stats['errors'] += 1
+                print(f"[{type(self).__name__}] {e}")
+            if self._stop.wait(self.interval):
+                return
+
+
+class SnapshotWatcher(_Periodic):
+    """
+    스냅샷 폴더의 MANIFEST를 interval초마다 확인하고, 바뀌면 새 스냅샷을 만들어 on_change(snapshot)를 호출합니다.
+    (검색 서버는 on_change에서 전역 스냅샷을 바꿔 끼우므로 검색 요청은 기다리지 않음)
+    """
+
+    def __init__(self, snapshot, on_change, interval=5):
+        super().__init__(interval)
+        self.snapshot = snapshot
+        self.on_change = on_change
+
+    def run_once(self):
+        snapshot = self.snapshot.refresh()
+        if snapshot is not self.snapshot:
+            self.snapshot = snapshot
+            self.on_change(snapshot)
+
+
+class SnapshotCompactor(_Periodic):
+    """interval초마다 스냅샷 폴더의 조각을 compact()로 합칩니다. 처음 한 번은 시작하자마자 실행합니다."""
+
+    def __init__(self, directory, interval=600, max_segments=8):
+        super().__init__(interval)
+        self.directory = directory
+        self.max_segments = max_segments
+
+    def run_once(self):
+        compact(self.directory, self.max_segments)
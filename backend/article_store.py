@@ -0,0 +1,136 @@
+# ================================
+# 처리한 기사 저장소 (SQLite)
+# ================================
+# 처리가 끝난 기사(언론사, 발행 시간, 원문 주소, 이미지, 언어별 제목/요약, 신뢰도)를 기사마다 한 행으로 저장한다.
+# 기사와 카테고리(대분류, 소분류)의 연결은 따로 저장하고 (카테고리, 발행 시간) 색인을 두어,
+# HTML 페이지는 이번 실행에서 처리한 기사만이 아니라 저장소에 쌓인 기사를 최신순으로 읽어서 만든다.
+# 피드 하나의 기사들은 한 트랜잭션으로 저장하므로, 중간에 실패해도 일부만 저장되는 일이 없다.
+import json  # 언어별 제목/요약 저장
+import os  # 저장 폴더 생성
+import sqlite3  # 파일 기반 데이터베이스
+import threading  # 여러 작업자가 동시에 접근할 때 사용하는 잠금
+import time  # 저장 시각 기록
+
+
+class ArticleStore:
+    """
+    기사 저장소입니다.
+    - save(categories, articles): 기사들을 저장(이미 있는 기사는 갱신)하고 카테고리에 연결
+    - list(main_category, sub_category, since, limit): 카테고리의 기사를 발행 시간 최신순으로 반환
+    - export(updated_since): 기사(updated_since 이후에 저장된 기사만)를 연결된 카테고리 목록과 함께 발행 시간 최신순으로 반환 (스냅샷 생성용)
+    - stats: inserted(새로 저장한 기사 수), updated(갱신한 기사 수)
+    각 기사는 link, source, date('%Y-%m-%d %H:%M:%S'), image_url, reliability,
+    titles({언어: 제목}), summaries({언어: 요약}), related(같은 소식을 다룬 다른 기사 목록) 키를 가진 딕셔너리입니다.
+    """
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS articles (
+                   id INTEGER PRIMARY KEY,
+                   article_key TEXT NOT NULL UNIQUE,
+                   link TEXT NOT NULL,
+                   source TEXT NOT NULL,
+                   date TEXT NOT NULL,
+                   image_url TEXT,
+                   reliability TEXT,
+                   titles TEXT NOT NULL,
+                   summaries TEXT NOT NULL,
+                   related TEXT NOT NULL DEFAULT '[]',
+                   created_at REAL NOT NULL,
+                   updated_at REAL NOT NULL
+               );
+               CREATE TABLE IF NOT EXISTS article_categories (
+                   main_category TEXT NOT NULL,
+                   sub_category TEXT NOT NULL,
+                   article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+                   date TEXT NOT NULL,
+                   PRIMARY KEY (main_category, sub_category, article_id)
+               );
+               CREATE INDEX IF NOT EXISTS article_categories_by_date
+                   ON article_categories (main_category, sub_category, date DESC);
+               CREATE INDEX IF NOT EXISTS articles_by_updated_at ON articles (updated_at);"""
+        )
+        self._conn.commit()
+        self.stats = {'inserted': 0, 'updated': 0}
+
+    def save(self, categories, articles):
+        """
+        (기사 키, 기사) 목록을 한 트랜잭션으로 저장하고, 모든 기사를 categories의 (대분류, 소분류)에 연결합니다.
+        기사 키는 같은 기사를 알아보는 값(정규화한 원문 주소 등)이며, 같은 키의 기사는 새 내용으로 갱신됩니다.
+        """
+        now = time.time()
+        inserted = updated = 0
+        with self._lock, self._conn:  # 오류가 나면 이 피드의 저장 내용 전체를 되돌림
+            for key, article in articles:
+                row = self._conn.execute("SELECT id FROM articles WHERE article_key = ?", (key,)).fetchone()
+                values = (article['link'], article['source'], article['date'], article.get('image_url'),
+                          article.get('reliability'), json.dumps(article['titles'], ensure_ascii=False),
+                          json.dumps(article['summaries'], ensure_ascii=False),
+                          json.dumps(article.get('related', []), ensure_ascii=False), now)
+                if row is None:
+                    article_id = self._conn.execute(
+                        "INSERT INTO articles (link, source, date, image_url, reliability, titles, summaries, related, "
+                        "updated_at, article_key, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (*values, key, now),
+                    ).lastrowid
+                    inserted += 1
+                else:
+                    article_id = row[0]
+                    self._conn.execute(
+                        "UPDATE articles SET link = ?, source = ?, date = ?, image_url = ?, reliability = ?, titles = ?, "
+                        "summaries = ?, related = ?, updated_at = ? WHERE id = ?",
+                        (*values, article_id),
+                    )
+                    self._conn.execute("UPDATE article_categories SET date = ? WHERE article_id = ?", (article['date'], article_id))
+                    updated += 1
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO article_categories (main_category, sub_category, article_id, date) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(main_category, sub_category, article_id, article['date']) for main_category, sub_category in categories],
+                )
+            self.stats['inserted'] += inserted
+            self.stats['updated'] += updated
+
+    def list(self, main_category, sub_category, since=None, limit=100):
+        """카테고리의 기사를 발행 시간 최신순으로 최대 limit개 반환합니다. since('%Y-%m-%d %H:%M:%S')보다 오래된 기사는 뺍니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT a.link, a.source, a.date, a.image_url, a.reliability, a.titles, a.summaries, a.related "
+                "FROM article_categories AS c JOIN articles AS a ON a.id = c.article_id "
+                "WHERE c.main_category = ? AND c.sub_category = ? AND c.date >= ? "
+                "ORDER BY c.date DESC LIMIT ?",
+                (main_category, sub_category, since or '', limit),
+            ).fetchall()
+        return [{'link': link, 'source': source, 'date': date, 'image_url': image_url, 'reliability': reliability,
+                 'titles': json.loads(titles), 'summaries': json.loads(summaries), 'related': json.loads(related)}
+                for link, source, date, image_url, reliability, titles, summaries, related in rows]
+
+    def export(self, updated_since=None):
+        """
+        모든 기사를 발행 시간 최신순으로 반환합니다. 각 기사에는 id, updated_at(마지막 저장 시각)과
+        categories([[대분류, 소분류], ...])가 더해집니다. updated_since를 주면 그 시각보다 나중에 저장된 기사만 반환합니다.
+        """
+        with self._lock:
+            categories = {}
+            for article_id, main_category, sub_category in self._conn.execute(
+                    "SELECT c.article_id, c.main_category, c.sub_category FROM article_categories AS c "
+                    "JOIN articles AS a ON a.id = c.article_id WHERE a.updated_at > ? "
+                    "ORDER BY c.main_category, c.sub_category", (updated_since or 0,)):
+                categories.setdefault(article_id, []).append([main_category, sub_category])
+            rows = self._conn.execute(
+                "SELECT id, link, source, date, image_url, reliability, titles, summaries, related, updated_at "
+                "FROM articles WHERE updated_at > ? ORDER BY date DESC, id DESC", (updated_since or 0,)
+            ).fetchall()
+        return [{'id': article_id, 'link': link, 'source': source, 'date': date, 'image_url': image_url,
+                 'reliability': reliability, 'titles': json.loads(titles), 'summaries': json.loads(summaries),
+                 'related': json.loads(related), 'categories': categories.get(article_id, []), 'updated_at': updated_at}
+                for article_id, link, source, date, image_url, reliability, titles, summaries, related, updated_at in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,170 @@
+# ================================
+# 헤드리스 브라우저 풀
+# ================================
+# 기사마다 크롬을 새로 띄우고 종료하면 브라우저 기동 시간이 대부분을 차지하므로,
+# 미리 띄워 둔 브라우저 세션을 빌려 쓰고(checkout) 돌려주는(checkin) 방식으로 재사용한다.
+import queue  # 쉬고 있는 브라우저를 보관하기 위한 스레드 안전 큐
+import threading  # 여러 작업자가 동시에 풀을 사용할 때 생성 개수를 보호하기 위한 잠금
+import time  # 브라우저 생성 시각 및 대기 시간 계산
+from contextlib import contextmanager  # with 문으로 빌리고 돌려주기 위한 도구
+
+# 브라우저를 버려 자리가 비었을 때 반납을 기다리던 작업자를 깨우는 표시 (받은 작업자는 새 브라우저를 띄움)
+_WAKE = None
+
+
+class PooledBrowser:
+    """풀에서 관리하는 브라우저 하나와 그 사용 기록을 담는 객체입니다."""
+
+    def __init__(self, driver):
+        self.driver = driver  # 실제 셀레니움 드라이버
+        self.pages_served = 0  # 이 브라우저로 처리한 페이지 수 (재생성 판단 기준)
+        self.created_at = time.time()  # 브라우저를 띄운 시각
+
+
+class BrowserPool:
+    """
+    미리 띄워 둔 브라우저 세션을 재사용하는 풀입니다.
+    - size: 동시에 유지할 최대 브라우저 수
+    - max_pages: 이 횟수만큼 페이지를 처리한 브라우저는 종료 후 새로 띄움 (메모리 누수 방지)
+    - checkout_timeout: 모든 브라우저가 사용 중일 때 기다릴 최대 시간(초)
+    """
+
+    def __init__(self, driver_factory, size=2, max_pages=50, checkout_timeout=60):
+        if size < 1:
+            raise ValueError("브라우저 풀 크기는 1 이상이어야 합니다.")
+        self.driver_factory = driver_factory  # 새 드라이버를 만드는 함수
+        self.size = size
+        self.max_pages = max_pages
+        self.checkout_timeout = checkout_timeout
+        self._idle = queue.LifoQueue()  # 최근에 쓴(가장 따뜻한) 브라우저부터 꺼내 쓰도록 LIFO 사용
+        self._lock = threading.Lock()
+        self._created = 0  # 현재 살아 있는 브라우저 수
+        self._closed = False
+        self.stats = {'started': 0, 'recycled': 0, 'unhealthy': 0, 'checkouts': 0}
+
+    # --- 내부 도우미 ---
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _start_browser(self):
+        browser = PooledBrowser(self.driver_factory())
+        self._count('started')
+        return browser
+
+    def _discard(self, browser):
+        try:
+            browser.driver.quit()  # 이미 죽은 브라우저라도 프로세스 정리를 시도
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+        self._idle.put(_WAKE)  # 반납을 기다리던 작업자가 있으면 깨워서 빈 자리에 새 브라우저를 띄우게 함
+
+    @staticmethod
+    def _is_healthy(browser):
+        # 현재 URL과 창 목록을 조회해 보고, 응답이 없으면 죽은 세션으로 판단
+        try:
+            browser.driver.current_url
+            return bool(browser.driver.window_handles)
+        except Exception:
+            return False
+
+    # --- 공개 API ---
+    def warm_up(self, count=None):
+        """브라우저를 미리 띄워 첫 기사부터 기동 비용이 들지 않도록 합니다."""
+        count = self.size if count is None else min(count, self.size)
+        while True:
+            with self._lock:
+                if self._closed or self._created >= count:
+                    return
+                self._created += 1
+            try:
+                self._idle.put(self._start_browser())
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+    def checkout(self, timeout=None):
+        """쉬고 있는 브라우저를 빌립니다. 없으면 새로 띄우거나 반납될 때까지 기다립니다."""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._closed:
+                raise RuntimeError("이미 종료된 브라우저 풀입니다.")
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                browser = None
+                with self._lock:
+                    can_start = self._created < self.size
+                    if can_start:
+                        self._created += 1
+                if can_start:
+                    try:
+                        browser = self._start_browser()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("사용 가능한 브라우저를 기다리다 시간이 초과되었습니다.")
+                    try:
+                        browser = self._idle.get(timeout=remaining)
+                    except queue.Empty:
+                        continue
+            if browser is _WAKE:  # 다른 브라우저가 버려져 자리가 생김 (다시 확인하면 새로 띄울 수 있음)
+                continue
+            if not self._is_healthy(browser):  # 쉬는 동안 죽은 브라우저는 버리고 다시 시도
+                self._count('unhealthy')
+                self._discard(browser)
+                continue
+            self._count('checkouts')
+            return browser
+
+    def checkin(self, browser, healthy=True):
+        """빌린 브라우저를 반납합니다. 고장났거나 수명이 다한 브라우저는 종료합니다."""
+        browser.pages_served += 1
+        if self._closed or not healthy:
+            if not healthy:
+                self._count('unhealthy')
+            self._discard(browser)
+            return
+        if self.max_pages and browser.pages_served >= self.max_pages:
+            self._count('recycled')
+            self._discard(browser)  # 다음 checkout 때 새 브라우저가 자리를 채움
+            return
+        try:
+            browser.driver.get("about:blank")  # 이전 기사 페이지의 스크립트/메모리를 비움
+        except Exception:
+            self._count('unhealthy')
+            self._discard(browser)
+            return
+        self._idle.put(browser)
+
+    @contextmanager
+    def session(self, timeout=None):
+        """with 문으로 드라이버를 빌려 쓰고, 블록이 끝나면 자동으로 반납합니다."""
+        browser = self.checkout(timeout)
+        healthy = True
+        try:
+            yield browser.driver
+        except BaseException:
+            healthy = self._is_healthy(browser)  # 예외가 밖으로 나가면 세션 상태를 다시 확인
+            raise
+        finally:
+            self.checkin(browser, healthy=healthy)
+
+    def close(self):
+        """풀에 남아 있는 모든 브라우저를 종료합니다."""
+        self._closed = True
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if browser is not _WAKE:
+                self._discard(browser)
@@ -0,0 +1,209 @@
+# ================================
+# 카테고리 사이의 중복 기사 색인 (실행 중 색인 + 디스크 색인)
+# ================================
+# 같은 기사가 여러 소분류 검색 결과에 함께 나오는 경우가 많다. ('여행/레저'와 '국내 여행', '글로벌'과 '세계' 등)
+# 기사마다 몇 가지 키(구글 뉴스 링크, 언론사+제목 지문, 정규화한 원문 주소)를 만들어 두고,
+# 같은 키를 가진 기사가 이미 처리 중이면 그 결과를 기다렸다가 함께 쓰고, 이미 처리됐으면 결과를 바로 쓴다.
+# 처리가 끝난 결과는 디스크에도 저장하여, 다음 실행에서 다른 피드에 같은 기사가 나와도 다시 처리하지 않는다.
+# 실행 중 색인은 파이프라인의 이벤트 루프에서만 사용한다. (GroupCollector와 같음)
+import hashlib  # 제목 지문 계산
+import json  # 처리 결과 저장
+import os  # 저장 폴더 생성
+import re  # 제목 정규화
+import sqlite3  # 파일 기반 데이터베이스
+import threading  # 디스크 색인을 여러 스레드에서 사용할 때의 잠금
+import time  # 저장 시각 기록
+import unicodedata  # 전각/반각 문자 통일
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode  # 원문 주소 정규화
+
+# 기사 내용과 관계없는 추적용 주소 매개변수 (정규화할 때 뺌)
+TRACKING_PARAMS = frozenset(('fbclid', 'gclid', 'ocid', 'cmpid', 'ref', 'referer', 'from', 'sns', 'sc', 'input', 'rss'))
+_NON_WORD = re.compile(r"[\W_]+")
+
+LEAD, WAIT, DONE = 'lead', 'wait', 'done'  # claim()의 결과: 직접 처리, 다른 기사의 결과를 기다림, 결과가 이미 있음
+
+
+def canonical_url(url):
+    """
+    원문 주소를 비교용으로 정규화합니다.
+    http/https, www./m. 접두어, 추적용 매개변수, 매개변수 순서, 끝의 '/', #fragment 차이는 같은 주소로 봅니다.
+    """
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or '').lower()
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    query = sorted((key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+                   if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS)
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse(('', host, path, '', urlencode(query), ''))
+
+
+def title_fingerprint(title, source):
+    """언론사 이름과 제목으로 지문을 만듭니다. 구글 뉴스가 붙이는 ' - 언론사' 꼬리, 공백, 문장 부호, 대소문자 차이는 무시합니다."""
+    title = title.strip()
+    if source and title.endswith(f" - {source}"):
+        title = title[:-len(source) - 3]
+    normalized = _NON_WORD.sub("", unicodedata.normalize('NFKC', title).lower())
+    return hashlib.sha1(f"{source}\x1f{normalized}".encode('utf-8')).hexdigest()
+
+
+class DedupIndex:
+    """
+    중복 기사의 처리 결과를 공유하기 위한 색인입니다.
+    - path: 처리 결과를 실행 간에 보관할 SQLite 파일 경로
+    - max_age_days: 이 기간이 지난 디스크 기록은 사용하지 않고 정리
+    - stages: 파이프라인에서 기사마다 실행되는 단계 이름 (공유로 줄인 호출 수를 단계별로 셈)
+    - stats: unique(직접 처리한 기사 수), shared_in_run(이번 실행의 다른 기사 결과를 쓴 수),
+      shared_from_store(이전 실행의 결과를 쓴 수), avoided(단계별로 하지 않아도 된 호출 수)
+    """
+
+    def __init__(self, path, max_age_days=7, stages=('resolve', 'scrape', 'evaluate', 'translate')):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.max_age = max_age_days * 24 * 3600
+        self.stages = list(stages)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS processed_articles (
+                   key TEXT PRIMARY KEY,
+                   article TEXT NOT NULL,
+                   updated_at REAL NOT NULL
+               )"""
+        )
+        self._conn.execute("DELETE FROM processed_articles WHERE updated_at < ?", (time.time() - self.max_age,))
+        self._conn.commit()
+        self.start_run()
+        self.stats = {'unique': 0, 'shared_in_run': 0, 'shared_from_store': 0,
+                      'avoided': {stage: 0 for stage in self.stages}}
+
+    def start_run(self):
+        """실행 중 색인을 비웁니다. 한 프로세스에서 파이프라인을 여러 번 실행할 때 실행마다 호출합니다."""
+        # 키 → 처리를 맡은 기사 번호, 기사 번호 → {'keys', 'followers'}, 키 → 처리 결과
+        self._owners = {}
+        self._leaders = {}
+        self._results = {}
+        self._next_id = 0
+
+    def _avoid(self, stage, amount=1):
+        # stage 단계부터 나머지 단계를 모두 건너뛰게 됨
+        for name in self.stages[self.stages.index(stage):]:
+            self.stats['avoided'][name] += amount
+
+    def _shared(self, leader_id, kind, stage):
+        if leader_id is not None:  # 직접 처리하던 기사였다면 중간부터 공유로 바뀜
+            self.stats['unique'] -= 1
+        self.stats[kind] += 1
+        self._avoid(stage)
+
+    def _stored(self, keys):
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT article FROM processed_articles WHERE key = ? AND updated_at >= ?",
+                    (key, time.time() - self.max_age),
+                ).fetchone()
+                if row:
+                    return json.loads(row[0])
+        return None
+
+    def claim(self, item, keys, stage, persist=True):
+        """
+        기사(item)를 키들로 색인에 등록하고, stage 단계부터 직접 처리할지 결정합니다.
+        - (LEAD, None): 처음 보는 기사이므로 직접 처리
+        - (WAIT, None): 같은 기사를 다른 항목이 처리 중이므로, 그 결과가 나오면 finish()가 함께 돌려줌
+        - (DONE, 결과): 이번 실행이나 이전 실행에서 이미 처리한 기사 (finish()와 store()로 결과를 기록해야 함)
+        이미 처리를 맡고 있던 기사가 새 키로 다른 기사와 겹치면, 기다리던 기사들까지 그쪽으로 옮깁니다.
+        persist=False인 키는 이번 실행 안에서만 비교하고 디스크 색인에는 찾거나 저장하지 않습니다.
+        (내용이 바뀌어도 그대로인 키(원문 주소 등)가 예전 결과를 가리키지 않도록 할 때 사용)
+        """
+        keys = [key for key in keys if key]
+        item['dedup_keys'] = [*item.get('dedup_keys', ()), *keys]
+        if not persist:
+            item['dedup_run_keys'] = [*item.get('dedup_run_keys', ()), *keys]
+        leader_id = item.get('dedup_id')
+        for key in keys:
+            if key in self._results:
+                self._shared(leader_id, 'shared_in_run', stage)
+                return DONE, self._results[key]
+        other = next((self._owners[key] for key in keys if key in self._owners and self._owners[key] != leader_id), None)
+        if other is not None:  # 같은 기사를 다른 항목이 처리 중
+            followers = self._leaders[other]['followers']
+            item['dedup_stage'] = stage  # 실패하면 셈을 되돌리기 위해 기록
+            followers.append(item)
+            if leader_id is not None:  # 이 기사를 기다리던 항목들과 키도 함께 옮김
+                moved = self._leaders.pop(leader_id)
+                followers.extend(moved['followers'])
+                for key in moved['keys']:
+                    self._owners[key] = other
+                self._leaders[other]['keys'] |= moved['keys']
+            for key in keys:
+                self._owners[key] = other
+            self._leaders[other]['keys'].update(keys)
+            self._shared(leader_id, 'shared_in_run', stage)
+            return WAIT, None
+        stored = self._stored(keys) if persist else None
+        if stored is not None:
+            self._shared(leader_id, 'shared_from_store', stage)
+            return DONE, stored
+        if leader_id is None:
+            leader_id = item['dedup_id'] = self._next_id
+            self._next_id += 1
+            self._leaders[leader_id] = {'keys': set(), 'followers': []}
+            self.stats['unique'] += 1
+        for key in keys:
+            self._owners[key] = leader_id
+        self._leaders[leader_id]['keys'].update(keys)
+        return LEAD, None
+
+    def finish(self, item, result):
+        """
+        기사의 처리 결과를 실행 중 색인에 기록하고, (이 결과를 기다리던 항목들, 디스크에 저장할 키 목록)을 반환합니다.
+        디스크 저장은 SQLite 쓰기이므로 이벤트 루프를 막지 않도록 store()를 스레드에서 따로 호출합니다.
+        """
+        keys = set(item.get('dedup_keys', ()))
+        leader = self._leaders.pop(item.get('dedup_id'), None)
+        followers = []
+        if leader is not None:
+            keys |= leader['keys']
+            followers = leader['followers']
+            for key in leader['keys']:
+                self._owners.pop(key, None)
+        run_keys = set(item.get('dedup_run_keys', ()))
+        for follower in followers:
+            keys.update(follower.get('dedup_keys', ()))
+            run_keys.update(follower.get('dedup_run_keys', ()))
+        for key in keys:
+            self._results[key] = result
+        return followers, sorted(keys - run_keys)
+
+    def store(self, keys, result):
+        """finish()가 반환한 키들로 처리 결과를 디스크 색인에 저장합니다. (다음 실행에서 같은 기사를 찾을 때 사용)"""
+        if not keys:
+            return
+        now = time.time()
+        data = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO processed_articles (key, article, updated_at) VALUES (?, ?, ?)",
+                [(key, data, now) for key in keys],
+            )
+            self._conn.commit()
+
+    def fail(self, item):
+        """처리에 실패한 기사를 색인에서 빼고, 이 기사를 기다리던 항목들을 반환합니다. (다음 실행에서 다시 처리됨)"""
+        leader = self._leaders.pop(item.get('dedup_id'), None)
+        if leader is None:
+            return []
+        for key in leader['keys']:
+            self._owners.pop(key, None)
+        for follower in leader['followers']:  # 결과를 공유받지 못했으므로 셈에서 뺌
+            self.stats['shared_in_run'] -= 1
+            self._avoid(follower['dedup_stage'], -1)
+        return leader['followers']
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
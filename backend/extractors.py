@@ -0,0 +1,284 @@
+# ================================
+# 기사 본문/대표 이미지 추출 백엔드 (BeautifulSoup, lxml, selectolax)
+# ================================
+# 기사 페이지는 수 MB에 이르는 경우가 많아, 순수 파이썬 파서(html.parser)로 전체를 분석하는 데
+# CPU 시간이 많이 든다. 같은 추출 규칙을 C 기반 파서(lxml, selectolax)로도 실행할 수 있게 하고,
+# 설치된 것 중 가장 빠른 백엔드를 골라 쓴다. 모든 백엔드는 같은 규칙으로 같은 결과를 낸다.
+# - 본문 컨테이너: 첫 <article>, 없으면 BODY_SELECTORS를 순서대로 확인
+# - 문단: 컨테이너 안의 모든 <p> (없으면 모든 <div>), 각 문단의 텍스트 조각을 앞뒤 공백 없이 이어 붙임
+# - 대표 이미지: property가 'og:image'인 첫 <meta>의 content
+# 언론사별 규칙(publisher_rules)은 walk()가 돌려주는 시작/텍스트/끝 이벤트를 한 번 훑어서 적용한다.
+from bs4 import BeautifulSoup, NavigableString, Tag  # 기본(순수 파이썬) 백엔드
+
+try:
+    import lxml.html  # C 기반 파서 (libxml2)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # C 기반 파서 (lexbor), 가장 빠름
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# <article> 태그가 없을 때 본문 컨테이너로 확인할 선택자 (언론사에서 흔히 쓰는 id/class)
+BODY_SELECTORS = ['#articleBodyContents', '#article_body', '.article_body', '#dic_area']
+# 텍스트에 포함하지 않는 태그 (BeautifulSoup의 get_text와 같은 기준)
+SKIPPED_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+# walk()가 돌려주는 이벤트 종류: (START, 태그, 속성), (TEXT, 텍스트, None), (END, 태그, None)
+START, TEXT, END = 'start', 'text', 'end'
+
+
+def join_text(parts):
+    """텍스트 조각들의 앞뒤 공백을 없애고 빈 조각을 뺀 뒤 이어 붙입니다. (get_text(strip=True)와 같음)"""
+    return "".join(part.strip() for part in parts if part.strip())
+
+
+class Extractor:
+    """
+    추출 백엔드의 공통 흐름입니다. 하위 클래스는 문서 파싱과 태그 탐색 방법만 구현합니다.
+    - body_text(html): 본문 텍스트 (컨테이너를 찾지 못하면 None)
+    - og_image(html): 대표 이미지 주소 (없으면 None)
+    - extract(html): 한 번만 파싱하여 (본문 텍스트, 대표 이미지 주소)를 함께 반환
+    - walk(document): 문서 전체를 순서대로 훑는 이벤트 (주석과 SKIPPED_TAGS 안쪽은 제외, 속성 값은 문자열)
+    """
+    name = None
+
+    def parse(self, html):
+        raise NotImplementedError
+
+    def first_tag(self, document, tag):
+        raise NotImplementedError
+
+    def select_first(self, document, selector):
+        raise NotImplementedError
+
+    def descendants(self, node, tag):
+        raise NotImplementedError
+
+    def text(self, node):
+        raise NotImplementedError
+
+    def og_image_of(self, document):
+        raise NotImplementedError
+
+    def walk(self, document):
+        raise NotImplementedError
+
+    def body_text_of(self, document):
+        container = self.first_tag(document, 'article')
+        if container is None:
+            for selector in BODY_SELECTORS:
+                container = self.select_first(document, selector)
+                if container is not None:
+                    break
+        if container is None:
+            return None
+        paragraphs = self.descendants(container, 'p') or self.descendants(container, 'div')
+        return "\n".join(text for text in (self.text(p) for p in paragraphs) if text)
+
+    def body_text(self, html):
+        document = self.parse(html)
+        return None if document is None else self.body_text_of(document)
+
+    def og_image(self, html):
+        document = self.parse(html)
+        return None if document is None else self.og_image_of(document)
+
+    def extract(self, html):
+        document = self.parse(html)
+        if document is None:
+            return None, None
+        return self.body_text_of(document), self.og_image_of(document)
+
+
+class BeautifulSoupExtractor(Extractor):
+    """기존 방식 그대로 BeautifulSoup(html.parser)를 사용하는 백엔드입니다."""
+    name = 'bs4'
+
+    def parse(self, html):
+        return BeautifulSoup(html, 'html.parser')
+
+    def first_tag(self, document, tag):
+        return document.find(tag)
+
+    def select_first(self, document, selector):
+        return document.select_one(selector)
+
+    def descendants(self, node, tag):
+        return node.find_all(tag)
+
+    def text(self, node):
+        return node.get_text(strip=True)
+
+    def og_image_of(self, document):
+        image_tag = document.find('meta', property='og:image')
+        return image_tag['content'] if image_tag and image_tag.get('content') else None
+
+    def walk(self, document):
+        stack = list(reversed(document.contents))
+        while stack:
+            current = stack.pop()
+            if isinstance(current, tuple):
+                yield END, current[0], None
+            elif type(current) is NavigableString:  # 주석, 스크립트 등 특수 문자열은 제외
+                yield TEXT, str(current), None
+            elif isinstance(current, Tag) and current.name not in SKIPPED_TAGS:
+                # class처럼 여러 값을 갖는 속성은 공백으로 이어 붙인 문자열로 바꿈
+                attrs = {key: " ".join(value) if isinstance(value, list) else value for key, value in current.attrs.items()}
+                yield START, current.name, attrs
+                stack.append((current.name,))
+                stack.extend(reversed(current.contents))
+
+
+class LxmlExtractor(Extractor):
+    """lxml(libxml2)을 사용하는 백엔드입니다. CSS 선택자 대신 같은 뜻의 XPath를 사용합니다."""
+    name = 'lxml'
+    _XPATHS = {
+        '#articleBodyContents': '//*[@id="articleBodyContents"]',
+        '#article_body': '//*[@id="article_body"]',
+        '.article_body': '//*[contains(concat(" ", normalize-space(@class), " "), " article_body ")]',
+        '#dic_area': '//*[@id="dic_area"]',
+    }
+
+    def parse(self, html):
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:  # <?xml encoding=...?> 선언이 있는 문자열은 바이트로 바꾸어 다시 파싱
+            return lxml.html.document_fromstring(html.encode('utf-8'))
+        except lxml.etree.ParserError:  # 빈 문서
+            return None
+
+    def first_tag(self, document, tag):
+        return next(document.iter(tag), None)
+
+    def select_first(self, document, selector):
+        found = document.xpath(self._XPATHS[selector])
+        return found[0] if found else None
+
+    def descendants(self, node, tag):
+        return list(node.iterdescendants(tag))
+
+    def text(self, node):
+        # 텍스트와 자식 태그 뒤의 텍스트(tail)를 문서 순서대로 모음 (주석과 SKIPPED_TAGS 안쪽은 제외)
+        parts, stack = [], [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, str):
+                parts.append(current)
+                continue
+            if not isinstance(current.tag, str) or current.tag in SKIPPED_TAGS:
+                continue
+            if current.text:
+                parts.append(current.text)
+            for child in reversed(current):
+                if child.tail:
+                    stack.append(child.tail)
+                stack.append(child)
+        return join_text(parts)
+
+    def og_image_of(self, document):
+        found = document.xpath('//meta[@property="og:image"]')
+        return (found[0].get('content') or None) if found else None
+
+    def walk(self, document):
+        stack = [document]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, str):
+                yield TEXT, current, None
+                continue
+            if isinstance(current, tuple):
+                yield END, current[0], None
+                continue
+            if not isinstance(current.tag, str) or current.tag in SKIPPED_TAGS:
+                continue
+            yield START, current.tag, current.attrib
+            if current.text:
+                yield TEXT, current.text, None
+            stack.append((current.tag,))
+            for child in reversed(current):
+                if child.tail:
+                    stack.append(child.tail)
+                stack.append(child)
+
+
+class SelectolaxExtractor(Extractor):
+    """selectolax(lexbor)를 사용하는 백엔드입니다."""
+    name = 'selectolax'
+
+    def parse(self, html):
+        return LexborHTMLParser(html)
+
+    @staticmethod
+    def _children(node):
+        child = node.child
+        while child is not None:
+            yield child
+            child = child.next
+
+    def _walk(self, node):
+        # node 아래의 모든 노드를 문서 순서대로 돌려줌 (node 자신은 제외)
+        stack = list(reversed(list(self._children(node))))
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(reversed(list(self._children(current))))
+
+    def first_tag(self, document, tag):
+        return document.css_first(tag)
+
+    def select_first(self, document, selector):
+        return document.css_first(selector)
+
+    def descendants(self, node, tag):
+        # css()는 node 자신도 포함하므로 자손만 직접 찾음
+        return [current for current in self._walk(node) if current.tag == tag]
+
+    def text(self, node):
+        parts, stack = [], [node]
+        while stack:
+            current = stack.pop()
+            if current.tag == '-text':
+                parts.append(current.text_content or '')
+                continue
+            if current.tag.startswith('-') or current.tag in SKIPPED_TAGS:  # 주석 등
+                continue
+            stack.extend(reversed(list(self._children(current))))
+        return join_text(parts)
+
+    def og_image_of(self, document):
+        image_tag = document.css_first('meta[property="og:image"]')
+        return (image_tag.attributes.get('content') or None) if image_tag else None
+
+    def walk(self, document):
+        stack = [document.root] if document.root is not None else []
+        while stack:
+            current = stack.pop()
+            if isinstance(current, tuple):
+                yield END, current[0], None
+                continue
+            if current.tag == '-text':
+                yield TEXT, current.text_content or '', None
+                continue
+            if current.tag.startswith('-') or current.tag in SKIPPED_TAGS:
+                continue
+            yield START, current.tag, {key: value or '' for key, value in current.attributes.items()}
+            stack.append((current.tag,))
+            stack.extend(reversed(list(self._children(current))))
+
+
+EXTRACTORS = {'bs4': BeautifulSoupExtractor, 'lxml': LxmlExtractor, 'selectolax': SelectolaxExtractor}
+_AVAILABLE = {'bs4': True, 'lxml': LXML_AVAILABLE, 'selectolax': SELECTOLAX_AVAILABLE}
+
+
+def get_extractor(name=None):
+    """이름으로 추출 백엔드를 만듭니다. None이면 설치된 것 중 가장 빠른 백엔드(selectolax → lxml → bs4)를 사용합니다."""
+    if name is None:
+        name = next(candidate for candidate in ('selectolax', 'lxml', 'bs4') if _AVAILABLE[candidate])
+    if name not in EXTRACTORS:
+        raise ValueError(f"알 수 없는 추출 백엔드입니다: {name}")
+    if not _AVAILABLE[name]:
+        raise ValueError(f"'{name}' 추출 백엔드가 설치되어 있지 않습니다.")
+    return EXTRACTORS[name]()
@@ -0,0 +1,129 @@
+# ================================
+# 여러 RSS 피드의 동시 수집과 분석 작업자 풀
+# ================================
+# 소분류 피드 수십 개를 하나씩 받지 않고, 파이프라인의 수집 단계가 정해진 수만큼 동시에 받는다.
+# 받은 피드는 네트워크 작업자와 따로 둔 분석 작업자 풀에서 기사 목록으로 바꾸므로,
+# 분석이 밀려도 다른 피드를 받는 일은 계속되고 피드 하나가 끝나는 즉시 다음 단계로 넘어간다.
+# feedparser는 순수 파이썬이라 피드 하나(기사 100개)에 수십 ms가 걸리고 그동안 GIL을 잡고 있으므로,
+# 구글 뉴스가 보내는 RSS 2.0 형식은 lxml(C, 분석 중 GIL을 놓음)로 직접 읽고, 그 밖의 형식만 feedparser로 분석한다.
+import asyncio  # 분석 작업자 풀의 결과를 기다리기 위한 비동기 도구
+import threading  # 여러 작업자가 동시에 통계를 갱신할 때 사용하는 잠금
+import time  # 발행 시각 변환과 처리 시간 측정
+from concurrent.futures import ThreadPoolExecutor  # 피드 분석 작업자 풀
+from email.utils import parsedate_tz, mktime_tz  # RSS의 발행 시각(RFC 822) 해석
+
+import feedparser  # RSS 2.0이 아니거나 lxml이 없을 때 사용하는 범용 피드 분석기
+
+try:
+    from lxml import etree  # 빠른 RSS 분석
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from pipeline import to_thread  # 네트워크 요청을 기다리는 스레드 (파이프라인 안이면 파이프라인의 스레드 풀)
+
+
+def _published_parsed(published):
+    # feedparser와 같이 발행 시각을 UTC 기준 time.struct_time으로 바꿈 (해석할 수 없으면 None)
+    parsed = parsedate_tz(published) if published else None
+    if parsed is None:
+        return None
+    try:
+        return time.gmtime(mktime_tz(parsed))
+    except (OverflowError, ValueError):
+        return None
+
+
+def _parse_rss(content):
+    # RSS 2.0 문서의 <item>들을 읽음, 다른 형식이거나 읽을 수 없으면 None
+    parser = etree.XMLParser(recover=True, resolve_entities=False, no_network=True, huge_tree=True)
+    try:
+        root = etree.fromstring(content, parser)
+    except etree.XMLSyntaxError:
+        return None
+    if root is None or root.tag != 'rss':
+        return None
+    entries = []
+    for item in root.iterfind('channel/item'):
+        source = item.find('source')
+        published = (item.findtext('pubDate') or '').strip() or None
+        entries.append({
+            'id': (item.findtext('guid') or '').strip() or None,
+            'title': (item.findtext('title') or '').strip(),
+            'link': (item.findtext('link') or '').strip(),
+            'source': (source.text or '').strip() if source is not None else None,
+            'published': published,
+            'published_parsed': _published_parsed(published),
+        })
+    return entries
+
+
+def _parse_generic(content):
+    entries = []
+    for entry in feedparser.parse(content).entries:
+        source = entry.get('source')
+        entries.append({
+            'id': entry.get('id'),
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'source': source.get('title') if source else None,
+            'published': entry.get('published'),
+            'published_parsed': entry.get('published_parsed'),
+        })
+    return entries
+
+
+def parse_feed(content):
+    """
+    피드 본문(바이트)을 기사 목록으로 바꿉니다. 각 기사는 다음 키를 가진 딕셔너리입니다.
+    id, title, link, source(언론사 이름), published(원래 문자열), published_parsed(UTC 기준 struct_time)
+    """
+    entries = _parse_rss(content) if LXML_AVAILABLE else None
+    return entries if entries is not None else _parse_generic(content)
+
+
+class FeedFetcher:
+    """
+    피드를 받아 오는 일과 분석하는 일을 나누어 처리하는 수집기입니다. (파이프라인 수집 단계에서 사용)
+    - session: get을 제공하는 HTTP 클라이언트 (공용 HttpClient)
+    - parse_workers: 피드 분석 작업자 수
+    - stats: fetched(받은 피드 수), not_modified(304 응답 수), entries(분석한 기사 수),
+      fetch_seconds(받는 데 걸린 시간 합계), parse_seconds(분석하는 데 걸린 시간 합계)
+    """
+
+    def __init__(self, session, parse_workers=4):
+        self.session = session
+        self._parse_pool = ThreadPoolExecutor(max_workers=parse_workers, thread_name_prefix='feed-parse')
+        self._lock = threading.Lock()
+        self.stats = {'fetched': 0, 'not_modified': 0, 'entries': 0, 'fetch_seconds': 0.0, 'parse_seconds': 0.0}
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _parse(self, content):
+        started = time.perf_counter()
+        entries = parse_feed(content)
+        self._count('parse_seconds', time.perf_counter() - started)
+        self._count('entries', len(entries))
+        return entries
+
+    async def fetch(self, url, headers=None):
+        """
+        피드를 받아 분석하고 (응답, 기사 목록)을 반환합니다. 304 응답이면 기사 목록은 None입니다.
+        요청이 실패하면 예외가 그대로 전달됩니다.
+        """
+        started = time.perf_counter()
+        response = await to_thread(self.session.get, url, headers=headers)
+        self._count('fetch_seconds', time.perf_counter() - started)
+        if response.status_code == 304:
+            self._count('not_modified')
+            return response, None
+        response.raise_for_status()
+        self._count('fetched')
+        loop = asyncio.get_running_loop()
+        entries = await loop.run_in_executor(self._parse_pool, self._parse, response.content)
+        return response, entries
+
+    def close(self):
+        self._parse_pool.shutdown(wait=False)
@@ -0,0 +1,133 @@
+# ================================
+# RSS 피드 조건부 요청 정보와 기사 변경 내역 저장소 (SQLite)
+# ================================
+# 매시간 실행될 때마다 모든 소분류 피드를 처음부터 다시 처리하지 않도록 한다.
+# - 피드 주소별로 ETag/Last-Modified를 저장해 두고 조건부 요청(If-None-Match, If-Modified-Since)을 보낸다.
+#   (304 Not Modified면 피드를 다시 분석하지 않음)
+# - 피드의 기사를 이전에 본 기사와 비교(키: entry id 또는 링크)하여 새 기사와 내용이 바뀐 기사만 처리한다.
+# - 처리가 끝난 기사는 결과를 함께 기록해 두어, 처리를 끝내지 못한 기사와 구분한다. (페이지는 기사 저장소에서 만듦)
+# 조건부 요청 정보는 피드의 모든 기사가 처리된 뒤에만 저장하므로, 중간에 실패해도 다음 실행에서 다시 시도한다.
+import hashlib  # 기사 내용 지문(fingerprint) 계산
+import json  # 처리 결과 저장
+import os  # 저장 폴더 생성
+import sqlite3  # 파일 기반 데이터베이스
+import threading  # 여러 작업자가 동시에 접근할 때 사용하는 잠금
+import time  # 저장 시각 기록
+
+
+def entry_fingerprint(*fields):
+    """기사의 제목, 링크, 발행 시각 등으로 내용 지문을 만듭니다. 값이 하나라도 바뀌면 지문도 바뀝니다."""
+    return hashlib.sha256("\x1f".join(str(field or '') for field in fields).encode('utf-8')).hexdigest()
+
+
+class FeedStore:
+    """
+    피드별 조건부 요청 정보(ETag, Last-Modified)와 기사별 지문/처리 결과를 저장합니다.
+    - max_age_days: 이 기간 동안 갱신되지 않은 기사 기록은 삭제
+    """
+
+    def __init__(self, path, max_age_days=30):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.max_age = max_age_days * 24 * 3600
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS feeds (
+                   url TEXT PRIMARY KEY,
+                   etag TEXT,
+                   last_modified TEXT,
+                   updated_at REAL NOT NULL
+               )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS feed_entries (
+                   feed_url TEXT NOT NULL,
+                   entry_key TEXT NOT NULL,
+                   fingerprint TEXT NOT NULL,
+                   article TEXT,
+                   updated_at REAL NOT NULL,
+                   PRIMARY KEY (feed_url, entry_key)
+               )"""
+        )
+        self._conn.commit()
+        self.stats = {'not_modified': 0, 'new': 0, 'changed': 0, 'unchanged': 0}
+
+    def validators(self, url):
+        """저장된 (ETag, Last-Modified)를 반환합니다. 없으면 (None, None)입니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT etag, last_modified FROM feeds WHERE url = ?", (url,)).fetchone()
+        return row if row else (None, None)
+
+    def conditional_headers(self, url):
+        """조건부 요청에 사용할 헤더를 만듭니다."""
+        etag, last_modified = self.validators(url)
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def save_validators(self, url, etag, last_modified):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feeds (url, etag, last_modified, updated_at) VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, time.time()),
+            )
+            self._conn.commit()
+
+    def record_not_modified(self):
+        with self._lock:
+            self.stats['not_modified'] += 1
+
+    def diff(self, url, entries):
+        """
+        (기사 키, 지문) 목록을 이전 기록과 비교하여 다시 처리해야 하는 기사 키의 집합을 반환합니다.
+        처음 보는 기사, 지문이 바뀐 기사, 이전에 처리를 끝내지 못한 기사가 해당됩니다.
+        """
+        with self._lock:
+            known = {}
+            keys = [key for key, _ in entries]
+            for start in range(0, len(keys), 500):  # SQLite 변수 개수 제한을 넘지 않도록 나누어 조회
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                known.update(
+                    (key, (fingerprint, has_article)) for key, fingerprint, has_article in self._conn.execute(
+                        f"SELECT entry_key, fingerprint, article IS NOT NULL FROM feed_entries "
+                        f"WHERE feed_url = ? AND entry_key IN ({placeholders})",
+                        [url, *chunk],
+                    )
+                )
+            pending = set()
+            for key, fingerprint in entries:
+                previous = known.get(key)
+                if previous is None:
+                    self.stats['new'] += 1
+                    pending.add(key)
+                elif previous[0] != fingerprint or not previous[1]:
+                    self.stats['changed'] += 1
+                    pending.add(key)
+                else:
+                    self.stats['unchanged'] += 1
+            return pending
+
+    def remember(self, url, results):
+        """
+        처리가 끝난 (기사 키, 지문, 결과) 목록을 한 번에 저장하고 오래된 기록을 정리합니다.
+        결과가 None인 기사는 처리를 끝내지 못한 기사로 기록되어 diff()가 다시 처리할 기사로 돌려줍니다.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO feed_entries (feed_url, entry_key, fingerprint, article, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(url, key, fingerprint, None if article is None else json.dumps(article, ensure_ascii=False), now)
+                 for key, fingerprint, article in results],
+            )
+            self._conn.execute("DELETE FROM feed_entries WHERE feed_url = ? AND updated_at < ?", (url, now - self.max_age))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
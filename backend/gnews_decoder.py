@@ -0,0 +1,148 @@
+# ================================
+# 구글 뉴스 RSS 링크 디코더 (브라우저 없이 원문 주소 찾기)
+# ================================
+# 구글 뉴스 RSS의 기사 링크(https://news.google.com/rss/articles/<ID>)에는 원문 주소가
+# base64로 인코딩되어 들어 있는 경우가 많다. 먼저 이 값을 직접 풀어 보고,
+# 새 형식(AU_yqL...)이라 풀 수 없으면 구글 뉴스의 batchexecute API에 HTTP로 물어본다.
+# 두 방법이 모두 실패했을 때만 호출한 쪽이 셀레니움 브라우저를 사용하면 된다.
+import base64  # 기사 ID에 담긴 base64 문자열을 풀기 위한 라이브러리
+import json  # batchexecute 요청/응답(JSON)을 다루기 위한 라이브러리
+import re  # 페이지에서 서명(signature)과 타임스탬프를 찾기 위한 정규 표현식
+import threading  # 여러 작업자가 동시에 통계를 갱신할 때 사용하는 잠금
+from urllib.parse import urlparse, quote  # URL 분석 및 인코딩
+
+import requests  # HTTP 요청을 보내기 위한 라이브러리
+
+GOOGLE_NEWS_HOST = "news.google.com"
+# 기사 ID가 들어 있는 경로 형식들: /rss/articles/<ID>, /articles/<ID>, /read/<ID>
+_ARTICLE_PATH = re.compile(r"^/(?:rss/)?(?:articles|read)/([A-Za-z0-9_\-]+)")
+_SIGNATURE = re.compile(r'data-n-a-sg="([^"]+)"')
+_TIMESTAMP = re.compile(r'data-n-a-ts="([^"]+)"')
+
+
+def extract_article_id(google_news_url):
+    """구글 뉴스 링크에서 기사 ID 부분만 꺼냅니다. 구글 뉴스 링크가 아니면 None을 반환합니다."""
+    parsed = urlparse(google_news_url)
+    if parsed.hostname != GOOGLE_NEWS_HOST:
+        return None
+    match = _ARTICLE_PATH.match(parsed.path)
+    return match.group(1) if match else None
+
+
+def decode_article_id(article_id):
+    """
+    기사 ID를 base64로 풀어 원문 주소를 꺼냅니다.
+    예전 형식은 원문 URL이 그대로 들어 있어 바로 반환하고,
+    새 형식(AU_yqL...)이거나 해석할 수 없으면 None을 반환합니다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return None
+    # 앞쪽의 protobuf 머리말(0x08 0x13 0x22)과 뒤쪽 꼬리말(0xd2 0x01 0x00)을 제거
+    if raw.startswith(b"\x08\x13\x22"):
+        raw = raw[3:]
+    if raw.endswith(b"\xd2\x01\x00"):
+        raw = raw[:-3]
+    if not raw:
+        return None
+    # 첫 부분은 문자열 길이를 나타내는 varint (128 이상이면 2바이트)
+    length, offset, shift = 0, 0, 0
+    while offset < len(raw):
+        byte = raw[offset]
+        length |= (byte & 0x7F) << shift
+        offset += 1
+        shift += 7
+        if not byte & 0x80:
+            break
+    candidate = raw[offset:offset + length].decode("utf-8", errors="ignore")
+    if candidate.startswith(("http://", "https://")):
+        return candidate
+    return None  # AU_yqL로 시작하는 새 형식은 HTTP 디코딩이 필요함
+
+
+class GoogleNewsDecoder:
+    """
+    구글 뉴스 링크를 브라우저 없이 원문 주소로 바꿔 주는 디코더입니다.
+    - stats['offline_hits']: base64 해석만으로 찾은 횟수
+    - stats['http_hits']: HTTP 요청(batchexecute 또는 리디렉션)으로 찾은 횟수
+    - stats['misses']: 찾지 못해 브라우저로 넘겨야 하는 횟수
+    """
+
+    def __init__(self, base_url=f"https://{GOOGLE_NEWS_HOST}", session=None, timeout=10):
+        self.base_url = base_url.rstrip("/")  # 테스트용 로컬 서버로 바꿔 끼울 수 있도록 설정 가능
+        self.session = session or requests.Session()  # requests.Session과 같은 get/post를 제공하는 객체
+        self.timeout = timeout
+        self.stats = {'offline_hits': 0, 'http_hits': 0, 'misses': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def hit_rate(self):
+        """전체 시도 중 브라우저 없이 해결한 비율을 반환합니다."""
+        total = sum(self.stats.values())
+        return (self.stats['offline_hits'] + self.stats['http_hits']) / total if total else 0.0
+
+    def _fetch_params(self, article_id):
+        # 기사 페이지에서 batchexecute 요청에 필요한 서명과 타임스탬프를 찾음
+        for path in (f"/articles/{article_id}", f"/rss/articles/{article_id}"):
+            response = self.session.get(f"{self.base_url}{path}", timeout=self.timeout, allow_redirects=False)
+            location = response.headers.get("Location", "")
+            if response.is_redirect and location and GOOGLE_NEWS_HOST not in location:
+                return {'url': location}  # 서버가 바로 원문으로 리디렉션해 준 경우
+            if response.status_code != 200:
+                continue
+            signature = _SIGNATURE.search(response.text)
+            timestamp = _TIMESTAMP.search(response.text)
+            if signature and timestamp:
+                return {'signature': signature.group(1), 'timestamp': timestamp.group(1)}
+        return None
+
+    def _batch_execute(self, article_id, signature, timestamp):
+        # 구글 뉴스 웹이 내부적으로 사용하는 'garturlreq' 요청을 그대로 재현
+        inner = (
+            '["garturlreq",[["X","X",["X","X"],null,null,1,1,"US:en",null,1,null,null,null,null,null,0,1],'
+            f'"X","X",1,[1,1,1],1,1,null,0,0,null,0],"{article_id}",{timestamp},"{signature}"]'
+        )
+        payload = [[["Fbv4je", inner, None, "generic"]]]
+        response = self.session.post(
+            f"{self.base_url}/_/DotsSplashUi/data/batchexecute",
+            headers={'Content-Type': 'application/x-www-form-urlencoded;charset=UTF-8'},
+            data=f"f.req={quote(json.dumps(payload))}",
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        # 응답 앞에 붙는 ")]}'" 보호 문자열 다음 블록이 실제 JSON
+        parts = response.text.split("\n\n")
+        body = json.loads(parts[1] if len(parts) > 1 else parts[0])
+        return json.loads(body[0][2])[1]
+
+    def decode(self, google_news_url):
+        """원문 주소를 찾으면 그 주소를, 찾지 못하면 None을 반환합니다."""
+        article_id = extract_article_id(google_news_url)
+        if article_id is None:
+            if urlparse(google_news_url).hostname not in (None, GOOGLE_NEWS_HOST):
+                self._count('offline_hits')  # 이미 원문 주소인 경우
+                return google_news_url
+            self._count('misses')
+            return None
+        original_url = decode_article_id(article_id)
+        if original_url:
+            self._count('offline_hits')
+            return original_url
+        try:
+            params = self._fetch_params(article_id)
+            if params and 'url' in params:
+                original_url = params['url']
+            elif params:
+                original_url = self._batch_execute(article_id, params['signature'], params['timestamp'])
+        except Exception as e:  # 네트워크 오류, 응답 형식 변경 등은 모두 브라우저로 넘김
+            print(f"  [알림] HTTP 디코딩 실패: {e}")
+            original_url = None
+        if original_url and original_url.startswith(("http://", "https://")) and GOOGLE_NEWS_HOST not in original_url:
+            self._count('http_hits')
+            return original_url
+        self._count('misses')
+        return None
@@ -0,0 +1,123 @@
+# ================================
+# 여러 기사를 한 번에 평가하는 GPT 묶음(batch) 요청
+# ================================
+# 기사마다 같은 긴 프롬프트와 시스템 메시지를 보내는 대신, K개의 기사를 하나의 요청에 담고
+# 기사 번호를 키로 하는 JSON으로 답하도록 요청한다. 응답을 해석할 수 없으면
+# 묶음을 반으로 나누어 다시 요청하고, 기사 1개가 남으면 기존 단일 평가 함수로 처리한다.
+import json  # 응답 JSON 해석
+import re  # 응답 앞뒤의 코드 블록 표시(```json) 제거
+import threading  # 여러 작업자가 동시에 통계를 갱신할 때 사용하는 잠금
+
+RELIABILITY_LEVELS = ("높음", "보통", "낮음")
+
+# 묶음 요청에서 프롬프트 뒤에 덧붙이는 응답 형식 안내문
+BATCH_FORMAT_INSTRUCTION = (
+    "아래에는 [기사 1], [기사 2] ... 형식으로 여러 기사가 들어 있습니다. "
+    "각 기사를 서로 독립적으로 위 기준에 따라 평가하고, 다른 설명 없이 JSON 객체 하나로만 답하세요. "
+    "JSON의 키는 기사 번호 문자열(\"1\", \"2\", ...)이고, 값은 "
+    "{\"summary\": \"요약\", \"reliability\": \"높음|보통|낮음\"} 형식입니다. "
+    "모든 기사 번호에 대해 빠짐없이 답하세요."
+)
+
+
+class BatchRejected(Exception):
+    """묶음 응답을 해석할 수 없거나 묶음 자체가 거절되어, 더 작게 나누어 다시 보내야 할 때 발생합니다."""
+
+
+def build_batch_content(article_texts):
+    """기사들을 [기사 1], [기사 2] ... 형식의 하나의 텍스트로 묶습니다."""
+    return "\n\n".join(f"[기사 {i}]\n{text}" for i, text in enumerate(article_texts, start=1))
+
+
+def parse_batch_response(text, count):
+    """
+    묶음 응답을 {기사 번호(1부터): {'summary', 'reliability'}}로 해석합니다.
+    형식에 맞는 항목만 반환하며, JSON 자체를 읽을 수 없으면 BatchRejected를 발생시킵니다.
+    """
+    cleaned = re.sub(r"^```(?:json)?\s*|\s*```$", "", (text or "").strip())
+    try:
+        data = json.loads(cleaned)
+    except ValueError as e:
+        raise BatchRejected(f"JSON 형식이 아닌 응답입니다: {e}") from e
+    if isinstance(data, dict) and isinstance(data.get("articles"), list):  # {"articles": [{"index": 1, ...}]} 형식도 허용
+        data = {str(entry.get("index")): entry for entry in data["articles"] if isinstance(entry, dict)}
+    if not isinstance(data, dict):
+        raise BatchRejected("응답이 JSON 객체가 아닙니다.")
+    parsed = {}
+    for number in range(1, count + 1):
+        entry = data.get(str(number))
+        if not isinstance(entry, dict):
+            continue
+        summary = entry.get("summary")
+        if not isinstance(summary, str) or not summary.strip():
+            continue
+        reliability = entry.get("reliability")
+        parsed[number] = {
+            'summary': summary.strip(),
+            'reliability': reliability if reliability in RELIABILITY_LEVELS else "알 수 없음",
+        }
+    return parsed
+
+
+class BatchEvaluator:
+    """
+    기사 목록을 묶음 요청으로 평가합니다.
+    - request_batch(texts): 묶음 요청을 보내고 (원본 응답, 사용 토큰 수)를 반환하는 함수
+    - evaluate_single(text): 기사 1개를 평가하는 기존 함수 (결과 딕셔너리 또는 None)
+    결과는 gpt_evaluate와 같은 {'raw', 'summary', 'reliability', 'tokens'} 형식입니다.
+    """
+
+    def __init__(self, request_batch, evaluate_single):
+        self.request_batch = request_batch
+        self.evaluate_single = evaluate_single
+        self._lock = threading.Lock()
+        self.stats = {'batches': 0, 'splits': 0, 'single_fallbacks': 0, 'articles': 0, 'tokens': 0}
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def evaluate(self, article_texts):
+        """기사 텍스트 목록을 평가하여 같은 순서의 결과 목록을 반환합니다. 실패한 기사는 None입니다."""
+        results = [None] * len(article_texts)
+        self._count('articles', len(article_texts))
+        self._solve(article_texts, list(range(len(article_texts))), results)
+        return results
+
+    def _solve(self, texts, indices, results):
+        if not indices:
+            return
+        if len(indices) == 1:  # 기사 1개는 기존 단일 평가 형식으로 처리
+            self._count('single_fallbacks')
+            results[indices[0]] = self.evaluate_single(texts[indices[0]])
+            return
+        tokens = 0
+        try:
+            raw, tokens = self.request_batch([texts[i] for i in indices])
+            self._count('batches')
+            self._count('tokens', tokens or 0)
+            parsed = parse_batch_response(raw, len(indices))
+        except BatchRejected as e:
+            print(f"  [알림] 묶음 응답을 사용할 수 없어 나누어 다시 요청합니다 ({len(indices)}건): {e}")
+            parsed = {}
+        except Exception as e:  # 재시도까지 실패한 요청은 묶음 전체를 실패로 처리
+            print(f"  [오류] GPT 묶음 평가 오류: {e}")
+            return
+        per_article_tokens = (tokens or 0) // len(indices) if parsed else 0
+        missing = []
+        for number, index in enumerate(indices, start=1):
+            if number in parsed:
+                entry = parsed[number]
+                results[index] = {'raw': json.dumps(entry, ensure_ascii=False), 'summary': entry['summary'],
+                                  'reliability': entry['reliability'], 'tokens': per_article_tokens}
+            else:
+                missing.append(index)
+        if not missing:
+            return
+        if len(missing) < len(indices):  # 일부만 빠졌으면 빠진 기사만 다시 요청
+            self._solve(texts, missing, results)
+            return
+        self._count('splits')  # 하나도 해석하지 못했으면 반으로 나누어 다시 요청
+        middle = len(missing) // 2
+        self._solve(texts, missing[:middle], results)
+        self._solve(texts, missing[middle:], results)
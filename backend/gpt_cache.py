@@ -0,0 +1,87 @@
+# ================================
+# GPT 평가 결과 캐시 (기사 내용 해시 기반, SQLite)
+# ================================
+# 같은 기사 내용이 여러 소분류와 매시간 실행에 반복해서 나타나므로,
+# (배포 이름, 프롬프트 버전, 기준 언론사, 기사 내용)의 해시를 키로 평가 결과를 저장해 두고 재사용한다.
+# 프롬프트를 바꾸면 프롬프트 버전을 올려 예전 결과가 쓰이지 않도록 한다.
+import hashlib  # 기사 내용을 짧은 해시 키로 바꾸기 위한 라이브러리
+import json  # 키를 만들 때 여러 값을 하나의 문자열로 묶기 위한 라이브러리
+import os  # 캐시 파일이 들어갈 폴더 생성
+import sqlite3  # 파일 기반 데이터베이스
+import threading  # 여러 작업자가 동시에 접근할 때 사용하는 잠금
+import time  # 저장/사용 시각 기록
+
+
+def make_cache_key(deployment, prompt_version, selected_sources, article_text):
+    """캐시 키를 만듭니다. 값 중 하나라도 바뀌면 다른 키가 됩니다."""
+    payload = json.dumps([deployment, prompt_version, list(selected_sources), article_text], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class GptCache:
+    """
+    GPT의 원본 응답과 파싱한 요약/신뢰도를 저장하는 캐시입니다.
+    - max_entries: 저장할 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목부터 삭제)
+    - stats: 적중/실패 횟수와 캐시 덕분에 아낀 토큰 수
+    """
+
+    def __init__(self, path, max_entries=100000):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS gpt_cache (
+                   key TEXT PRIMARY KEY,
+                   raw TEXT NOT NULL,
+                   summary TEXT NOT NULL,
+                   reliability TEXT NOT NULL,
+                   tokens INTEGER NOT NULL DEFAULT 0,
+                   created_at REAL NOT NULL,
+                   last_access REAL NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_gpt_cache_access ON gpt_cache(last_access)")
+        self._conn.commit()
+        self.stats = {'hits': 0, 'misses': 0, 'tokens_saved': 0}
+
+    def get(self, key):
+        """저장된 결과({'raw', 'summary', 'reliability', 'tokens'})를 반환합니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT raw, summary, reliability, tokens FROM gpt_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            self._conn.execute("UPDATE gpt_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.stats['hits'] += 1
+            self.stats['tokens_saved'] += row[3]
+        return {'raw': row[0], 'summary': row[1], 'reliability': row[2], 'tokens': row[3]}
+
+    def put(self, key, raw, summary, reliability, tokens=0):
+        """평가 결과를 저장합니다. 오류 응답은 저장하지 않도록 호출하는 쪽에서 걸러야 합니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO gpt_cache (key, raw, summary, reliability, tokens, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, raw, summary, reliability, tokens or 0, now, now),
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM gpt_cache").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM gpt_cache WHERE key IN (SELECT key FROM gpt_cache ORDER BY last_access LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._conn.commit()
+
+    def hit_rate(self):
+        total = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / total if total else 0.0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
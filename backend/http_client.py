@@ -0,0 +1,133 @@
+# ================================
+# 공용 HTTP 클라이언트 (연결 풀 + keep-alive + HTTP/2)
+# ================================
+# 본문 수집, 이미지 주소 확인, 구글 뉴스 디코딩, RSS, 번역, GPT 호출이 모두 하나의 클라이언트를
+# 함께 쓰도록 하여, 같은 호스트로 가는 요청은 이미 열린 TCP/TLS 연결을 재사용한다.
+# openai 라이브러리가 이미 사용하는 httpx를 기반으로 하며, h2 패키지가 설치되어 있으면 HTTP/2를 사용한다.
+# 호스트별로 요청 수, 오류 수, 평균 지연 시간, 연결 재사용 비율을 기록한다.
+import threading  # 여러 작업자가 동시에 통계를 갱신할 때 사용하는 잠금
+import time  # 지연 시간 측정
+import weakref  # 연결 객체를 붙잡지 않고 새 연결인지 구분하기 위한 약한 참조
+from contextlib import contextmanager  # 스트리밍 응답을 with 문으로 다루기 위한 도구
+from urllib.parse import urlparse  # 호스트 이름 추출
+
+import httpx  # 연결 풀과 HTTP/2를 지원하는 HTTP 라이브러리 (openai 설치 시 함께 설치됨)
+
+try:
+    import h2  # noqa: F401  HTTP/2 지원 패키지 (pip install httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HostStats:
+    """호스트 하나에 대한 요청 통계입니다."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.latency_total = 0.0  # 응답 헤더를 받을 때까지 걸린 시간의 합
+        self.connections = weakref.WeakSet()  # 이 호스트로 열린 연결들 (닫히면 자동으로 빠짐)
+        self.new_connections = 0
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'avg_latency_ms': round(self.latency_total / self.requests * 1000, 1) if self.requests else 0.0,
+            'reuse_ratio': round(1 - self.new_connections / self.requests, 3) if self.requests else 0.0,
+        }
+
+
+class HttpClient:
+    """
+    백엔드 전체가 공유하는 HTTP 클라이언트입니다.
+    requests와 같은 인자 이름(allow_redirects, data 등)을 받아 기존 코드를 거의 그대로 쓸 수 있습니다.
+    - connect_timeout, read_timeout: 연결/응답 대기 제한 시간(초)
+    - max_connections: 전체 동시 연결 수, max_keepalive: 재사용을 위해 열어 둘 연결 수
+    - http2: None이면 h2 패키지가 있을 때 자동으로 HTTP/2 사용
+    """
+
+    def __init__(self, connect_timeout=5.0, read_timeout=15.0, max_connections=100, max_keepalive=40,
+                 keepalive_expiry=30.0, http2=None, headers=None):
+        self.http2 = HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+        self._lock = threading.Lock()
+        self._hosts = {}
+        self.client = httpx.Client(
+            http2=self.http2,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive,
+                                keepalive_expiry=keepalive_expiry),
+            headers=headers,
+            event_hooks={'request': [self._on_request], 'response': [self._on_response]},
+        )
+
+    # --- 통계 기록 ---
+    def _host(self, host):
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostStats()
+            return self._hosts[host]
+
+    @staticmethod
+    def _on_request(request):
+        request.extensions['newsflow_started'] = time.perf_counter()
+
+    def _on_response(self, response):
+        request = response.request
+        stats = self._host(request.url.host)
+        started = request.extensions.get('newsflow_started', time.perf_counter())
+        stream = response.extensions.get('network_stream')
+        with self._lock:
+            stats.requests += 1
+            stats.latency_total += time.perf_counter() - started
+            if response.status_code >= 400:
+                stats.errors += 1
+            if stream is not None and stream not in stats.connections:  # 처음 보는 연결이면 새로 연결한 것
+                stats.connections.add(stream)
+                stats.new_connections += 1
+
+    def _record_error(self, url):
+        stats = self._host(urlparse(str(url)).hostname or '')
+        with self._lock:
+            stats.errors += 1
+
+    def metrics(self):
+        """호스트별 {requests, errors, avg_latency_ms, reuse_ratio}를 반환합니다."""
+        with self._lock:
+            return {host: stats.as_dict() for host, stats in self._hosts.items()}
+
+    # --- 요청 ---
+    @staticmethod
+    def _convert_options(options):
+        # requests 스타일 인자를 httpx 인자로 바꿈
+        options.setdefault('follow_redirects', options.pop('allow_redirects', True))
+        if isinstance(options.get('data'), (str, bytes)):
+            options['content'] = options.pop('data')
+        return options
+
+    def request(self, method, url, **options):
+        try:
+            return self.client.request(method, url, **self._convert_options(options))
+        except httpx.HTTPError:
+            self._record_error(url)
+            raise
+
+    def get(self, url, **options):
+        return self.request('GET', url, **options)
+
+    def post(self, url, **options):
+        return self.request('POST', url, **options)
+
+    @contextmanager
+    def stream(self, method, url, **options):
+        """응답 본문을 조금씩 읽기 위한 스트리밍 요청입니다. with 블록이 끝나면 연결을 반납합니다."""
+        try:
+            with self.client.stream(method, url, **self._convert_options(options)) as response:
+                yield response
+        except httpx.HTTPError:
+            self._record_error(url)
+            raise
+
+    def close(self):
+        self.client.close()
@@ -1,20 +1,39 @@
 # ================================
 # 0. 라이브러리 임포트
 # ================================
-import feedparser  # RSS 피드를 파싱(분석)하기 위한 라이브러리
 import time  # 프로그램 실행 중 잠시 멈추거나(sleep) 시간 관련 작업을 위한 라이브러리
+import asyncio  # 단계별 작업자 풀을 동시에 실행하기 위한 비동기 라이브러리
 import os  # 운영체제와 상호작용하기 위한 라이브러리 (폴더 생성, 파일 경로 등)
 from datetime import datetime, timedelta  # 날짜와 시간을 다루기 위한 라이브러리
 from urllib.parse import quote  # URL에 한글 같은 문자를 안전하게 포함시키기 위한 라이브러리
 from openai import AzureOpenAI  # Azure의 OpenAI 서비스를 사용하기 위한 라이브러리
+import openai  # 재시도 여부를 판단하기 위한 OpenAI 오류 클래스들
 import re  # 정규 표현식을 사용해 문자열에서 특정 패턴을 찾기 위한 라이브러리
-import requests  # 웹사이트에 HTTP 요청을 보내기 위한 라이브러리
-import uuid  # 고유한 ID를 생성하기 위한 라이브러리 (번역 요청 시 추적 ID로 사용)
-from bs4 import BeautifulSoup  # HTML 및 XML 파일에서 데이터를 쉽게 추출하기 위한 라이브러리
 from selenium import webdriver  # 웹 브라우저를 자동으로 제어하기 위한 라이브러리
 from selenium.webdriver.chrome.service import Service  # 셀레니움에서 크롬 드라이버 서비스를 관리
 from selenium.webdriver.chrome.options import Options  # 크롬 브라우저의 옵션(예: 헤드리스 모드)을 설정
 from selenium.webdriver.support.ui import WebDriverWait  # 셀레니움에서 특정 조건이 만족될 때까지 기다리도록 설정
+from http_client import HttpClient  # 모든 외부 요청이 함께 쓰는 연결 풀 기반 HTTP 클라이언트
+from browser_pool import BrowserPool  # 미리 띄워 둔 크롬 브라우저를 재사용하기 위한 풀
+from gnews_decoder import GoogleNewsDecoder  # 브라우저 없이 구글 뉴스 링크에서 원문 주소를 찾는 디코더
+from url_cache import UrlCache  # 구글 뉴스 링크의 변환 결과를 디스크에 저장해 두는 캐시
+from feed_store import FeedStore, entry_fingerprint  # RSS 조건부 요청 정보와 기사 변경 내역 저장소
+from article_store import ArticleStore  # 처리한 기사를 기사마다 한 행으로 쌓아 두는 저장소
+from article_snapshot import write_snapshot, append_snapshot, read_manifest, SNAPSHOT_VERSION  # 검색 서버가 바로 여는 기사 스냅샷 (JSONL + 위치 색인 + 검색 색인)
+from dedup_index import DedupIndex, canonical_url, title_fingerprint, LEAD, DONE  # 여러 소분류에 함께 나온 기사의 결과 공유
+from run_checkpoint import RunCheckpoint  # 기사별/단계별 체크포인트로 중간에 멈춘 실행을 이어서 처리
+from story_clusters import StoryClusters, DONE as STORY_DONE, WAIT as STORY_WAIT  # 비슷한 기사 묶기 (MinHash/LSH)
+from feed_fetcher import FeedFetcher  # 여러 RSS 피드를 동시에 받고 분석 작업자 풀에서 기사 목록으로 바꾸는 수집기
+from extractors import get_extractor  # 기사 본문과 대표 이미지를 찾는 HTML 추출 백엔드 (lxml/selectolax/BeautifulSoup)
+from publisher_rules import PUBLISHER_RULES, RuleRegistry, RuleExtractor  # 언론사별 본문/이미지 추출 규칙
+from streaming_extractor import StreamingExtractor  # 본문과 이미지를 찾으면 나머지 페이지는 받지 않는 스트리밍 추출기
+from scraper import PoliteFetcher  # 언론사별 동시 요청 수, robots.txt, 백오프를 지키며 페이지를 받아 오는 수집기
+from pipeline import Pipeline, Stage, GroupCollector, to_thread  # 단계별 작업자 풀을 큐로 연결한 비동기 파이프라인
+from rate_limiter import RateLimiter  # Azure OpenAI 할당량(RPM/TPM)에 맞춰 호출 속도를 조절하는 제한기
+from gpt_cache import GptCache, make_cache_key  # 같은 기사 내용의 GPT 평가 결과를 재사용하는 캐시
+from translator import AzureTranslator  # 여러 기사의 번역을 묶어서 보내는 Azure 번역 클라이언트
+from translation_memory import TranslationMemory  # 이미 번역한 문장을 언어별로 재사용하는 번역 메모리
+from gpt_batch import BatchEvaluator, BatchRejected, BATCH_FORMAT_INSTRUCTION, build_batch_content  # 여러 기사를 한 요청으로 평가
 
 # ================================
 # 1. 사용자 설정
@@ -31,6 +50,21 @@ user_follow_categories = ["여행"]
 translator_key = "..."  # Azure 번역 서비스의 구독 키
 translator_endpoint = "https://api.cognitive.microsofttranslator.com/"  # Azure 번역 서비스의 엔드포인트 주소
 translator_location = "KoreaCentral"  # Azure 번역 서비스의 리소스 지역
+TRANSLATE_BATCH_SIZE = 100  # 번역 단계에서 한 번에 모을 최대 기사 수
+TRANSLATE_BATCH_WAIT = 2.0  # 번역할 기사를 모으기 위해 기다릴 최대 시간(초)
+TRANSLATOR_MAX_CONCURRENCY = 4  # 동시에 보낼 최대 번역 요청 수
+TRANSLATION_MEMORY_MAX_ENTRIES = 500000  # 번역 메모리에 보관할 최대 번역 수 (문장 × 언어)
+
+# ================================
+# 2-1. 공용 HTTP 클라이언트 설정
+# ================================
+HTTP_CONNECT_TIMEOUT = 5  # 서버 연결 제한 시간(초)
+HTTP_READ_TIMEOUT = 15  # 응답 대기 제한 시간(초)
+HTTP_MAX_CONNECTIONS = 100  # 전체 동시 연결 수
+HTTP_MAX_KEEPALIVE = 40  # 재사용을 위해 열어 둘 연결 수
+# 본문 수집, 디코딩, RSS, 번역, GPT 호출이 모두 이 클라이언트의 연결 풀을 함께 사용 (h2가 설치되어 있으면 HTTP/2)
+http_client = HttpClient(connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT,
+                         max_connections=HTTP_MAX_CONNECTIONS, max_keepalive=HTTP_MAX_KEEPALIVE)
 
 # ================================
 # 3. Azure OpenAI 초기화
@@ -39,13 +73,26 @@ endpoint = "https://newscheck2.openai.azure.com/"  # Azure OpenAI 서비스의 
 deployment = "gpt-4o"  # Azure에 배포한 모델의 '배포 이름'
 subscription_key = "..."  # Azure OpenAI 서비스의 구독 키
 api_version = "2025-01-01-preview"  # 사용할 API의 버전
+deployment_tpm_quota = 50000  # 배포에 할당된 분당 토큰 수 (Azure Portal의 배포 할당량과 맞출 것)
+deployment_rpm_quota = deployment_tpm_quota // 1000 * 6  # 분당 요청 수 (Azure는 1000 TPM당 6 RPM을 할당)
+gpt_max_retries = 5  # 429/일시적 오류 시 최대 재시도 횟수
+GPT_BATCH_SIZE = 8  # 한 번의 GPT 요청에 담을 최대 기사 수 (1이면 기사마다 따로 요청)
+GPT_BATCH_WAIT = 2.0  # 묶음을 채우기 위해 기다릴 최대 시간(초)
+GPT_BATCH_COMPLETION_TOKENS = 512  # 묶음 요청에서 기사 1개당 확보할 응답 토큰 수
+GPT_READ_TIMEOUT = 180  # GPT 응답 대기 제한 시간(초), 묶음 응답은 기사 수만큼 길어지므로 HTTP_READ_TIMEOUT보다 길게 둠
 
 # 위 설정값들을 사용하여 Azure OpenAI 서비스에 연결할 수 있는 클라이언트 객체를 생성
 client = AzureOpenAI(
     azure_endpoint=endpoint,
     api_key=subscription_key,
     api_version=api_version,
+    max_retries=0,  # 재시도는 아래 속도 제한기가 Retry-After를 반영해 직접 처리
+    http_client=http_client.client,  # 공용 연결 풀 사용 (호스트별 지표에 함께 집계됨)
+    # 지정하지 않으면 공용 클라이언트의 응답 대기 시간(HTTP_READ_TIMEOUT)을 그대로 써서, 긴 묶음 응답이 매번 시간 초과로 재시도됨
+    timeout=openai.Timeout(GPT_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
 )
+# 모든 GPT 평가 작업자가 함께 사용하는 속도 제한기 (고정된 1초 대기를 대신함)
+gpt_rate_limiter = RateLimiter(deployment_rpm_quota, deployment_tpm_quota, max_retries=gpt_max_retries)
 
 # ================================
 # 4. 전체 뉴스/카테고리
@@ -67,43 +114,138 @@ categories = {
     '여행': ['국내 여행']
 }
 MAX_ARTICLES_PER_CATEGORY = 100  # 각 카테고리별로 수집할 최대 기사 수
+RENDER_MAX_ARTICLES = 100  # 소분류 HTML 페이지에 보여 줄 최대 기사 수 (기사 저장소에서 최신순으로 읽음)
 save_path = 'C:/Users/admin/Desktop/news/test1/output'  # 결과 HTML 파일이 저장될 경로
 one_month_ago = datetime.now() - timedelta(days=30)  # 한 달 전 날짜를 계산 (이보다 오래된 뉴스는 수집 안 함)
 os.makedirs(save_path, exist_ok=True)  # 저장 경로에 폴더가 없으면 자동으로 생성
+BROWSER_POOL_SIZE = 2  # 동시에 띄워 둘 헤드리스 크롬 브라우저 수
+BROWSER_MAX_PAGES = 50  # 브라우저 하나로 처리할 최대 페이지 수 (넘으면 새 브라우저로 교체)
+BROWSER_WARM_COUNT = 1  # 실행을 시작할 때 미리 띄워 둘 브라우저 수 (브라우저는 빠른 변환에 실패한 링크에만 쓰므로 적게 둠)
+cache_path = os.path.join(save_path, '.cache')  # 실행 간에 재사용할 캐시 파일들이 저장될 경로
+URL_CACHE_TTL = 7 * 24 * 3600  # 원문 주소 변환 결과를 재사용할 기간 (7일)
+URL_CACHE_NEGATIVE_TTL = 3600  # 변환에 실패한 링크를 다시 시도하지 않을 기간 (1시간)
+URL_CACHE_MAX_ENTRIES = 50000  # 원문 주소 캐시에 보관할 최대 링크 수
+SCRAPE_PER_HOST_CONCURRENCY = 4  # 한 언론사에 동시에 보낼 최대 요청 수
+SCRAPE_MIN_HOST_INTERVAL = 0.0  # 한 언론사에 요청을 보내는 최소 간격(초), robots.txt의 Crawl-delay가 더 길면 그 값을 사용
+EXTRACTION_BACKEND = None  # HTML 추출 백엔드 ('selectolax', 'lxml', 'bs4'), None이면 설치된 것 중 가장 빠른 것을 사용
+PAGE_MAX_BYTES = 2_000_000  # 기사 페이지 하나에서 읽을 최대 바이트 수 (넘으면 받은 부분까지만 사용)
+PAGE_MAX_SECONDS = 10  # 기사 페이지 하나를 읽는 데 쓸 최대 시간(초)
+FEED_PARSE_WORKERS = 4  # RSS 피드를 분석할 작업자 수 (피드를 받는 동시 실행 수는 PIPELINE_CONCURRENCY['fetch'])
+PAGE_CHUNK_SIZE = 16384  # 기사 페이지를 한 번에 읽을 크기(바이트), 작을수록 필요한 부분만 읽고 빨리 멈춤
+DEDUP_MAX_AGE_DAYS = 7  # 다른 피드에서 처리한 같은 기사의 결과를 재사용할 기간(일)
+STORY_CLUSTER_THRESHOLD = 0.6  # 본문의 추정 유사도(0~1)가 이 값 이상이면 같은 사건의 기사로 묶어 한 번만 평가
+STORY_CLUSTER_NUM_PERM = 128  # MinHash 서명 길이 (길수록 유사도 추정이 정확하지만 느림)
+STORY_CLUSTER_SHINGLE_SIZE = 5  # 본문을 비교할 때 사용할 글자 n-gram의 길이
+STORY_CLUSTER_MIN_LENGTH = 200  # 이보다 짧은 본문(본문 수집 실패 등)은 묶지 않고 따로 평가
+RUN_CHECKPOINT_MAX_AGE_HOURS = 24  # 중간에 멈춘 실행을 다음 실행이 이어받을 수 있는 기간(시간)
+RUN_HEARTBEAT_SECONDS = 60  # 실행 중인 프로세스가 생존 신호를 남기는 간격
+RUN_STALE_SECONDS = 300  # 생존 신호가 이보다 오래 끊긴 실행만 다음 실행이 이어받음 (그 전에는 진행 중으로 봄)
+PROMPT_VERSION = 1  # GPT 프롬프트를 수정하면 이 값을 올려 예전 평가 결과가 재사용되지 않도록 함
+GPT_CACHE_MAX_ENTRIES = 100000  # GPT 평가 캐시에 보관할 최대 기사 수
 
 # ================================
-# 5. 원문/이미지 주소 추출 함수 (WebDriverWait 적용)
+# 5. 원문/이미지 주소 추출 함수 (WebDriverWait + 브라우저 풀 적용)
 # ================================
-# 구글 뉴스 링크를 입력받아 실제 원문 기사 주소와 대표 이미지 주소를 찾아내는 함수
-def get_original_article_info(google_news_url):
-    print(f"  -> [변환 시도] 기존 주소: {google_news_url}")  # 현재 처리 중인 구글 뉴스 URL 출력
+# 브라우저 풀이 새 크롬 브라우저가 필요할 때 호출하는 함수
+def create_chrome_driver():
     chrome_options = Options()  # 크롬 브라우저 옵션 설정 객체 생성
     chrome_options.add_argument("--headless")  # 브라우저 창을 실제로 띄우지 않는 헤드리스 모드로 실행
     chrome_options.add_argument("--disable-gpu")  # GPU 가속 비활성화 (헤드리스 모드에서 안정성 향상)
     chrome_options.add_argument("user-agent=...")  # User-Agent 값을 설정하여 봇으로 인식되는 것을 방지
     service = Service()  # 크롬 드라이버 서비스 객체 생성
-    driver = webdriver.Chrome(service=service, options=chrome_options)  # 설정된 옵션으로 크롬 드라이버 실행
+    return webdriver.Chrome(service=service, options=chrome_options)  # 설정된 옵션으로 크롬 드라이버 실행
+
+# 기사마다 크롬을 새로 띄우지 않도록 실행 내내 유지되는 브라우저 풀
+browser_pool = BrowserPool(create_chrome_driver, size=BROWSER_POOL_SIZE, max_pages=BROWSER_MAX_PAGES)
+
+# 브라우저 풀을 미리 채우는 함수 (실패해도 브라우저가 필요할 때 다시 띄우므로 실행은 계속함)
+def warm_up_browsers():
+    try:
+        browser_pool.warm_up(BROWSER_WARM_COUNT)
+    except Exception as e:
+        print(f"[브라우저 풀] 브라우저를 미리 띄우지 못했습니다: {e}")
+
+# 언론사 페이지 요청은 모두 이 수집기를 거쳐, 여러 언론사는 동시에 받고 한 언론사에는 무리하게 요청하지 않음
+page_fetcher = PoliteFetcher(http_client, per_host=SCRAPE_PER_HOST_CONCURRENCY, min_interval=SCRAPE_MIN_HOST_INTERVAL)
+
+# 브라우저 없이 원문 주소를 먼저 찾아보는 빠른 경로 (실패한 링크만 브라우저로 처리)
+gnews_decoder = GoogleNewsDecoder(session=http_client)
+
+# 본문과 대표 이미지를 찾는 HTML 추출기 (C 기반 파서가 설치되어 있으면 그것을 사용, 결과는 모두 같음)
+html_extractor = get_extractor(EXTRACTION_BACKEND)
+# 언론사 도메인별 규칙(본문 위치, 뺄 문단, 이미지 위치)을 문서를 한 번만 훑으며 적용하는 추출기
+# (새 언론사는 publisher_rules.PUBLISHER_RULES에 규칙을 추가)
+article_extractor = RuleExtractor(RuleRegistry(PUBLISHER_RULES), html_extractor)
+# 기사 페이지를 조각 단위로 읽다가 본문 컨테이너와 대표 이미지를 찾으면 바로 연결을 닫는 추출기
+page_extractor = StreamingExtractor(article_extractor, max_bytes=PAGE_MAX_BYTES, max_seconds=PAGE_MAX_SECONDS)
+
+# 기사 페이지를 스트리밍으로 받아 (본문 텍스트, 대표 이미지 주소)를 찾는 함수 (want_body=False면 이미지만 찾음)
+def fetch_article_page(url, want_body=True):
+    headers = {'User-Agent': '...'}  # 봇으로 인식되지 않도록 User-Agent 설정
+    # 언론사별 규칙(동시 요청 수, robots.txt, 백오프)을 지키며 접속 (타임아웃 10초)
+    with page_fetcher.stream(url, headers=headers, timeout=10) as response:
+        response.raise_for_status()  # HTTP 요청이 실패하면(200번대 코드가 아니면) 오류를 발생시킴
+        # 응답 헤더에 문자 인코딩이 없으면 페이지의 <meta charset>으로 판단 (없으면 UTF-8)
+        return page_extractor.extract(url, response.iter_bytes(PAGE_CHUNK_SIZE), response.charset_encoding, want_body)
+
+# HTML에서 대표 이미지 주소를 찾는 함수 (없으면 None)
+def find_og_image(html, url):
+    # 언론사 규칙의 이미지 위치(기본은 og:image 메타 태그의 content)에서 대표 이미지 URL을 찾음
+    return report_image(article_extractor.image(url, html))
+
+# 대표 이미지를 찾았는지 출력하고 그대로 반환하는 함수
+def report_image(image_url):
+    if image_url:  # 이미지 주소가 존재하면
+        print("  -> 이미지 주소 찾음!")
+        return image_url
+    print("  [알림] 이 페이지에는 og:image 태그가 없습니다.")
+    return None
+
+# 이전 실행에서 변환한 결과를 재사용하기 위한 디스크 캐시 (실패한 링크도 잠시 기억함)
+url_cache = UrlCache(os.path.join(cache_path, 'url_cache.sqlite3'), ttl=URL_CACHE_TTL,
+                     negative_ttl=URL_CACHE_NEGATIVE_TTL, max_entries=URL_CACHE_MAX_ENTRIES)
+
+# 구글 뉴스 링크를 입력받아 실제 원문 기사 주소와 대표 이미지 주소를 찾아내는 함수 (캐시를 먼저 확인)
+def get_original_article_info(google_news_url):
+    cached = url_cache.get(google_news_url)  # 이전 실행에서 이미 변환한 링크인지 확인
+    if cached is not None:
+        print(f"  -> [캐시 사용] 원문 주소: {cached['original_url']}")
+        return {'original_url': cached['original_url'], 'image_url': cached['image_url']}
+    article_info = resolve_article_info(google_news_url)  # 캐시에 없으면 실제로 변환
+    # 원문 주소를 찾지 못했다면(여전히 구글 뉴스 주소) 실패로 기록하여 한동안 다시 시도하지 않음
+    url_cache.put(google_news_url, article_info['original_url'], article_info['image_url'],
+                  failed="news.google.com" in article_info['original_url'])
+    return article_info
+
+# 디코더 → 브라우저 순서로 구글 뉴스 링크를 실제 원문 주소로 변환하는 함수
+def resolve_article_info(google_news_url):
+    print(f"  -> [변환 시도] 기존 주소: {google_news_url}")  # 현재 처리 중인 구글 뉴스 URL 출력
     original_url, image_url = google_news_url, None  # 초기값 설정
-    try:  # 오류 발생 가능성이 있는 코드를 try 블록 안에 작성
-        driver.get(google_news_url)  # 셀레니움으로 구글 뉴스 URL 접속
-        # 페이지가 리디렉션되어 현재 URL에 "news.google.com"이 없을 때까지 최대 15초간 기다림
-        WebDriverWait(driver, 15).until(lambda d: "news.google.com" not in d.current_url)
-        original_url = driver.current_url  # 리디렉션이 완료된 최종 URL을 저장
-        print(f"  -> [변환 완료] 원문 주소: {original_url}")  # 변환된 원문 주소 출력
-        soup = BeautifulSoup(driver.page_source, 'html.parser')  # 페이지의 HTML 소스를 BeautifulSoup으로 파싱
-        # HTML의 <meta> 태그 중 property 속성이 'og:image'인 것을 찾음 (대표 이미지를 나타냄)
-        image_tag = soup.find('meta', property='og:image')
-        if image_tag and image_tag.get('content'):  # 이미지 태그와 그 내용이 존재하면
-            image_url = image_tag['content']  # content 속성값(이미지 URL)을 저장
-            print("  -> 이미지 주소 찾음!")
-        else:  # 이미지 태그가 없으면
-            print("  [알림] 이 페이지에는 og:image 태그가 없습니다.")
-    except Exception as e:  # try 블록에서 오류 발생 시
-        print(f"  [오류] 작업 중 오류 발생 (타임아웃 또는 기타): {e}")  # 오류 메시지 출력
-        original_url = driver.current_url  # 오류 발생 시점의 URL을 저장
-        print(f"  -> [오류 시점 주소] {original_url}")
-    finally:  # 오류 발생 여부와 상관없이 항상 실행
-        driver.quit()  # 크롬 드라이버 종료
+    decoded_url = gnews_decoder.decode(google_news_url)  # 1차: 링크 디코딩 또는 HTTP 요청만으로 원문 주소 찾기
+    if decoded_url:
+        print(f"  -> [빠른 변환 완료] 원문 주소: {decoded_url}")
+        try:  # 원문 페이지를 일반 HTTP로 받아 대표 이미지만 찾음 (이미지 태그가 나오면 나머지는 받지 않음)
+            _, image_url = fetch_article_page(decoded_url, want_body=False)
+            report_image(image_url)
+        except Exception as e:
+            print(f"  [오류] 이미지 주소 수집 중 오류 발생: {e}")
+        return {'original_url': decoded_url, 'image_url': image_url}
+    # 2차: 디코딩에 실패한 링크만 브라우저로 리디렉션을 따라감
+    with browser_pool.session() as driver:  # 풀에서 브라우저를 빌려 쓰고, 끝나면 자동으로 반납
+        try:  # 오류 발생 가능성이 있는 코드를 try 블록 안에 작성
+            driver.get(google_news_url)  # 셀레니움으로 구글 뉴스 URL 접속
+            # 페이지가 리디렉션되어 현재 URL에 "news.google.com"이 없을 때까지 최대 15초간 기다림
+            WebDriverWait(driver, 15).until(lambda d: "news.google.com" not in d.current_url)
+            original_url = driver.current_url  # 리디렉션이 완료된 최종 URL을 저장
+            print(f"  -> [변환 완료] 원문 주소: {original_url}")  # 변환된 원문 주소 출력
+            image_url = find_og_image(driver.page_source, original_url)  # 페이지의 HTML 소스에서 대표 이미지 주소를 찾음
+        except Exception as e:  # try 블록에서 오류 발생 시
+            print(f"  [오류] 작업 중 오류 발생 (타임아웃 또는 기타): {e}")  # 오류 메시지 출력
+            try:
+                original_url = driver.current_url  # 오류 발생 시점의 URL을 저장
+            except Exception:  # 브라우저 자체가 응답하지 않으면 반납 시 풀에서 새 브라우저로 교체됨
+                pass
+            print(f"  -> [오류 시점 주소] {original_url}")
     return {'original_url': original_url, 'image_url': image_url}  # 원문 주소와 이미지 주소를 딕셔너리로 반환
 
 # ================================
@@ -112,26 +254,13 @@ def get_original_article_info(google_news_url):
 # 기사 URL을 입력받아 웹페이지에서 본문 텍스트를 추출(스크래핑)하는 함수
 def scrape_article_body(url):
     try:  # 오류 발생 가능성이 있는 코드를 try 블록 안에 작성
-        headers = {'User-Agent': '...'}  # 봇으로 인식되지 않도록 User-Agent 설정
-        # requests 라이브러리로 URL에 접속하여 페이지 내용을 가져옴 (타임아웃 10초)
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()  # HTTP 요청이 실패하면(200번대 코드가 아니면) 오류를 발생시킴
-        soup = BeautifulSoup(response.text, 'html.parser')  # 페이지 내용을 BeautifulSoup으로 파싱
-        article_tag = soup.find('article')  # HTML의 <article> 태그를 찾음 (보통 기사 본문을 감싸고 있음)
-        if not article_tag:  # <article> 태그를 찾지 못했다면
-            # 다른 언론사에서 흔히 사용하는 id나 class 이름으로 다시 검색
-            selectors = ['#articleBodyContents', '#article_body', '.article_body', '#dic_area']
-            for selector in selectors:
-                article_tag = soup.select_one(selector)
-                if article_tag: break  # 찾으면 반복 중단
-        if article_tag:  # 본문 컨테이너 태그를 찾았다면
-            paragraphs = article_tag.find_all('p')  # 그 안에서 모든 <p>(문단) 태그를 찾음
-            if not paragraphs: paragraphs = article_tag.find_all('div')  # <p>가 없으면 <div> 태그를 대신 찾음
-            # 모든 문단의 텍스트를 하나로 합침 (앞뒤 공백 제거, 빈 문단 제외)
-            body_text = "\n".join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-            if len(body_text) > 50:  # 본문 길이가 50자 이상이면
-                print("  -> 본문 수집 성공!")
-                return body_text  # 수집한 텍스트를 반환
+        # 페이지를 조각 단위로 받으면서, 언론사 규칙의 본문 컨테이너 안에서 기자 정보, 광고, 사진 설명을 뺀
+        # <p> 문단들을 하나로 합침 (문단이 없으면 컨테이너 전체 텍스트를 줄 단위로 사용,
+        # 규칙이 없는 언론사는 <article> 등 기본 위치 사용). 본문이 끝나면 나머지 페이지는 받지 않음
+        body_text, _ = fetch_article_page(url)
+        if body_text and len(body_text) > 50:  # 본문 길이가 50자 이상이면
+            print("  -> 본문 수집 성공!")
+            return body_text  # 수집한 텍스트를 반환
         print("  [알림] 기사 본문을 찾을 수 없거나 내용이 너무 짧습니다.")
         return None  # 본문 수집에 실패하면 None을 반환
     except Exception as e:  # 오류 발생 시
@@ -141,72 +270,228 @@ def scrape_article_body(url):
 # ================================
 # 6. 뉴스 수집 및 GPT 평가 함수
 # ================================
-# 특정 소분류 키워드로 구글 뉴스 RSS에서 기사 목록을 가져오는 함수
-def fetch_news(sub_category):
+# 피드별 ETag/Last-Modified와 이전에 처리한 기사(지문과 결과)를 기억하는 저장소
+feed_store = FeedStore(os.path.join(cache_path, 'feed_store.sqlite3'))
+
+# RSS를 받는 일은 파이프라인 수집 단계가 동시에 하고, 분석은 이 수집기의 작업자 풀에서 함
+feed_fetcher = FeedFetcher(http_client, parse_workers=FEED_PARSE_WORKERS)
+
+# 소분류 키워드로 구글 뉴스 RSS 주소를 만드는 함수 (같은 이름의 소분류는 같은 피드를 사용)
+def feed_url(sub_category):
     encoded_keyword = quote(sub_category)  # 한글 키워드를 URL에 사용할 수 있도록 인코딩
-    news_url = f"https://news.google.com/rss/search?q={encoded_keyword}&hl=ko&gl=KR"  # 구글 뉴스 RSS 주소 생성
-    feed = feedparser.parse(news_url)  # feedparser로 RSS 피드를 분석
+    return f"https://news.google.com/rss/search?q={encoded_keyword}&hl=ko&gl=KR"  # 구글 뉴스 RSS 주소 생성
+
+# 구글 뉴스 RSS 피드 하나에서 기사 목록을 가져오는 함수
+# 반환값은 {'url': 피드 주소, 'articles': 기사 목록, 'etag', 'last_modified'}이며,
+# 지난 실행 이후 피드가 바뀌지 않았거나(304) 수집에 실패하면 None
+# (원문 주소 변환과 본문 수집은 파이프라인의 다음 단계에서 기사별로 동시에 처리됨)
+async def fetch_news(news_url):
+    try:  # 공용 HTTP 클라이언트로 RSS를 받아 분석 작업자 풀에서 기사 목록으로 바꿈 (저장된 ETag/Last-Modified로 조건부 요청)
+        response, entries = await feed_fetcher.fetch(news_url, headers=feed_store.conditional_headers(news_url))
+    except Exception as e:
+        print(f"  [오류] RSS 수집 중 오류 발생: {e}")
+        return None
+    if entries is None:  # 지난 실행 이후 피드가 바뀌지 않음
+        feed_store.record_not_modified()
+        print("  -> 피드가 바뀌지 않았습니다. (304)")
+        return None
     articles = []  # 수집한 기사 정보를 저장할 리스트
-    for entry in feed.entries:  # RSS 피드에 있는 각 기사(entry)에 대해 반복
+    for entry in entries:  # RSS 피드에 있는 각 기사(entry)에 대해 반복
         if len(articles) >= MAX_ARTICLES_PER_CATEGORY: break  # 최대 수집 개수에 도달하면 중단
-        source = getattr(entry, 'source', None)  # 기사의 출처(언론사) 정보를 가져옴
-        if source and source.title in all_sources:  # 출처가 있고, 우리가 정한 언론사 목록에 포함되어 있다면
-            published_time = entry.get('published_parsed')  # 기사 발행 시간을 가져옴
+        source = entry['source']  # 기사의 출처(언론사) 이름을 가져옴
+        if source in all_sources:  # 출처가 우리가 정한 언론사 목록에 포함되어 있다면
+            published_time = entry['published_parsed']  # 기사 발행 시간을 가져옴
             if not published_time: continue  # 발행 시간이 없으면 건너뜀
             article_date = datetime.fromtimestamp(time.mktime(published_time))  # 발행 시간을 datetime 객체로 변환
             if article_date < one_month_ago: continue  # 너무 오래된 기사(한 달 이전)는 건너뜀
-            print(f"Processing '{entry.title[:30]}...'")  # 처리 중인 기사 제목 출력
-            article_info = get_original_article_info(entry.link)  # 원문 주소와 이미지 주소 추출
-            body_text = None  # 본문 텍스트 초기화
-            if "news.google.com" not in article_info['original_url']:  # 원문 주소 변환에 성공했다면
-                body_text = scrape_article_body(article_info['original_url'])  # 본문 텍스트 수집
             articles.append({  # 수집한 기사 정보를 딕셔너리 형태로 리스트에 추가
-                'title': entry.title,
-                'link': article_info['original_url'],
-                'image_url': article_info['image_url'],
-                'source': source.title,
+                'title': entry['title'],
+                'google_link': entry['link'],  # 원문 주소로 변환하기 전의 구글 뉴스 링크
+                'source': source,
                 'date': article_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'content': body_text if body_text else entry.title  # 본문 수집 성공 시 본문을, 실패 시 제목을 content로 사용
+                'entry_key': entry['id'] or entry['link'],  # 이전 실행의 기사와 비교할 때 쓰는 키
+                'fingerprint': entry_fingerprint(entry['title'], entry['link'], source, entry['published']),
             })
-    return articles  # 기사 정보가 담긴 리스트를 반환
+    # 조건부 요청 정보는 피드의 기사가 모두 처리된 뒤에 저장하므로 함께 반환
+    return {'url': news_url, 'articles': articles,
+            'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
 
-# 기사 내용(텍스트)을 받아 GPT 모델에 요약 및 신뢰도 평가를 요청하는 함수
-def gpt_evaluate(article_text, selected_sources):
+# 기사 내용이 같으면 이전 실행의 평가 결과를 재사용하기 위한 디스크 캐시
+gpt_cache = GptCache(os.path.join(cache_path, 'gpt_cache.sqlite3'), max_entries=GPT_CACHE_MAX_ENTRIES)
+
+# 429(할당량 초과) 오류인지 확인하는 함수
+def is_rate_limit_error(error):
+    return isinstance(error, openai.RateLimitError)
+
+# 잠시 후 다시 시도하면 성공할 수 있는 오류(연결 끊김, 타임아웃, 5xx)인지 확인하는 함수
+def is_retryable_error(error):
+    return isinstance(error, (openai.APIConnectionError, openai.InternalServerError))
+
+# 요청에 사용될 토큰 수를 대략 추정하는 함수 (한글은 대략 글자당 1토큰, 여기에 최대 응답 길이를 더함)
+def estimate_tokens(messages, max_completion_tokens):
+    return sum(len(message['content']) for message in messages) + max_completion_tokens
+
+# GPT 응답에서 요약과 신뢰도를 꺼내는 함수 (찾지 못한 항목은 None)
+def parse_evaluation(evaluation_text):
+    # 정규 표현식을 사용해 GPT 응답에서 '1)'로 시작하는 요약 부분을 추출
+    summary_match = re.search(r'1\)(.*?)(?=2\)|\Z)', evaluation_text, re.DOTALL)
+    # 정규 표현식을 사용해 GPT 응답에서 '신뢰도:' 부분을 추출
+    reliability_match = re.search(r'신뢰도:\s*(높음|보통|낮음)', evaluation_text)
+    summary_text = summary_match.group(1).strip() if summary_match else None
+    reliability = reliability_match.group(1).strip() if reliability_match else None
+    return summary_text, reliability
+
+# GPT에 보낼 메시지 목록을 만드는 함수 (시스템 역할, 사용자 프롬프트, [추가 안내], 실제 기사 내용)
+def build_evaluation_messages(selected_sources, article_content, extra_instruction=None):
     # GPT에 보낼 프롬프트(명령어)를 생성. 역할, 요구사항, 형식 등을 자세히 지정
     prompt_text = f"..."
-    # GPT에 전달할 메시지 목록을 생성. 시스템 역할, 사용자 프롬프트, 실제 기사 내용으로 구성
-    messages = [{"role": "system", "content": "..."}, {"role": "user", "content": prompt_text}, {"role": "user", "content": article_text}]
+    if extra_instruction:  # 묶음 평가처럼 응답 형식을 바꿔야 할 때 안내문을 덧붙임
+        prompt_text = f"{prompt_text}\n\n{extra_instruction}"
+    return [{"role": "system", "content": "..."}, {"role": "user", "content": prompt_text}, {"role": "user", "content": article_content}]
+
+# 속도 제한기를 거쳐 Azure OpenAI에 채팅 완료(chat completions) 요청을 보내는 함수 (429 시 Retry-After만큼 기다렸다 재시도)
+def request_completion(messages, max_completion_tokens, **options):
+    return gpt_rate_limiter.call(
+        lambda: client.chat.completions.create(model=deployment, messages=messages,
+                                               max_completion_tokens=max_completion_tokens, **options),
+        estimate_tokens(messages, max_completion_tokens),
+        is_rate_limited=is_rate_limit_error,
+        is_retryable=is_retryable_error,
+        usage_of=lambda result: result.usage.total_tokens if result.usage else None,
+    )
+
+# 기사 내용(텍스트)을 받아 GPT 모델에 요약 및 신뢰도 평가를 요청하는 함수
+# 성공하면 {'raw': 원본 응답, 'summary': 요약, 'reliability': 신뢰도, 'tokens': 사용 토큰 수}를,
+# 재시도까지 모두 실패하면 None을 반환. 같은 내용은 gpt_cache에서 바로 꺼내 씀
+# (use_cache=False는 이미 캐시를 확인한 묶음 평가에서 사용)
+def gpt_evaluate(article_text, selected_sources, use_cache=True):
+    cache_key = make_cache_key(deployment, PROMPT_VERSION, selected_sources, article_text)
+    cached = gpt_cache.get(cache_key) if use_cache else None  # 같은 배포/프롬프트/기사 내용으로 평가한 적이 있으면 재사용
+    if cached is not None:
+        print("  -> [캐시 사용] GPT 평가 결과")
+        return cached
+    messages = build_evaluation_messages(selected_sources, article_text)
     try:  # 오류 발생 가능성이 있는 코드를 try 블록 안에 작성
-        # 설정된 클라이언트를 통해 Azure OpenAI에 채팅 완료(chat completions) 요청을 보냄
-        completion = client.chat.completions.create(model=deployment, messages=messages, max_completion_tokens=1024)
-        # AI가 생성한 답변 텍스트를 반환 (앞뒤 공백 제거)
-        return completion.choices[0].message.content.strip()
-    except Exception as e:  # 오류 발생 시
-        return f"GPT 평가 오류: {e}"  # 오류 메시지를 포함한 문자열을 반환
+        completion = request_completion(messages, max_completion_tokens=1024)
+    except Exception as e:  # 재시도까지 모두 실패하거나 재시도할 수 없는 오류가 발생한 경우
+        print(f"  [오류] GPT 평가 오류: {e}")
+        return None  # 오류 문자열이 요약으로 파싱되거나 캐시되지 않도록 None을 반환
+    # AI가 생성한 답변 텍스트 (앞뒤 공백 제거)
+    evaluation_text = completion.choices[0].message.content.strip()
+
+    # [디버깅 코드] AI의 실제 응답을 터미널에 그대로 출력
+    print("---------- GPT Raw Response ----------")
+    print(evaluation_text)
+    print("------------------------------------")
+
+    summary_text, reliability = parse_evaluation(evaluation_text)
+    tokens = completion.usage.total_tokens if completion.usage else 0
+    result = {'raw': evaluation_text, 'summary': summary_text or "요약 정보 없음",
+              'reliability': reliability or "알 수 없음", 'tokens': tokens}
+    if use_cache and summary_text:  # 형식에 맞는 응답만 저장 (형식이 깨진 응답은 다음 실행에서 다시 평가)
+        gpt_cache.put(cache_key, evaluation_text, result['summary'], result['reliability'], tokens)
+    return result
+
+# 여러 기사를 하나의 요청에 담아 평가를 요청하고 (원본 응답, 사용 토큰 수)를 반환하는 함수
+def request_gpt_batch(article_texts, selected_sources):
+    messages = build_evaluation_messages(selected_sources, build_batch_content(article_texts), BATCH_FORMAT_INSTRUCTION)
+    max_completion_tokens = min(GPT_BATCH_COMPLETION_TOKENS * len(article_texts), 16384)  # 기사 수에 비례해 응답 길이 확보
+    try:
+        completion = request_completion(messages, max_completion_tokens, response_format={"type": "json_object"})
+    except openai.BadRequestError as e:  # 콘텐츠 필터 등으로 묶음이 거절되면 나누어서 문제 기사를 분리
+        raise BatchRejected(str(e)) from e
+    return completion.choices[0].message.content, (completion.usage.total_tokens if completion.usage else 0)
+
+# 기사 여러 개를 묶음으로 평가하는 객체 (응답을 해석하지 못하면 묶음을 나누어 재시도)
+gpt_batch_evaluator = BatchEvaluator(
+    request_batch=lambda texts: request_gpt_batch(texts, user_selected_sources),
+    evaluate_single=lambda text: gpt_evaluate(text, user_selected_sources, use_cache=False),
+)
+
+# 여러 기사 내용을 한 번에 평가하는 함수 (결과는 gpt_evaluate와 같은 형식의 목록)
+# 캐시에 있는 기사는 바로 꺼내 쓰고, 같은 내용의 기사는 한 번만 평가하며, 나머지만 묶음으로 요청
+def gpt_evaluate_batch(article_texts, selected_sources):
+    results = [None] * len(article_texts)
+    pending = {}  # 캐시 키 → 같은 내용을 가진 기사들의 위치
+    for i, article_text in enumerate(article_texts):
+        cache_key = make_cache_key(deployment, PROMPT_VERSION, selected_sources, article_text)
+        if cache_key in pending:
+            pending[cache_key].append(i)
+            continue
+        cached = gpt_cache.get(cache_key)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending[cache_key] = [i]
+    if pending:
+        keys = list(pending)
+        evaluations = gpt_batch_evaluator.evaluate([article_texts[pending[key][0]] for key in keys])
+        for key, evaluation in zip(keys, evaluations):
+            if evaluation is not None and evaluation['summary'] != "요약 정보 없음":
+                gpt_cache.put(key, evaluation['raw'], evaluation['summary'], evaluation['reliability'], evaluation['tokens'])
+            for i in pending[key]:
+                results[i] = evaluation
+    return results
 
 # ================================
 # 7. Azure 번역 함수
 # ================================
+# 여러 기사의 번역 요청을 한도(요청당 100개, 5만 자) 안에서 묶어 동시에 보내는 번역 클라이언트
+azure_translator = AzureTranslator(translator_endpoint, translator_key, translator_location,
+                                   session=http_client, max_workers=TRANSLATOR_MAX_CONCURRENCY)
+
+# 이전 실행에서 번역한 문장을 언어별로 재사용하기 위한 번역 메모리 (번역 오류는 저장하지 않음)
+translation_memory = TranslationMemory(os.path.join(cache_path, 'translation_memory.sqlite3'),
+                                       max_entries=TRANSLATION_MEMORY_MAX_ENTRIES)
+
+# 여러 텍스트를 한 번에 지정된 여러 언어로 번역하는 함수 (결과는 같은 순서의 {언어코드: 번역문} 목록)
+# 번역 메모리에 있는 언어는 그대로 쓰고, 빠진 언어만 모아서 Azure 번역 API에 요청
+def translate_many(texts_to_translate, target_languages):
+    results = translation_memory.lookup(texts_to_translate, 'ko', target_languages)
+    # 빠진 언어 조합 → {텍스트: 그 텍스트가 나온 위치 목록} (같은 텍스트는 한 번만 요청)
+    missing_groups = {}
+    for i, (text, found) in enumerate(zip(texts_to_translate, results)):
+        missing = tuple(lang for lang in target_languages if lang not in found)
+        if missing:
+            missing_groups.setdefault(missing, {}).setdefault(text, []).append(i)
+    for missing, positions in missing_groups.items():
+        texts = list(positions)
+        translations = azure_translator.translate(texts, list(missing))
+        learned = {}  # 번역에 성공한 텍스트 → {언어코드: 번역문}
+        for text, translation in zip(texts, translations):
+            if translation is not None:  # 실패한 요청의 결과는 메모리에 저장하지 않음
+                learned[text] = {lang: translated for lang, translated in translation.items() if lang in missing and translated}
+        translation_memory.store('ko', learned.items())
+        for text, translated in learned.items():
+            for i in positions[text]:
+                results[i].update(translated)
+    # 번역에 실패한 언어는 "번역 오류" 메시지로 채움
+    return [{lang: found.get(lang, "번역 오류") for lang in target_languages} for found in results]
+
 # 텍스트를 받아 지정된 여러 언어로 번역하는 함수
 def translate_with_azure(text_to_translate, target_languages):
-    headers = {'Ocp-Apim-Subscription-Key': translator_key, ...}  # 요청 헤더에 인증 키 등을 포함
-    params = {'api-version': '3.0', 'from': 'ko', 'to': target_languages}  # 요청 파라미터에 API 버전, 출발/도착 언어 등을 설정
-    body = [{'text': text_to_translate}]  # 요청 본문에 번역할 텍스트를 포함
-    try:  # 오류 발생 가능성이 있는 코드를 try 블록 안에 작성
-        # requests 라이브러리로 Azure 번역 API에 POST 요청을 보냄
-        response = requests.post(f"{translator_endpoint}/translate", params=params, headers=headers, json=body)
-        response.raise_for_status()  # HTTP 요청 실패 시 오류 발생
-        translations = response.json()  # 응답받은 JSON 데이터를 파싱
-        # 번역 결과를 {언어코드: 번역된 텍스트} 형태의 딕셔너리로 만들어 반환
-        return {t['to']: t['text'] for t in translations[0]['translations']}
-    except Exception as e:  # 오류 발생 시
-        print(f"Azure 번역 API 오류: {e}")
-        return {lang: "번역 오류" for lang in target_languages}  # 각 언어에 대해 "번역 오류" 메시지를 담은 딕셔너리 반환
+    return translate_many([text_to_translate], target_languages)[0]
 
 # ================================
-# 8. HTML 저장 함수
+# 8. 기사 저장소와 HTML 저장 함수
 # ================================
-# 수집하고 처리한 기사 목록을 받아 하나의 HTML 파일로 저장하는 함수
+target_languages = ['en', 'ja', 'fr', 'zh-Hans']  # 번역할 목표 언어 목록
+# 처리가 끝난 기사를 쌓아 두는 저장소 (HTML 페이지는 이 저장소에서 읽어서 만듦)
+article_store = ArticleStore(os.path.join(save_path, 'articles.sqlite3'))
+
+# 저장된 기사에서 HTML에 쓸 언어별 내용을 만드는 함수 (한국어는 제목과 요약/신뢰도, 나머지 언어는 번역된 제목)
+def article_translations(article):
+    summary_text, reliability = article['summaries']['ko'], article['reliability']
+    # 신뢰도 등급에 따라 HTML에서 사용할 CSS 클래스 이름을 결정
+    reliability_class = {"높음": "high", "보통": "medium"}.get(reliability, "low")
+    # 요약과 신뢰도 정보를 포함하는 HTML 조각을 생성
+    summary_html = f"<div class='summary'>{summary_text.replace('\n', '<br>')}<span class='reliability {reliability_class}'>신뢰도: {reliability}</span></div>"
+    translations = {'ko': {'title': article['titles']['ko'], 'summary_html': summary_html}}
+    for lang in target_languages:
+        translations[lang] = article['titles'].get(lang, "번역 오류")
+    return translations
+
+# 기사 목록을 받아 하나의 HTML 파일로 저장하는 함수
 def save_news_with_translations(main_category, sub_category, articles):
     main_path = os.path.join(save_path, main_category)  # 대분류 폴더 경로 생성
     os.makedirs(main_path, exist_ok=True)  # 폴더가 없으면 생성
@@ -228,8 +513,11 @@ def save_news_with_translations(main_category, sub_category, articles):
                 f.write("<span class='no-image-text'>[이미지 없음]</span>")  # 텍스트로 표시
             
             f.write(f"<p><b>언론사:</b> {article['source']} | <b>발행 시간:</b> {article['date']}</p>")  # 언론사와 발행 시간 표시
+            if article.get('related'):  # 같은 사건을 보도한 다른 언론사의 기사가 있으면 함께 표시 (언론사 비교용)
+                links = ", ".join(f"<a href='{related['link']}'>{related['source']}</a>" for related in article['related'])
+                f.write(f"<p class='related'><b>같은 소식을 다룬 언론사:</b> {links}</p>")
             f.write('<div class="content-wrapper">')  # 제목과 요약을 감싸는 div 생성
-            for lang, content in article['translations'].items():  # 각 언어별 번역 내용에 대해 반복
+            for lang, content in article_translations(article).items():  # 각 언어별 번역 내용에 대해 반복
                 active_class = "active" if lang == 'ko' else ""  # 한국어 콘텐츠는 기본으로 보이도록 'active' 클래스 추가
                 # ... 언어별 제목과 요약 내용을 HTML 구조에 맞게 작성 ...
             f.write('</div></div>')
@@ -238,60 +526,370 @@ def save_news_with_translations(main_category, sub_category, articles):
         f.write('<script>function changeAllLanguages(lang){...}</script>')
         f.write("</body></html>")  # HTML 파일 닫기
 
+# 검색 서버가 HTML을 다시 분석하지 않고 바로 읽을 수 있도록 기사 스냅샷을 저장하는 폴더
+snapshot_path = os.path.join(save_path, 'snapshot')
+
+# 저장된 기사를 스냅샷(검색 서버의 응답) 형식으로 바꾸는 함수 (HTML에서 읽던 항목 + 카테고리, 언어별 제목/요약, 관련 기사)
+def snapshot_record(article):
+    return {
+        'id': article['id'], 'title': article['titles']['ko'], 'link': article['link'], 'imageUrl': article['image_url'],
+        'source': article['source'], 'date': article['date'], 'summary': article['summaries']['ko'],
+        'reliability': article['reliability'], 'categories': article['categories'],
+        'translatedTitles': article['titles'], 'translatedSummaries': article['summaries'], 'related': article['related'],
+    }
+
+# 스냅샷을 기사 저장소에 맞추는 함수
+# 스냅샷이 없으면(또는 조각의 파일 구성이 바뀌었으면) 모든 기사로 만들고, 있으면 마지막으로 내보낸 뒤에 저장되거나 바뀐 기사만 새 조각으로 덧붙임
+# (MANIFEST의 watermark에 내보낸 기사의 마지막 저장 시각을 기록해 둠)
+def export_snapshot():
+    manifest = read_manifest(snapshot_path)
+    if manifest is not None and manifest.get('version') != SNAPSHOT_VERSION:
+        manifest = None
+    watermark = manifest['watermark'] if manifest else None
+    articles = article_store.export(updated_since=watermark)
+    if manifest is not None and not articles:
+        return
+    records = [snapshot_record(article) for article in articles]
+    watermark = max([article['updated_at'] for article in articles], default=watermark)
+    if manifest is None:
+        segment = write_snapshot(snapshot_path, records, watermark)
+    else:
+        segment = append_snapshot(snapshot_path, records, watermark)
+    print(f"[스냅샷] 기사 {len(records)}개를 조각 {segment}에 저장 완료")
+
+# 소분류의 최근 기사들을 기사 저장소에서 최신순으로 읽어 HTML 파일로 저장하는 함수
+def render_sub_category(main_category, sub_category):
+    articles = article_store.list(main_category, sub_category, since=one_month_ago.strftime('%Y-%m-%d %H:%M:%S'),
+                                  limit=RENDER_MAX_ARTICLES)
+    save_news_with_translations(main_category, sub_category, articles)
+    return len(articles)
+
 # ================================
-# 9. 메인 실행 루프
+# 9. 메인 실행 (asyncio 파이프라인)
 # ================================
-target_languages = ['en', 'ja', 'fr', 'zh-Hans']  # 번역할 목표 언어 목록
+# 단계별 동시 실행 수 (수집 → 주소 변환 → 본문 수집 → 묶기 → GPT 평가 → 번역 → 저장)
+# 수집 단계의 값은 동시에 받는 RSS 피드 수의 전체 상한 (분석은 feed_fetcher의 작업자 풀에서 따로 실행)
+# 본문 수집은 언론사별 동시 요청 수를 page_fetcher가 따로 제한하므로, 여러 언론사를 함께 받을 수 있도록 크게 둠
+PIPELINE_CONCURRENCY = {'fetch': 16, 'resolve': 8, 'scrape': 32, 'cluster': 4, 'evaluate': 4, 'translate': 4, 'render': 1}
+PIPELINE_QUEUE_SIZE = 100  # 단계 사이 대기열의 최대 크기 (뒷 단계가 밀리면 앞 단계가 기다림)
+render_collector = GroupCollector()  # 피드별로 모든 기사가 처리될 때까지 결과를 모아 두는 객체
+# 피드 주소 → 이번 실행에서 읽은 피드 정보 (이 피드를 쓰는 소분류 목록, 전체 기사 키 순서, 조건부 요청 정보, 처리할 기사 수)
+feed_snapshots = {}
+# 여러 피드에 함께 나온 기사는 한 번만 처리하고 결과를 공유하기 위한 색인 (이전 실행의 결과도 재사용)
+article_index = DedupIndex(os.path.join(cache_path, 'dedup_index.sqlite3'), max_age_days=DEDUP_MAX_AGE_DAYS)
+# 같은 사건을 다룬 여러 언론사의 기사를 묶어, 묶음마다 대표 기사 하나만 GPT로 평가하기 위한 객체
+story_clusters = StoryClusters(threshold=STORY_CLUSTER_THRESHOLD, num_perm=STORY_CLUSTER_NUM_PERM,
+                               shingle_size=STORY_CLUSTER_SHINGLE_SIZE, min_length=STORY_CLUSTER_MIN_LENGTH)
+# 기사가 단계를 마칠 때마다 상태를 저장해 두어, 프로세스가 중간에 죽어도 다음 실행이 마친 단계를 건너뛰도록 하는 객체
+run_checkpoint = RunCheckpoint(os.path.join(cache_path, 'run_checkpoint.sqlite3'),
+                               stages=('resolve', 'scrape', 'evaluate', 'translate'),
+                               max_age_hours=RUN_CHECKPOINT_MAX_AGE_HOURS, heartbeat_seconds=RUN_HEARTBEAT_SECONDS,
+                               stale_seconds=RUN_STALE_SECONDS)
+
+# 이어받은 실행에서 이 기사가 이미 마친 단계가 있으면 그때의 기사 상태를 되살림 (기사 키: 피드 항목의 지문)
+def restore_checkpoint(item):
+    saved = run_checkpoint.load(item['article']['fingerprint'])
+    if saved is not None:
+        item['checkpoint'], state = saved
+        item['article'] = state['article']
+        if state.get('article_data') is not None:
+            item['article_data'] = state['article_data']
+
+# 체크포인트에서 되살린 기사가 stage 단계를 이미 마쳤는지 확인하는 함수
+def completed(item, stage):
+    return run_checkpoint.passed(item.get('checkpoint'), stage)
+
+# stage 단계를 마친 기사들의 상태를 체크포인트로 저장하는 함수 (스레드에서 실행)
+def save_checkpoint(stage, items):
+    run_checkpoint.save(stage, [(item['article']['fingerprint'],
+                                 {'article': item['article'], 'article_data': item.get('article_data')})
+                                for item in items])
+
+# [수집 단계] RSS 피드 하나를 읽어 기사별 작업 항목으로 나눔 (여러 피드를 동시에 받고, 받는 대로 다음 단계로 넘김)
+async def stage_fetch(job):
+    news_url, targets = job  # 피드 주소, 이 피드를 쓰는 (대분류, 소분류) 목록
+    names = ", ".join(f"[{main_category}] {sub_category}" for main_category, sub_category in targets)
+    print(f"{names} 뉴스 수집 중...")  # 현재 수집 중인 카테고리 출력
+    feed = await fetch_news(news_url)  # 해당 피드의 뉴스 기사들을 수집
+    if feed is None:  # 피드가 바뀌지 않았거나 수집에 실패했으면
+        return None  # 다음 단계로 넘길 기사가 없음
+    articles = feed['articles']
+    # 이전 실행에서 처리한 기사와 비교하여 새 기사와 내용이 바뀐 기사만 다음 단계로 넘김
+    pending = feed_store.diff(feed['url'], [(article['entry_key'], article['fingerprint']) for article in articles])
+    changed_articles = [article for article in articles if article['entry_key'] in pending]
+    if not changed_articles:  # 처리할 기사가 없으면
+        print("  -> 수집된 뉴스가 없습니다." if not articles else "  -> 새로 나온 뉴스나 바뀐 뉴스가 없습니다.")
+        feed_store.save_validators(feed['url'], feed['etag'], feed['last_modified'])
+        return None  # 다음 단계로 넘길 기사가 없음
+    group = feed['url']
+    feed_snapshots[group] = {'targets': targets, 'keys': [article['entry_key'] for article in articles],
+                             'etag': feed['etag'], 'last_modified': feed['last_modified'], 'pending': len(changed_articles)}
+    print(f"  -> {names}: 전체 {len(articles)}개 중 새 기사/바뀐 기사 {len(changed_articles)}개 처리")
+    # 저장 단계에서 원래 순서대로 모을 수 있도록 피드 주소, 순번, 전체 개수를 함께 넘김
+    items = [{'group': group, 'index': i, 'total': len(changed_articles), 'article': article}
+             for i, article in enumerate(changed_articles)]
+    # 다른 피드에서 이미 처리했거나 처리 중인 기사는 그 결과를 함께 쓰고, 처음 보는 기사만 다음 단계로 넘김
+    new_items = []
+    for item in items:
+        article = item['article']
+        # 피드 항목의 지문(링크, 제목, 언론사, 발행 시각)과 언론사+제목 지문으로 비교 (제목이 바뀌면 다시 처리됨)
+        keys = ['entry:' + article['fingerprint'], 'title:' + title_fingerprint(article['title'], article['source'])]
+        status, shared = article_index.claim(item, keys, 'resolve')
+        if status == DONE:
+            await deliver_shared(item, shared)
+        elif status == LEAD:
+            restore_checkpoint(item)  # 중간에 멈춘 이전 실행에서 처리하던 기사면 마친 단계까지 되살림
+            new_items.append(item)
+    return new_items or None
+
+# 구글 뉴스 링크를 원문 주소와 대표 이미지 주소로 변환하는 함수
+def resolve_item(item):
+    article = item['article']
+    print(f"Processing '{article['title'][:30]}...'")  # 처리 중인 기사 제목 출력
+    article_info = get_original_article_info(article['google_link'])  # 원문 주소와 이미지 주소 추출
+    article['link'] = article_info['original_url']
+    article['image_url'] = article_info['image_url']
+
+# [주소 변환 단계] 원문 주소를 찾은 뒤, 같은 원문 주소의 기사를 다른 항목이 처리했거나 처리 중이면 그 결과를 함께 씀
+async def stage_resolve(item):
+    if not completed(item, 'resolve'):
+        await to_thread(resolve_item, item)
+        await to_thread(save_checkpoint, 'resolve', [item])
+    link = item['article']['link']
+    if "news.google.com" in link:  # 원문 주소를 찾지 못했으면 비교할 주소가 없음
+        return item
+    # 원문 주소는 기사가 고쳐져도 그대로이므로 이번 실행 안에서만 비교 (이전 실행의 결과는 제목/지문으로만 재사용)
+    status, shared = article_index.claim(item, ['url:' + canonical_url(link)], 'scrape', persist=False)
+    if status == DONE:
+        await deliver_shared(item, shared)
+    return item if status == LEAD else None
+
+# [본문 수집 단계] 원문 페이지에서 본문을 가져오고, 실패하면 제목을 내용으로 사용
+def stage_scrape(item):
+    if completed(item, 'scrape'):
+        return item
+    article = item['article']
+    body_text = None  # 본문 텍스트 초기화
+    if "news.google.com" not in article['link']:  # 원문 주소 변환에 성공했다면
+        body_text = scrape_article_body(article['link'])  # 본문 텍스트 수집
+    article['content'] = body_text if body_text else article['title']  # 본문 수집 성공 시 본문을, 실패 시 제목을 content로 사용
+    save_checkpoint('scrape', [item])
+    return item
+
+# 평가 결과(요약, 신뢰도)를 기사에 넣는 함수
+def apply_evaluation(article, evaluation):
+    if evaluation is None:  # 평가에 실패한 기사는 기본값으로 저장
+        article['summary_text'], article['reliability'] = "요약 정보 없음", "알 수 없음"
+    else:  # 요약 추출에 실패하면 "요약 정보 없음", 신뢰도 추출에 실패하면 "알 수 없음"이 들어 있음
+        article['summary_text'], article['reliability'] = evaluation['summary'], evaluation['reliability']
+
+# [묶기 단계] 본문이 비슷한 기사(같은 사건을 다룬 다른 언론사의 기사)를 묶어, 묶음마다 대표 기사만 평가하도록 함
+# 대표가 평가 중이면 기다렸다가 평가 단계에서 함께 넘겨지고, 이미 평가됐으면 그 결과를 넣어 바로 넘김
+# (이어받은 실행에서 평가까지 마친 기사는 묶지 않고 그대로 넘김)
+async def stage_cluster(item):
+    if completed(item, 'evaluate'):
+        return item
+    article = item['article']
+    signature = await to_thread(story_clusters.signature, article['content'])  # 서명 계산은 스레드에서
+    metadata = {'source': article['source'], 'title': article['title'], 'link': article['link']}
+    status, evaluation = story_clusters.claim(item, signature, metadata)
+    if status == STORY_DONE:
+        apply_evaluation(article, evaluation)
+    return None if status == STORY_WAIT else item
+
+# [GPT 평가 단계] 기사 내용을 요약하고 신뢰도를 평가 (GPT_BATCH_SIZE개씩 묶어서 요청)
+# 묶음의 대표 기사를 평가하면 그 결과를 기다리던 같은 묶음의 기사에도 넣어 함께 다음 단계로 넘김
+async def stage_evaluate(items):
+    ready = [item for item in items if 'summary_text' in item['article']]  # 같은 묶음의 평가 결과를 이미 받은 기사
+    pending = [item for item in items if 'summary_text' not in item['article']]
+    while pending:
+        for item in pending:
+            print(f"  - '{item['article']['title'][:30]}...' GPT 평가 및 번역 중...")  # 처리 중인 기사 제목 출력
+        # 기사 내용(content)을 GPT에 보내 요약 및 평가를 받음 (호출 속도는 gpt_rate_limiter가 조절)
+        evaluations = await to_thread(gpt_evaluate_batch, [item['article']['content'] for item in pending],
+                                              user_selected_sources)
+        retry = []  # 대표의 평가가 실패한 묶음에서 기다리던 기사 (각자 평가)
+        for item, evaluation in zip(pending, evaluations):
+            apply_evaluation(item['article'], evaluation)
+            ready.append(item)
+            if evaluation is None:
+                retry += story_clusters.fail(item)
+                continue
+            for follower in story_clusters.finish(item, evaluation):
+                apply_evaluation(follower['article'], evaluation)
+                ready.append(follower)
+        pending = retry
+    # 평가에 실패한 기사는 체크포인트를 남기지 않아 다음 실행에서 다시 평가됨
+    await to_thread(save_checkpoint, 'evaluate', [
+        item for item in ready if not completed(item, 'evaluate') and item['article']['summary_text'] != "요약 정보 없음"])
+    return ready
+
+# [번역 단계] 여러 기사의 제목과 요약을 한 번에 번역하고 기사 저장소에 저장할 기사 데이터를 완성
+# (제목과 요약을 따로 번역해야 여러 언론사가 같은 제목을 쓸 때 번역 메모리에서 재사용할 수 있음)
+# (이어받은 실행에서 번역까지 마친 기사는 체크포인트의 기사 데이터를 그대로 씀)
+def stage_translate(items):
+    pending = [item for item in items if not completed(item, 'translate')]
+    texts = []
+    for item in pending:
+        texts += [item['article']['title'], item['article']['summary_text']]
+    # 기사 제목과 요약문을 모아 Azure 번역 서비스에 묶음으로 보내 번역
+    all_translations = translate_many(texts, target_languages) if texts else []
+    for i, item in enumerate(pending):
+        article = item['article']
+        # 제목과 요약의 언어별 번역 결과
+        translated_titles, translated_summaries = all_translations[2 * i], all_translations[2 * i + 1]
+        # 기사 저장소에 저장할 기사 데이터 (언어별 제목과 요약)
+        item['article_data'] = {
+            'link': article['link'], 'image_url': article['image_url'], 'source': article['source'], 'date': article['date'],
+            'reliability': article['reliability'],
+            'titles': {'ko': article['title'], **{lang: translated_titles.get(lang, "번역 오류") for lang in target_languages}},
+            'summaries': {'ko': article['summary_text'],
+                          **{lang: translated_summaries.get(lang, "번역 오류") for lang in target_languages}},
+        }
+    # 번역에 실패한 언어가 있는 기사는 체크포인트를 남기지 않아 다음 실행에서 다시 번역됨
+    save_checkpoint('translate', [item for item in pending
+                                  if "번역 오류" not in (*item['article_data']['titles'].values(),
+                                                       *item['article_data']['summaries'].values())])
+    return items
+
+# 평가나 번역에 실패한 값이 들어 있는 기사 데이터인지 (다음 실행에서 다시 처리되도록 실행 간 기록에 남기지 않음)
+def has_failed_values(article_data):
+    return article_data['summaries']['ko'] == "요약 정보 없음" or "번역 오류" in (
+        *article_data['titles'].values(), *article_data['summaries'].values())
+
+# 기사 저장소에서 같은 기사를 알아보는 키 (원문 주소를 찾지 못한 기사는 구글 뉴스 링크)
+def article_key(article_data):
+    link = article_data['link']
+    return link if "news.google.com" in link else 'url:' + canonical_url(link)
+
+# 피드의 모든 기사가 모이면 새로 처리한 기사를 기사 저장소에 추가하고,
+# 이 피드를 쓰는 모든 소분류의 HTML 파일을 저장소의 최근 기사로 다시 만듦
+def render_group(group, results):
+    news_url = group
+    feed = feed_snapshots.pop(group)
+    # results: (기사 키, 지문, 기사 데이터) 목록, 이 피드의 새 기사들은 한 트랜잭션으로 저장 (같은 기사는 갱신)
+    article_store.save(feed['targets'], [(article_key(article_data), article_data) for _, _, article_data in results])
+    # 평가나 번역에 실패한 기사는 결과 없이 기록하여 다음 실행의 diff()에서 처리를 끝내지 못한 기사로 다시 넘겨짐
+    failed = [has_failed_values(article_data) for _, _, article_data in results]
+    feed_store.remember(news_url, [(key, fingerprint, None if failure else article_data)
+                                   for (key, fingerprint, article_data), failure in zip(results, failed)])
+    # 모두 처리했을 때만 조건부 요청 정보 저장 (빠지거나 실패한 기사가 있으면 다음 실행에서 304 없이 피드를 다시 받아 시도)
+    if len(results) == feed['pending'] and not any(failed):
+        feed_store.save_validators(news_url, feed['etag'], feed['last_modified'])
+    for main_category, sub_category in feed['targets']:
+        count = render_sub_category(main_category, sub_category)
+        print(f"  -> [{sub_category}] 새로 처리한 {len(results)}개를 포함하여 {count}개 뉴스 저장 완료.")
+
+# 처리된 기사를 피드별로 모으고, 다 모이면 저장하는 함수
+# (모으는 작업은 이벤트 루프에서만 하도록 async 함수로 두고, 파일 쓰기만 스레드에서 실행)
+async def deliver(item, article_data):
+    article = item['article']
+    results = render_collector.add(item, (article['entry_key'], article['fingerprint'], article_data))
+    if results is not None:
+        await to_thread(render_group, item['group'], results)
+
+# 기사의 처리 결과를 색인에 기록하고, 같은 기사를 기다리던 다른 피드의 항목에도 같은 결과를 넘기는 함수
+# (디스크 색인 저장은 SQLite 쓰기이므로 스레드에서 실행해 다른 단계를 막지 않음)
+# (평가나 번역에 실패한 결과는 이번 실행의 같은 기사에만 넘기고 디스크에는 저장하지 않아 다음 실행에서 다시 처리됨)
+async def deliver_shared(item, article_data):
+    followers, keys = article_index.finish(item, article_data)
+    if not has_failed_values(article_data):
+        await to_thread(article_index.store, keys, article_data)
+    for target in [item, *followers]:
+        await deliver(target, article_data)
+
+# [저장 단계] 처리된 기사를 피드별로 모으고, 다 모이면 저장
+async def stage_render(item):
+    item['article_data']['related'] = story_clusters.related(item)  # 저장하는 시점까지 같은 묶음에 들어온 다른 언론사 기사
+    await deliver_shared(item, item['article_data'])
+    return None
+
+# 중간 단계에서 실패한 기사(와 그 결과를 기다리던 같은 묶음의 기사, 다른 피드의 같은 기사)는 빼고,
+# 같은 피드의 나머지 기사는 정상적으로 저장되도록 처리
+def on_stage_error(stage, item, error):
+    if stage.name == 'fetch':
+        return  # 피드 단위 작업이므로 기다리는 기사 묶음이 없음
+    for failed in [item, *story_clusters.fail(item)]:  # 평가 결과를 기다리던 같은 묶음의 기사도 함께 뺌
+        for dropped in [failed, *article_index.fail(failed)]:
+            results = render_collector.discard(dropped)
+            if results is not None:
+                render_group(dropped['group'], results)
+
+async def main():
+    # 중간에 멈춘 이전 실행이 있으면 이어받아 체크포인트가 있는 기사는 마친 단계를 건너뜀
+    # (이전 실행이 아직 진행 중이면 같은 기사를 두 번 처리하지 않도록 이번 실행은 하지 않음)
+    run_id = run_checkpoint.start_run()
+    if run_id is None:
+        print("[실행] 이전 실행이 아직 진행 중이므로 이번 실행은 건너뜁니다.")
+        return
+    # 실행 중에만 쓰는 중복 기사/비슷한 기사 정보는 실행마다 새로 시작 (서버에서 여러 번 실행될 수 있음)
+    article_index.start_run()
+    story_clusters.start_run()
+    # 첫 기사가 브라우저로 원문 주소를 찾을 때 크롬 기동을 기다리지 않도록, 피드를 받는 동안 브라우저를 미리 띄움
+    warm_up = asyncio.create_task(asyncio.to_thread(warm_up_browsers))
+    if run_checkpoint.resumed:
+        print(f"[실행 {run_id}] 중간에 멈춘 실행을 이어서 처리합니다. (저장된 기사 {run_checkpoint.pending()}개)")
+    else:
+        print(f"[실행 {run_id}] 새 실행을 시작합니다.")
+    # 사용자가 선택한 대분류의 소분류들이 쓰는 피드만 작업 목록으로 만듦
+    # (여러 대분류에 같은 이름의 소분류가 있으면 피드는 한 번만 받고 결과를 각 소분류에 저장)
+    feeds = {}  # 피드 주소 → 이 피드를 쓰는 (대분류, 소분류) 목록
+    for main_category, sub_categories in categories.items():
+        if main_category in user_follow_categories:
+            for sub_category in sub_categories:
+                feeds.setdefault(feed_url(sub_category), []).append((main_category, sub_category))
+    jobs = list(feeds.items())
+    stages = [
+        Stage('fetch', stage_fetch, PIPELINE_CONCURRENCY['fetch']),
+        Stage('resolve', stage_resolve, PIPELINE_CONCURRENCY['resolve']),
+        Stage('scrape', stage_scrape, PIPELINE_CONCURRENCY['scrape']),
+        # 비슷한 기사를 묶어 대표 기사만 평가 단계에서 GPT로 평가
+        Stage('cluster', stage_cluster, PIPELINE_CONCURRENCY['cluster']),
+        # 평가 단계는 기사를 GPT_BATCH_SIZE개씩 묶어서 한 번에 요청
+        Stage('evaluate', stage_evaluate, PIPELINE_CONCURRENCY['evaluate'], batch_size=GPT_BATCH_SIZE, batch_wait=GPT_BATCH_WAIT),
+        # 번역 단계도 여러 기사를 모아 한 번의 요청(또는 소수의 동시 요청)으로 처리
+        Stage('translate', stage_translate, PIPELINE_CONCURRENCY['translate'], batch_size=TRANSLATE_BATCH_SIZE, batch_wait=TRANSLATE_BATCH_WAIT),
+        Stage('render', stage_render, PIPELINE_CONCURRENCY['render']),
+    ]
+    pipeline = Pipeline(stages, queue_size=PIPELINE_QUEUE_SIZE, on_error=on_stage_error)
+    stats = await pipeline.run(jobs)
+    await warm_up  # 풀을 닫기 전에 미리 띄우기가 끝나도록 기다림 (닫은 뒤에 띄운 브라우저가 남지 않게)
+    run_checkpoint.finish_run()  # 끝까지 실행된 경우에만 완료로 기록 (도중에 멈추면 다음 실행이 이어받음)
+    # 이번 실행에서 저장소에 추가되거나 바뀐 기사를 스냅샷에 덧붙임 (검색 서버는 MANIFEST가 바뀐 것을 보고 새 조각을 엶)
+    export_snapshot()
+    for name, stage_stats in stats.items():  # 단계별 처리 건수와 소요 시간 출력
+        print(f"[{name}] 처리 {stage_stats['processed']}건, 오류 {stage_stats['errors']}건, 작업 시간 {stage_stats['busy_seconds']:.1f}초")
 
-# `categories` 딕셔너리에 정의된 모든 카테고리에 대해 반복 실행
-for main_category, sub_categories in categories.items():
-    if main_category not in user_follow_categories: continue  # 사용자가 선택한 카테고리가 아니면 건너뜀
-    for sub_category in sub_categories:  # 대분류 안의 소분류에 대해 반복
-        print(f"[{main_category}] {sub_category} 뉴스 수집 중...")  # 현재 수집 중인 카테고리 출력
-        articles = fetch_news(sub_category)  # 해당 소분류의 뉴스 기사들을 수집
-        if not articles:  # 수집된 기사가 없으면
-            print("  -> 수집된 뉴스가 없습니다.")
-            continue  # 다음 소분류로 넘어감
-        processed_articles = []  # 처리된 기사 정보를 저장할 리스트
-        for article in articles:  # 수집된 각 기사에 대해 반복
-            print(f"  - '{article['title'][:30]}...' GPT 평가 및 번역 중...")  # 처리 중인 기사 제목 출력
-
-            # 기사 내용(content)을 GPT에 보내 요약 및 평가를 받음
-            evaluation_text = gpt_evaluate(article['content'], user_selected_sources)
-
-            # [디버깅 코드] AI의 실제 응답을 터미널에 그대로 출력
-            print("---------- GPT Raw Response ----------")
-            print(evaluation_text)
-            print("------------------------------------")
-
-            time.sleep(1)  # API에 너무 많은 요청을 짧은 시간에 보내지 않도록 1초 대기
-            # 정규 표현식을 사용해 GPT 응답에서 '1)'로 시작하는 요약 부분을 추출
-            summary_match = re.search(r'1\)(.*?)(?=2\)|\Z)', evaluation_text, re.DOTALL)
-            # 정규 표현식을 사용해 GPT 응답에서 '신뢰도:' 부분을 추출
-            reliability_match = re.search(r'신뢰도:\s*(높음|보통|낮음)', evaluation_text)
-            # 요약 추출에 성공하면 그 내용을, 실패하면 "요약 정보 없음"을 저장
-            summary_text = summary_match.group(1).strip() if summary_match else "요약 정보 없음"
-            # 신뢰도 추출에 성공하면 그 내용을, 실패하면 "알 수 없음"을 저장
-            reliability = reliability_match.group(1).strip() if reliability_match else "알 수 없음"
-            # 기사 제목과 요약문을 Azure 번역 서비스에 보내 번역
-            azure_translations = translate_with_azure(f"{article['title']}\n{summary_text}", target_languages)
-            # 번역된 결과에서 제목 부분만 추출
-            translated_titles = {lang: trans_text.split('\n', 1)[0] for lang, trans_text in azure_translations.items()}
-            # 신뢰도 등급에 따라 HTML에서 사용할 CSS 클래스 이름을 결정
-            reliability_class = {"높음": "high", "보통": "medium"}.get(reliability, "low")
-            # 요약과 신뢰도 정보를 포함하는 HTML 조각을 생성
-            summary_html = f"<div class='summary'>{summary_text.replace('\n', '<br>')}<span class='reliability {reliability_class}'>신뢰도: {reliability}</span></div>"
-            # 최종적으로 HTML 파일에 저장할 모든 기사 데이터를 딕셔너리 형태로 정리
-            article_data = {
-                'link': article['link'], 'image_url': article['image_url'], 'source': article['source'], 'date': article['date'],
-                'translations': {
-                    'ko': {'title': article['title'], 'summary_html': summary_html},
-                    'en': translated_titles.get('en', "번역 오류"), 'ja': translated_titles.get('ja', "번역 오류"),
-                    'fr': translated_titles.get('fr', "번역 오류"), 'zh-Hans': translated_titles.get('zh-Hans', "번역 오류")
-                }
-            }
-            processed_articles.append(article_data)  # 처리된 기사 데이터를 리스트에 추가
-        # 해당 소분류의 모든 기사 처리가 끝나면 HTML 파일로 저장
-        save_news_with_translations(main_category, sub_category, processed_articles)
-        print(f"  -> {len(processed_articles)}개 뉴스 저장 완료.")
-print("\n🎉 모든 뉴스 수집, 평가 및 번역 완료!")  # 모든 작업이 끝나면 완료 메시지 출력
+if __name__ == '__main__':
+    try:
+        asyncio.run(main())
+    finally:
+        browser_pool.close()  # 작업이 끝나면 풀에 남은 브라우저를 모두 종료
+        print(f"[원문 주소 디코더] {gnews_decoder.stats} (브라우저 없이 해결한 비율: {gnews_decoder.hit_rate():.0%})")
+        print(f"[원문 주소 캐시] {url_cache.stats}")
+        print(f"[RSS 수집] {feed_fetcher.stats}")
+        feed_fetcher.close()
+        print(f"[RSS 피드] {feed_store.stats}")
+        print(f"[기사 저장소] {article_store.stats}")
+        article_store.close()
+        print(f"[중복 기사] {article_index.stats}")  # avoided: 중복 기사를 공유하여 하지 않아도 된 단계별 호출 수
+        article_index.close()
+        feed_store.close()
+        print(f"[본문 수집기] {page_fetcher.stats}")
+        print(f"[페이지 스트리밍] {page_extractor.stats}")
+        print(f"[GPT 속도 제한기] {gpt_rate_limiter.stats}")
+        print(f"[번역 요청] {azure_translator.stats}")
+        azure_translator.close()
+        print(f"[번역 메모리] {translation_memory.stats}")
+        translation_memory.close()
+        for host, host_metrics in http_client.metrics().items():  # 호스트별 요청 수, 오류, 평균 지연, 연결 재사용 비율
+            print(f"[HTTP] {host}: {host_metrics}")
+        http_client.close()
+        print(f"[실행 체크포인트] {run_checkpoint.stats}")  # restored: 이어받은 실행에서 단계별로 건너뛴 기사 수
+        run_checkpoint.close()
+        print(f"[비슷한 기사 묶기] {story_clusters.stats}")  # shared: 대표 기사의 평가를 함께 써서 줄인 GPT 평가 수
+        print(f"[GPT 묶음 평가] {gpt_batch_evaluator.stats}")
+        print(f"[GPT 평가 캐시] {gpt_cache.stats} (적중률: {gpt_cache.hit_rate():.0%})")
+        gpt_cache.close()
+        url_cache.close()
+    print("\n🎉 모든 뉴스 수집, 평가 및 번역 완료!")  # 모든 작업이 끝나면 완료 메시지 출력
@@ -0,0 +1,192 @@
+# ================================
+# asyncio 기반 단계별 처리 파이프라인
+# ================================
+# 수집 → 원문 주소 변환 → 본문 수집 → GPT 평가 → 번역 → 저장 단계를 각각 작업자 풀로 만들고,
+# 단계 사이를 크기가 정해진 큐로 연결한다. 앞 단계가 기사 하나를 끝내는 즉시 다음 단계가
+# 이어서 처리하므로, 느린 외부 서비스(브라우저, GPT, 번역기)를 기다리는 시간이 서로 겹치게 된다.
+# 큐 크기가 정해져 있어 뒷 단계가 밀리면 앞 단계도 자연히 속도를 늦춘다(backpressure).
+import asyncio  # 비동기 작업자와 큐를 위한 라이브러리
+import contextvars  # 실행 중인 파이프라인의 스레드 풀을 단계 함수에 알려 주기 위한 도구
+import functools  # 스레드에서 실행할 함수에 인자 묶기
+import inspect  # 단계 함수가 async 함수인지 확인하기 위한 도구
+import time  # 단계별 처리 시간 측정
+from concurrent.futures import ThreadPoolExecutor  # 동기 함수(requests, selenium 등)를 실행할 스레드 풀
+
+_DONE = object()  # 큐에 더 이상 들어올 항목이 없음을 알리는 표시
+_executor = contextvars.ContextVar('pipeline_executor', default=None)  # 실행 중인 파이프라인의 스레드 풀
+
+
+async def to_thread(func, /, *args, **kwargs):
+    """
+    동기 함수를 스레드에서 실행합니다. (asyncio.to_thread와 같음)
+    파이프라인의 단계 안에서 부르면 이벤트 루프의 기본 스레드 풀 대신 그 파이프라인의 스레드 풀을 사용합니다.
+    """
+    executor = _executor.get()
+    if executor is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(context.run, func, *args, **kwargs))
+
+
+class Stage:
+    """
+    파이프라인의 한 단계입니다.
+    - handler: 항목 하나를 받아 처리하는 함수 (동기/비동기 모두 가능)
+      반환값이 리스트면 여러 항목으로 나누어 다음 단계로 넘기고, None이면 다음 단계로 넘기지 않습니다.
+    - concurrency: 이 단계에서 동시에 실행할 작업자 수
+    - batch_size: 지정하면 항목을 최대 batch_size개씩 모아 리스트로 handler에 넘깁니다.
+      이때 handler는 처리된 항목들의 리스트를 반환해야 합니다. (None이면 항목을 하나씩 넘김)
+    - batch_wait: 묶음을 채우기 위해 첫 항목 이후 기다릴 최대 시간(초)
+    """
+
+    def __init__(self, name, handler, concurrency=1, batch_size=None, batch_wait=1.0):
+        if concurrency < 1:
+            raise ValueError(f"'{name}' 단계의 동시 실행 수는 1 이상이어야 합니다.")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"'{name}' 단계의 묶음 크기는 1 이상이어야 합니다.")
+        self.name = name
+        self.handler = handler
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.stats = {'processed': 0, 'errors': 0, 'busy_seconds': 0.0}
+
+
+class Pipeline:
+    """
+    여러 Stage를 순서대로 연결한 파이프라인입니다.
+    - queue_size: 단계 사이 큐의 최대 크기
+    - on_error: 단계 함수에서 예외가 났을 때 호출되는 함수 (stage, item, exception)
+    """
+
+    def __init__(self, stages, queue_size=100, on_error=None):
+        if not stages:
+            raise ValueError("파이프라인에는 최소 한 개의 단계가 필요합니다.")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.on_error = on_error
+
+    async def _call(self, handler, item):
+        if inspect.iscoroutinefunction(handler):
+            return await handler(item)
+        return await to_thread(handler, item)  # 동기 함수는 스레드에서 실행하여 이벤트 루프를 막지 않음
+
+    async def _next_batch(self, stage, in_queue):
+        # 첫 항목은 올 때까지 기다리고, 이후로는 batch_wait 안에 들어오는 항목만 묶음에 추가
+        first = await in_queue.get()
+        if first is _DONE:
+            return [], True
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + stage.batch_wait
+        while len(batch) < stage.batch_size:
+            try:
+                item = in_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(0.05, remaining))  # 짧게 쉬면서 다음 항목이 들어오는지 확인
+                continue
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _worker(self, stage, in_queue, out_queue):
+        finished = False
+        while not finished:
+            if stage.batch_size is not None:
+                item, finished = await self._next_batch(stage, in_queue)
+                if not item:
+                    return
+            else:
+                item = await in_queue.get()
+                if item is _DONE:
+                    return
+            started = time.perf_counter()
+            try:
+                result = await self._call(stage.handler, item)
+            except Exception as e:
+                stage.stats['errors'] += 1
+                print(f"  [오류] '{stage.name}' 단계 처리 중 오류 발생: {e}")
+                if self.on_error:
+                    for failed_item in (item if stage.batch_size is not None else [item]):
+                        self.on_error(stage, failed_item, e)
+                continue
+            finally:
+                stage.stats['busy_seconds'] += time.perf_counter() - started
+            stage.stats['processed'] += len(item) if stage.batch_size is not None else 1
+            if out_queue is None or result is None:
+                continue
+            for next_item in (result if isinstance(result, list) else [result]):
+                await out_queue.put(next_item)  # 다음 단계 큐가 가득 차면 자리가 날 때까지 기다림
+
+    async def _run_stage(self, stage, in_queue, out_queue, next_concurrency):
+        workers = [asyncio.create_task(self._worker(stage, in_queue, out_queue)) for _ in range(stage.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        if out_queue is not None:  # 이 단계가 끝나면 다음 단계 작업자 수만큼 종료 표시를 보냄
+            for _ in range(next_concurrency):
+                await out_queue.put(_DONE)
+
+    async def run(self, inputs):
+        """입력 항목들을 첫 단계부터 흘려보내고, 모든 단계가 끝날 때까지 기다립니다."""
+        # 모든 단계의 작업자가 동시에 스레드를 쓸 수 있도록 크기를 맞춘 이 실행만의 스레드 풀
+        # (이벤트 루프의 기본 스레드 풀은 바꾸지 않으므로, 끝나고 닫아도 같은 루프의 다른 작업에 영향이 없음)
+        executor = ThreadPoolExecutor(max_workers=sum(stage.concurrency for stage in self.stages))
+        token = _executor.set(executor)  # 아래에서 만드는 작업들이 이 값을 물려받음
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        tasks = []
+        for i, stage in enumerate(self.stages):
+            out_queue = queues[i + 1] if i + 1 < len(self.stages) else None
+            next_concurrency = self.stages[i + 1].concurrency if out_queue is not None else 0
+            tasks.append(asyncio.create_task(self._run_stage(stage, queues[i], out_queue, next_concurrency)))
+
+        async def feed():
+            for item in inputs:
+                await queues[0].put(item)
+            for _ in range(self.stages[0].concurrency):
+                await queues[0].put(_DONE)
+
+        try:
+            await asyncio.gather(feed(), *tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            _executor.reset(token)
+            executor.shutdown(wait=False)
+        return {stage.name: dict(stage.stats) for stage in self.stages}
+
+
+class GroupCollector:
+    """
+    하나의 그룹(예: 소분류)에 속한 항목들이 모두 처리될 때까지 모아 두었다가,
+    원래 순서대로 정렬해서 넘겨주는 도우미입니다. 저장(렌더링) 단계에서 사용합니다.
+    각 항목은 'group', 'index', 'total' 키를 가진 딕셔너리여야 합니다.
+    """
+
+    def __init__(self):
+        self._results = {}  # 그룹 → {index: 결과}
+        self._finished = {}  # 그룹 → 처리가 끝난(성공 또는 실패) 항목 수
+
+    def _complete(self, item):
+        group = item['group']
+        self._finished[group] = self._finished.get(group, 0) + 1
+        if self._finished[group] < item['total']:
+            return None
+        results = self._results.pop(group, {})
+        del self._finished[group]
+        return [results[index] for index in sorted(results)]
+
+    def add(self, item, result):
+        """처리된 항목을 추가합니다. 그룹이 모두 모이면 정렬된 결과 목록을, 아니면 None을 반환합니다."""
+        self._results.setdefault(item['group'], {})[item['index']] = result
+        return self._complete(item)
+
+    def discard(self, item):
+        """중간 단계에서 실패한 항목을 처리 완료로 셉니다. 그룹이 모두 모이면 결과 목록을 반환합니다."""
+        return self._complete(item)
@@ -0,0 +1,239 @@
+# ================================
+# 언론사별 본문/이미지 추출 규칙과 한 번 훑기(single-pass) 추출기
+# ================================
+# 언론사마다 본문을 감싸는 태그, 빼야 할 문단(기자 정보, 광고, 사진 설명), 대표 이미지 위치가 다르다.
+# 도메인별 규칙을 등록해 두고, 규칙의 선택자들은 처음 한 번만 해석(compile)해 둔 뒤
+# 문서를 처음부터 끝까지 한 번만 훑으면서 본문 컨테이너, 문단, 이미지를 동시에 찾는다.
+# 새 언론사는 PUBLISHER_RULES에 PublisherRule을 추가하거나 RuleRegistry.register()로 등록하면 된다.
+import re  # 선택자 문자열 해석
+from urllib.parse import urlparse  # 기사 주소에서 도메인 추출
+
+from extractors import START, TEXT, END  # 추출 백엔드가 돌려주는 문서 훑기 이벤트
+
+_SELECTOR = re.compile(r"^([a-zA-Z][\w-]*)?((?:[#.][\w-]+|\[[^\]]+\])*)$")
+_SELECTOR_PART = re.compile(r"#([\w-]+)|\.([\w-]+)|\[\s*([\w:-]+)\s*(?:=\s*[\"']?([^\"'\]]*)[\"']?\s*)?\]")
+# 본문 텍스트를 줄 단위로 나눌 때 기준이 되는 블록 태그 (문단이 없는 컨테이너에서 사용)
+BLOCK_TAGS = frozenset(('br', 'p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'section'))
+
+
+class Selector:
+    """
+    '태그#id.class[속성=값]' 형식의 단순 선택자입니다. (자손/자식 결합자는 지원하지 않음)
+    '선택자@속성'처럼 쓰면 일치한 태그에서 꺼낼 속성 이름을 함께 지정합니다. (이미지 위치에 사용)
+    """
+
+    def __init__(self, text):
+        self.text = text
+        selector, _, self.attribute = text.partition('@')
+        match = _SELECTOR.match(selector.strip())
+        if not match or not selector.strip():
+            raise ValueError(f"지원하지 않는 선택자입니다: {text}")
+        self.tag = match.group(1).lower() if match.group(1) else None
+        self.id, self.classes, self.attributes = None, set(), []
+        for id_, class_, name, value in _SELECTOR_PART.findall(match.group(2)):
+            if id_:
+                self.id = id_
+            elif class_:
+                self.classes.add(class_)
+            else:
+                self.attributes.append((name, value if value else None))
+
+    def matches(self, tag, attrs):
+        if self.tag is not None and tag != self.tag:
+            return False
+        if self.id is not None and attrs.get('id') != self.id:
+            return False
+        if self.classes and not self.classes.issubset((attrs.get('class') or '').split()):
+            return False
+        for name, value in self.attributes:
+            if name not in attrs or (value is not None and attrs[name] != value):
+                return False
+        return True
+
+    def __repr__(self):
+        return f"Selector({self.text!r})"
+
+
+# 모든 규칙에 공통으로 적용하는 본문 안의 제외 대상 (사진/캡션, 기자 정보, 광고)
+DEFAULT_DROP = ['figure', 'figcaption', 'aside', '.byline', '.reporter', '.copyright', '.ad', '.caption']
+# 대표 이미지를 찾는 기본 위치 (앞에 있는 것이 우선)
+DEFAULT_IMAGE = ['meta[property=og:image]@content', 'meta[name=twitter:image]@content']
+# 규칙이 없는 언론사에 사용하는 본문 컨테이너 (기존 추출 순서와 같음)
+DEFAULT_BODY = ['article', '#articleBodyContents', '#article_body', '.article_body', '#dic_area']
+
+
+class PublisherRule:
+    """
+    언론사 하나의 추출 규칙입니다.
+    - domains: 이 규칙을 적용할 도메인 목록 (하위 도메인 포함, 예: 'yna.co.kr'는 'm.yna.co.kr'에도 적용)
+    - body: 본문 컨테이너 선택자 목록 (앞에 있는 것이 우선)
+    - drop: 본문 안에서 뺄 요소의 선택자 목록 (DEFAULT_DROP에 더해짐)
+    - image: 대표 이미지 위치 ('선택자@속성', 앞에 있는 것이 우선)
+    - paragraphs: 문단으로 볼 태그 목록, 컨테이너 안에 문단이 없으면 컨테이너 전체 텍스트를 줄 단위로 사용
+    """
+
+    def __init__(self, name, domains, body, drop=(), image=DEFAULT_IMAGE, paragraphs=('p',)):
+        self.name = name
+        self.domains = list(domains)
+        # 선택자는 규칙을 만들 때 한 번만 해석해 둠
+        self.body = [Selector(text) for text in body]
+        self.drop = [Selector(text) for text in [*DEFAULT_DROP, *drop]]
+        self.image = [Selector(text) for text in image]
+        if any(not selector.attribute for selector in self.image):
+            raise ValueError(f"'{name}' 규칙의 이미지 위치에는 '@속성'이 필요합니다.")
+        self.paragraphs = frozenset(paragraphs)
+
+    def __repr__(self):
+        return f"PublisherRule({self.name!r})"
+
+
+# all_sources의 언론사별 규칙
+PUBLISHER_RULES = [
+    PublisherRule('MBC뉴스', ['imnews.imbc.com'], body=['.news_txt', '[itemprop=articleBody]', 'article'],
+                  drop=['.news_img', '.journalist']),
+    PublisherRule('연합뉴스', ['yna.co.kr'], body=['.story-news', '#articleWrap', 'article'],
+                  drop=['.tmp-copyright', '.txt-copyright', '.adrs', '.comp-box', '.article-ad-box']),
+    PublisherRule('조선일보', ['chosun.com'], body=['section.article-body', '.article-body', 'article'],
+                  drop=['.article-body__content-image', '.article-byline']),
+    PublisherRule('뉴스1', ['news1.kr'], body=['#articles_detail', '[itemprop=articleBody]', 'article'],
+                  drop=['.article_reporter', '.photo_article']),
+    PublisherRule('JTBC 뉴스', ['jtbc.co.kr'], body=['#articlebody', '.article_content', 'article'],
+                  drop=['.reporter_area']),
+    PublisherRule('중앙일보', ['joongang.co.kr'], body=['#article_body', 'article'],
+                  drop=['.ab_byline', '.ab_photo', '.ab_related_article', '.ab_ad']),
+    PublisherRule('SBS 뉴스', ['sbs.co.kr'], body=['.text_area', '[itemprop=articleBody]', '.article_cont_area'],
+                  drop=['.article_copyright']),
+    PublisherRule('YTN', ['ytn.co.kr'], body=['#CmAdContent', '.paragraph', 'article'],
+                  drop=['.ad_box', '.relate_news']),
+    PublisherRule('한겨레', ['hani.co.kr'], body=['.article-text', '.article-body', 'article'],
+                  drop=['.image-area', '.article-review']),
+    PublisherRule('경향신문', ['khan.co.kr'], body=['#articleBody', '.art_body', 'article'],
+                  drop=['.art_photo', '.article_bottom_ad', '.srch-kw']),
+    PublisherRule('오마이뉴스', ['ohmynews.com'], body=['.at_contents', '.article_view', 'article'],
+                  drop=['.linkcon', '.livereporter']),
+    PublisherRule('한국경제', ['hankyung.com'], body=['#articletxt', '.article-body', 'article'],
+                  drop=['.figure-img', '.ad-wrap', '.article-ad']),
+]
+# 규칙이 등록되지 않은 언론사에 사용하는 기본 규칙
+DEFAULT_RULE = PublisherRule('기본', [], body=DEFAULT_BODY)
+
+
+class RuleRegistry:
+    """도메인으로 언론사 규칙을 찾는 저장소입니다. 찾지 못하면 기본 규칙을 반환합니다."""
+
+    def __init__(self, rules=(), default=DEFAULT_RULE):
+        self.default = default
+        self._by_domain = {}
+        for rule in rules:
+            self.register(rule)
+
+    def register(self, rule):
+        for domain in rule.domains:
+            self._by_domain[domain.lower()] = rule
+
+    def for_url(self, url):
+        host = (urlparse(url).hostname or '').lower()
+        while host:  # 'news.example.co.kr' → 'example.co.kr' → 'co.kr' 순서로 찾음
+            if host in self._by_domain:
+                return self._by_domain[host]
+            _, _, host = host.partition('.')
+        return self.default
+
+
+class _Container:
+    """훑는 도중 찾은 본문 컨테이너 후보 하나의 상태입니다."""
+
+    def __init__(self, depth):
+        self.depth = depth
+        self.closed = False
+        self.paragraphs = []  # 완성된 문단 텍스트
+        self.raw = []  # 문단이 없을 때 사용할 컨테이너 전체 텍스트 (블록 태그마다 줄바꿈)
+
+    def lines(self):
+        lines = (" ".join(line.split()) for line in "".join(self.raw).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+
+class RuleExtractor:
+    """
+    언론사 규칙에 따라 본문과 대표 이미지를 찾는 추출기입니다.
+    - registry: 도메인별 규칙 저장소
+    - backend: 문서를 파싱하고 walk()로 훑는 추출 백엔드 (extractors.get_extractor)
+    """
+
+    def __init__(self, registry, backend):
+        self.registry = registry
+        self.backend = backend
+
+    def extract(self, url, html, want_body=True):
+        """(본문 텍스트, 대표 이미지 주소)를 반환합니다. 찾지 못한 항목은 None입니다."""
+        rule = self.registry.for_url(url)
+        document = self.backend.parse(html)
+        if document is None:
+            return None, None
+        return self.extract_document(rule, document, want_body)
+
+    def image(self, url, html):
+        """대표 이미지 주소만 찾습니다. 이미지를 찾으면 문서의 나머지는 훑지 않습니다."""
+        return self.extract(url, html, want_body=False)[1]
+
+    def extract_document(self, rule, document, want_body=True):
+        containers = [None] * len(rule.body)  # 선택자별로 처음 일치한 컨테이너
+        images = [None] * len(rule.image)
+        open_containers, open_paragraphs = [], []  # 현재 안쪽에 있는 컨테이너와 문단 (depth, 상태)
+        depth, drop_depth = 0, None
+        for kind, value, attrs in self.backend.walk(document):
+            if kind == START:
+                depth += 1
+                for i, selector in enumerate(rule.image):
+                    if images[i] is None and selector.matches(value, attrs) and attrs.get(selector.attribute):
+                        images[i] = attrs[selector.attribute]
+                if images[0] is not None and not want_body:
+                    break
+                if not want_body or drop_depth is not None:
+                    continue
+                if open_containers and any(selector.matches(value, attrs) for selector in rule.drop):
+                    drop_depth = depth  # 이 요소가 끝날 때까지 본문에 넣지 않음
+                    continue
+                if open_containers and value in rule.paragraphs:  # 문단을 먼저 확인 (컨테이너 자신은 문단이 아님)
+                    open_paragraphs.append((depth, [], list(open_containers)))
+                if value in BLOCK_TAGS:
+                    for container in open_containers:
+                        container.raw.append("\n")
+                for i, selector in enumerate(rule.body):
+                    if containers[i] is None and selector.matches(value, attrs):
+                        containers[i] = _Container(depth)
+                        open_containers.append(containers[i])
+            elif kind == TEXT:
+                if drop_depth is not None:
+                    continue
+                for _, parts, _ in open_paragraphs:
+                    parts.append(value)
+                for container in open_containers:
+                    container.raw.append(value)
+            else:  # END
+                if drop_depth == depth:
+                    drop_depth = None
+                while open_paragraphs and open_paragraphs[-1][0] == depth:
+                    _, parts, owners = open_paragraphs.pop()
+                    text = " ".join("".join(parts).split())  # 인라인 태그 사이의 띄어쓰기는 살리고 연속 공백만 정리
+                    if text:
+                        for container in owners:
+                            container.paragraphs.append(text)
+                if open_containers and value in BLOCK_TAGS:
+                    for container in open_containers:
+                        container.raw.append("\n")
+                while open_containers and open_containers[-1].depth == depth:
+                    open_containers.pop().closed = True
+                depth -= 1
+                # 가장 우선인 컨테이너와 이미지를 모두 찾았으면 나머지 문서는 훑지 않음
+                if containers[0] is not None and containers[0].closed and images[0] is not None:
+                    break
+        image_url = next((image for image in images if image), None)
+        if not want_body:
+            return None, image_url
+        container = next((container for container in containers if container is not None), None)
+        if container is None:
+            return None, image_url
+        body_text = "\n".join(container.paragraphs) if container.paragraphs else container.lines()
+        return body_text or None, image_url
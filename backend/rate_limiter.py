@@ -0,0 +1,155 @@
+# ================================
+# Azure OpenAI 호출용 속도 제한기 (토큰 버킷 + 적응형 백오프)
+# ================================
+# 배포(deployment)의 분당 요청 수(RPM)와 분당 토큰 수(TPM) 할당량에 맞춰 호출 속도를 조절한다.
+# - 두 개의 토큰 버킷(요청, 토큰)에 여유가 있을 때만 호출을 내보낸다.
+# - 429 응답을 받으면 Retry-After 시간 동안 모든 작업자를 함께 멈추고, 전송 속도를 잠시 낮춘다.
+# - 실패한 호출은 지수 백오프 + 무작위 지연(jitter)으로 다시 시도한다.
+# 여러 스레드(파이프라인 작업자)가 하나의 객체를 공유해서 사용한다.
+import email.utils  # Retry-After 헤더가 날짜 형식일 때 해석하기 위한 도구
+import random  # 재시도 간격에 무작위성을 주기 위한 라이브러리
+import threading  # 작업자 간 공유 상태를 보호하기 위한 잠금
+import time  # 대기 및 시간 계산
+
+
+class RateLimitExceeded(Exception):
+    """재시도 횟수를 모두 써도 호출에 성공하지 못했을 때 발생하는 예외입니다."""
+
+
+def retry_after_seconds(headers):
+    """응답 헤더의 retry-after-ms / Retry-After 값을 초 단위로 바꿉니다. 없으면 None을 반환합니다."""
+    if not headers:
+        return None
+    value = headers.get('retry-after-ms')
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        parsed = email.utils.parsedate_to_datetime(value)  # 'Wed, 21 Oct 2025 07:28:00 GMT' 형식
+        return max(0.0, parsed.timestamp() - time.time()) if parsed else None
+
+
+class TokenBucket:
+    """capacity만큼 채워지고 초당 rate만큼 다시 차는 토큰 버킷입니다."""
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate  # 초당 충전량
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount, rate_factor=1.0):
+        """amount만큼 꺼내기 위해 기다려야 하는 시간(초). 이미 충분하면 0입니다."""
+        deficit = amount - self.tokens
+        return 0.0 if deficit <= 0 else deficit / (self.rate * rate_factor)
+
+
+class RateLimiter:
+    """
+    RPM/TPM 할당량을 여러 작업자가 나눠 쓰도록 조절하는 속도 제한기입니다.
+    - requests_per_minute, tokens_per_minute: 배포의 할당량
+    - max_retries: 한 호출당 최대 재시도 횟수
+    - base_delay, max_delay: 지수 백오프의 시작/최대 대기 시간(초)
+    - burst_seconds: 한 번에 몰아 보낼 수 있는 양 (Azure는 분당 할당량을 짧은 구간으로 나누어 적용하므로
+      버킷 크기를 1분치가 아니라 이 시간만큼의 할당량으로 제한)
+    """
+
+    def __init__(self, requests_per_minute, tokens_per_minute, max_retries=5, base_delay=1.0, max_delay=60.0,
+                 burst_seconds=10):
+        self.requests = TokenBucket(max(1, requests_per_minute * burst_seconds / 60), requests_per_minute / 60)
+        self.tokens = TokenBucket(tokens_per_minute * burst_seconds / 60, tokens_per_minute / 60)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0  # 429를 받은 뒤 모든 작업자가 함께 기다려야 하는 시각
+        self._rate_factor = 1.0  # 429가 나면 줄이고 성공이 이어지면 다시 늘리는 전송 속도 배율
+        self.stats = {'calls': 0, 'throttled': 0, 'retries': 0, 'failures': 0, 'waited_seconds': 0.0}
+
+    def acquire(self, estimated_tokens):
+        """
+        요청 1건과 estimated_tokens만큼의 토큰을 확보할 때까지 기다립니다. 실제로 버킷에서 뺀 토큰 수를 반환합니다.
+        (버킷보다 큰 요청은 버킷 크기만큼만 빼므로 추정치보다 작을 수 있음)
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.requests.refill(now)
+                self.tokens.refill(now)
+                amount = min(estimated_tokens, self.tokens.capacity)  # 버킷보다 큰 요청이 영원히 기다리지 않도록
+                wait = max(self._blocked_until - now,
+                           self.requests.wait_time(1, self._rate_factor),
+                           self.tokens.wait_time(amount, self._rate_factor))
+                if wait <= 0:
+                    self.requests.tokens -= 1
+                    self.tokens.tokens -= amount
+                    self.stats['calls'] += 1
+                    return amount
+                self.stats['waited_seconds'] += wait
+            time.sleep(wait)
+
+    def record_usage(self, charged_tokens, actual_tokens):
+        """
+        실제 사용 토큰 수를 알게 되면 acquire가 미리 뺀 토큰 수(charged_tokens)보다 많이 쓴 만큼을 더 뺍니다.
+        덜 쓴 만큼은 돌려주지 않습니다. (Azure는 요청을 받을 때 프롬프트 + 최대 응답 토큰으로 할당량을 계산하므로,
+        돌려주면 서버가 센 양보다 많이 보내 429가 늘어남)
+        """
+        with self._lock:
+            if actual_tokens is not None and actual_tokens > charged_tokens:
+                self.tokens.tokens -= actual_tokens - charged_tokens
+            self._rate_factor = min(1.0, self._rate_factor + 0.05)  # 성공이 이어지면 조금씩 원래 속도로 회복
+
+    def throttle(self, retry_after=None):
+        """429를 받았을 때 호출합니다. 모든 작업자를 retry_after초 동안 멈추고 전송 속도를 낮춥니다."""
+        with self._lock:
+            self.stats['throttled'] += 1
+            self._rate_factor = max(0.1, self._rate_factor * 0.5)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def backoff_delay(self, attempt):
+        """attempt번째 재시도 전에 기다릴 시간 (지수 백오프 + full jitter)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, func, estimated_tokens, is_rate_limited, is_retryable, usage_of=None):
+        """
+        속도 제한과 재시도를 적용해 func()를 호출하고 결과를 반환합니다.
+        - is_rate_limited(e): 429 같은 할당량 초과 오류인지 판단하는 함수
+        - is_retryable(e): 다시 시도해도 되는 오류인지 판단하는 함수
+        - usage_of(result): 결과에서 실제 사용 토큰 수를 꺼내는 함수 (선택)
+        재시도를 모두 소진하면 RateLimitExceeded를, 재시도할 수 없는 오류는 그대로 발생시킵니다.
+        """
+        for attempt in range(self.max_retries + 1):
+            charged = self.acquire(estimated_tokens)
+            try:
+                result = func()
+            except Exception as e:
+                rate_limited = is_rate_limited(e)
+                if not (rate_limited or is_retryable(e)):
+                    raise
+                retry_after = retry_after_seconds(getattr(getattr(e, 'response', None), 'headers', None))
+                if rate_limited:
+                    self.throttle(retry_after)
+                if attempt == self.max_retries:
+                    with self._lock:
+                        self.stats['failures'] += 1
+                    raise RateLimitExceeded(f"{self.max_retries}회 재시도 후에도 실패했습니다: {e}") from e
+                with self._lock:
+                    self.stats['retries'] += 1
+                # Retry-After가 있으면 그 시간만큼, 없으면 지수 백오프 시간만큼 기다린 뒤 다시 시도
+                time.sleep(retry_after + random.uniform(0, self.base_delay) if retry_after else self.backoff_delay(attempt))
+                continue
+            if usage_of is not None:
+                self.record_usage(charged, usage_of(result))
+            return result
@@ -0,0 +1,162 @@
+# ================================
+# 실행 체크포인트 (SQLite)
+# ================================
+# 기사 저장소와 피드 변경 내역은 피드의 모든 기사가 처리된 뒤에야 기록되므로, 실행 도중 프로세스가 죽으면
+# 그때까지 한 원문 주소 변환, 본문 수집, GPT 평가, 번역 결과를 다음 실행에서 찾아 쓸 수 없다.
+# 실행마다 실행 번호(run id)를 붙이고, 기사가 단계를 하나 마칠 때마다 그때까지의 기사 상태를 저장해 둔다.
+# 다음 실행(매시간 타이머로 시작됨)은 끝나지 않은 이전 실행을 이어받아, 저장된 기사는 마친 단계를 건너뛴다.
+# 실행이 끝까지 완료되면 그 실행의 체크포인트는 지운다.
+# 이전 실행이 아직 진행 중일 수도 있으므로, 실행을 맡은 프로세스(owner)가 주기적으로 생존 신호(heartbeat_at)를 남기고,
+# 다음 실행은 생존 신호가 끊긴 실행만 이어받는다. (진행 중이면 같은 기사를 두 번 평가/번역하지 않도록 시작하지 않음)
+import json  # 기사 상태 저장
+import os  # 저장 폴더 생성, 프로세스 번호
+import socket  # 실행을 맡은 컴퓨터 이름
+import sqlite3  # 파일 기반 데이터베이스
+import threading  # 여러 작업자가 동시에 접근할 때 사용하는 잠금
+import time  # 시작/저장 시각 기록
+import uuid  # 실행 번호 생성
+from datetime import datetime  # 실행 번호에 넣을 시작 시각
+
+
+class RunCheckpoint:
+    """
+    실행 번호별로 기사마다 마지막으로 마친 단계와 그때의 기사 상태를 저장합니다.
+    - path: SQLite 파일 경로
+    - stages: 체크포인트를 남기는 단계 이름 (파이프라인 순서대로)
+    - max_age_hours: 이보다 오래전에 시작된 실행은 끝나지 않았어도 이어받지 않고 정리
+    - heartbeat_seconds: 실행 중에 생존 신호를 남기는 간격
+    - stale_seconds: 생존 신호가 이보다 오래 끊긴 실행은 멈춘 것으로 보고 이어받음
+    - stats: resumed(이어받은 실행 수), restored(단계별로 체크포인트에서 되살린 기사 수), saved(저장한 체크포인트 수)
+    """
+
+    def __init__(self, path, stages=('resolve', 'scrape', 'evaluate', 'translate'), max_age_hours=24,
+                 heartbeat_seconds=60, stale_seconds=300):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.stages = list(stages)
+        self.max_age = max_age_hours * 3600
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_seconds = stale_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.run_id = None
+        self.resumed = False  # 이번 실행이 이전 실행을 이어받았는지
+        self._lock = threading.Lock()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread = None
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS runs (
+                   run_id TEXT PRIMARY KEY,
+                   started_at REAL NOT NULL,
+                   finished_at REAL,
+                   owner TEXT,
+                   heartbeat_at REAL
+               );
+               CREATE TABLE IF NOT EXISTS run_checkpoints (
+                   run_id TEXT NOT NULL,
+                   item_key TEXT NOT NULL,
+                   stage TEXT NOT NULL,
+                   data TEXT NOT NULL,
+                   updated_at REAL NOT NULL,
+                   PRIMARY KEY (run_id, item_key)
+               );"""
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(runs)")}
+        for column, kind in (('owner', 'TEXT'), ('heartbeat_at', 'REAL')):  # 생존 신호가 없던 이전 파일
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE runs ADD COLUMN {column} {kind}")
+        self._conn.commit()
+        self.stats = {'resumed': 0, 'restored': {stage: 0 for stage in self.stages}, 'saved': 0}
+
+    def start_run(self):
+        """
+        끝나지 않은 가장 최근 실행이 있으면 이어받고, 없으면 새 실행을 시작합니다. 실행 번호를 반환합니다.
+        그 실행을 맡은 프로세스의 생존 신호가 stale_seconds 안에 있으면(아직 진행 중) 시작하지 않고 None을 반환합니다.
+        max_age_hours보다 오래된 실행과 이미 끝난 실행의 기록은 이때 정리합니다.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            # 여러 프로세스가 동시에 시작해도 한 프로세스만 실행을 맡도록 쓰기 잠금을 먼저 얻음
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM runs WHERE started_at < ? OR finished_at < ?",
+                               (now - self.max_age, now - self.max_age))
+            self._conn.execute("DELETE FROM run_checkpoints WHERE run_id NOT IN "
+                               "(SELECT run_id FROM runs WHERE finished_at IS NULL)")
+            row = self._conn.execute(
+                "SELECT run_id, owner, COALESCE(heartbeat_at, started_at) FROM runs WHERE finished_at IS NULL "
+                "ORDER BY started_at DESC LIMIT 1"
+            ).fetchone()
+            if row is not None and row[1] != self.owner and now - row[2] < self.stale_seconds:
+                return None
+            self.resumed = row is not None
+            if self.resumed:
+                self.run_id = row[0]
+                self.stats['resumed'] += 1
+                self._conn.execute("UPDATE runs SET owner = ?, heartbeat_at = ? WHERE run_id = ?",
+                                   (self.owner, now, self.run_id))
+            else:
+                self.run_id = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}"
+                self._conn.execute("INSERT INTO runs (run_id, started_at, owner, heartbeat_at) VALUES (?, ?, ?, ?)",
+                                   (self.run_id, now, self.owner, now))
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat, name='RunCheckpointHeartbeat', daemon=True)
+        self._heartbeat_thread.start()
+        return self.run_id
+
+    def _heartbeat(self):
+        # 실행이 끝날 때까지 heartbeat_seconds마다 생존 신호를 남김 (프로세스가 죽으면 신호가 끊겨 다음 실행이 이어받음)
+        while not self._heartbeat_stop.wait(self.heartbeat_seconds):
+            with self._lock, self._conn:
+                self._conn.execute("UPDATE runs SET heartbeat_at = ? WHERE run_id = ? AND owner = ?",
+                                   (time.time(), self.run_id, self.owner))
+
+    def _stop_heartbeat(self):
+        if self._heartbeat_thread is not None:
+            self._heartbeat_stop.set()
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+
+    def pending(self):
+        """이번 실행(이어받은 실행)에 남아 있는 체크포인트 수를 반환합니다."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM run_checkpoints WHERE run_id = ?",
+                                      (self.run_id,)).fetchone()[0]
+
+    def load(self, item_key):
+        """기사의 체크포인트를 (마친 단계, 기사 상태)로 반환합니다. 없으면 None입니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT stage, data FROM run_checkpoints WHERE run_id = ? AND item_key = ?",
+                                     (self.run_id, item_key)).fetchone()
+            if row is None or row[0] not in self.stages:
+                return None
+            self.stats['restored'][row[0]] += 1
+        return row[0], json.loads(row[1])
+
+    def passed(self, checkpoint_stage, stage):
+        """체크포인트의 단계(checkpoint_stage)가 stage 단계이거나 그 뒤의 단계인지 반환합니다."""
+        return checkpoint_stage is not None and self.stages.index(checkpoint_stage) >= self.stages.index(stage)
+
+    def save(self, stage, items):
+        """stage 단계를 마친 (기사 키, 기사 상태) 목록을 한 번에 저장합니다. (기사마다 마지막 단계만 남음)"""
+        if not items:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO run_checkpoints (run_id, item_key, stage, data, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(self.run_id, key, stage, json.dumps(data, ensure_ascii=False), now) for key, data in items],
+            )
+            self.stats['saved'] += len(items)
+
+    def finish_run(self):
+        """실행을 완료로 기록하고 그 실행의 체크포인트를 지웁니다."""
+        self._stop_heartbeat()
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?", (time.time(), self.run_id))
+            self._conn.execute("DELETE FROM run_checkpoints WHERE run_id = ?", (self.run_id,))
+        self.run_id = None
+
+    def close(self):
+        self._stop_heartbeat()  # 완료하지 못한 실행은 생존 신호만 끊기고 남아서 다음 실행이 이어받음
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,170 @@
+# ================================
+# 언론사(호스트)별 예의를 지키는 병렬 본문 수집기
+# ================================
+# 기사들은 십여 개 언론사에 나뉘어 있으므로, 서로 다른 호스트는 동시에 받아 오고
+# 같은 호스트에는 정해진 수 이상의 요청을 동시에 보내지 않는다.
+# - robots.txt에서 막힌 경로는 요청하지 않고, Crawl-delay가 있으면 요청 간격으로 사용한다.
+#   (robots.txt가 401/403이면 그 호스트 전체를 막힌 것으로, 그 밖의 4xx면 모두 허용으로 봄)
+# - 429/503 응답이나 연결 오류가 나면 그 호스트만 잠시 쉬고(지수 백오프, Retry-After 우선),
+#   다른 호스트의 요청은 계속 진행한다.
+# 여러 스레드(파이프라인 작업자)가 하나의 객체를 공유해서 사용한다.
+import threading  # 호스트별 동시 요청 수 제한과 공유 상태 보호
+import time  # 요청 간격 및 백오프 대기
+from contextlib import contextmanager, ExitStack  # 스트리밍 응답을 with 문으로 다루기 위한 도구
+from urllib.parse import urlparse  # 호스트 이름과 robots.txt 주소 추출
+from urllib.robotparser import RobotFileParser  # robots.txt 해석
+
+from rate_limiter import retry_after_seconds  # Retry-After 헤더를 초 단위로 바꾸는 함수
+
+BACKOFF_STATUS_CODES = (429, 503)  # 서버가 요청을 줄여 달라는 뜻으로 보내는 상태 코드
+ROBOTS_FORBIDDEN_CODES = (401, 403)  # robots.txt가 이 상태 코드면 호스트 전체를 수집하지 않음
+
+
+class RobotsDisallowed(Exception):
+    """robots.txt가 이 주소의 수집을 허용하지 않을 때 발생합니다."""
+
+
+class HostBackingOff(Exception):
+    """호스트가 오랫동안 쉬는 중이라 기다리지 않고 바로 포기할 때 발생합니다."""
+
+
+class HostState:
+    """호스트 하나의 동시 요청 수, 요청 간격, 백오프 상태와 robots.txt 규칙입니다."""
+
+    def __init__(self, per_host):
+        self.slots = threading.Semaphore(per_host)
+        self.lock = threading.Lock()
+        self.robots_lock = threading.Lock()  # robots.txt는 호스트마다 한 번만 받아 옴
+        self.robots = None  # RobotFileParser, 없거나 받아 올 수 없었으면 False (모두 허용)
+        self.interval = 0.0  # 같은 호스트에 요청을 보내는 최소 간격(초)
+        self.next_request = 0.0  # 다음 요청을 보낼 수 있는 시각 (time.monotonic 기준)
+        self.backoff_until = 0.0
+        self.failures = 0  # 연속 실패 횟수
+
+
+class PoliteFetcher:
+    """
+    호스트별 동시 요청 수, robots.txt, 요청 간격, 백오프를 지키며 페이지를 받아 오는 객체입니다.
+    - session: get, stream을 제공하는 HTTP 클라이언트 (공용 HttpClient)
+    - per_host: 한 호스트에 동시에 보낼 최대 요청 수
+    - min_interval: 같은 호스트에 요청을 보내는 최소 간격(초), robots.txt의 Crawl-delay가 더 길면 그 값을 사용
+    - max_crawl_delay: Crawl-delay가 지나치게 길 때 사용할 상한(초)
+    - base_backoff, max_backoff: 호스트 백오프의 시작 간격과 최대 간격(초)
+    - max_wait: 백오프가 이보다 길게 남아 있으면 기다리지 않고 HostBackingOff를 발생시킴
+    """
+
+    def __init__(self, session, per_host=4, min_interval=0.0, user_agent='*', respect_robots=True,
+                 max_crawl_delay=10.0, base_backoff=1.0, max_backoff=60.0, max_wait=30.0):
+        self.session = session
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.user_agent = user_agent
+        self.respect_robots = respect_robots
+        self.max_crawl_delay = max_crawl_delay
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._hosts = {}
+        self.stats = {'requests': 0, 'robots_blocked': 0, 'backoffs': 0, 'gave_up': 0, 'wait_seconds': 0.0}
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _state(self, host):
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostState(self.per_host)
+            return self._hosts[host]
+
+    # --- robots.txt ---
+    def _load_robots(self, state, parsed):
+        with state.robots_lock:
+            if state.robots is not None:
+                return
+            robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+            parser = RobotFileParser(robots_url)
+            try:
+                response = self.session.get(robots_url, timeout=10)
+                if response.status_code in ROBOTS_FORBIDDEN_CODES:  # 접근 권한이 없으면 모두 막힌 것으로 봄
+                    parser.disallow_all = True
+                elif response.status_code >= 400:  # robots.txt가 없으면 모두 허용
+                    parser = False
+                else:
+                    parser.parse(response.text.splitlines())
+            except Exception as e:
+                print(f"  [알림] robots.txt를 읽지 못했습니다 ({parsed.netloc}): {e}")
+                parser = False
+            crawl_delay = parser.crawl_delay(self.user_agent) if parser else None
+            with state.lock:
+                state.robots = parser
+                state.interval = max(self.min_interval, min(float(crawl_delay or 0), self.max_crawl_delay))
+
+    def allowed(self, url):
+        """robots.txt 규칙상 이 주소를 수집해도 되는지 확인합니다."""
+        if not self.respect_robots:
+            return True
+        parsed = urlparse(url)
+        state = self._state(parsed.hostname or '')
+        if state.robots is None:
+            self._load_robots(state, parsed)
+        return state.robots is False or state.robots.can_fetch(self.user_agent, url)
+
+    # --- 요청 간격과 백오프 ---
+    def _wait_turn(self, host, state):
+        # 요청 간격과 백오프가 모두 지난 시각을 예약하고, 그때까지 기다림
+        with state.lock:
+            now = time.monotonic()
+            if state.backoff_until - now > self.max_wait:
+                self._count('gave_up')
+                raise HostBackingOff(f"{host}: {state.backoff_until - now:.0f}초 동안 요청을 쉬는 중입니다.")
+            start = max(now, state.next_request, state.backoff_until)
+            state.next_request = start + state.interval
+        delay = start - now
+        if delay > 0:
+            self._count('wait_seconds', delay)
+            time.sleep(delay)
+
+    def _record(self, state, retry_after=None, failed=False):
+        with state.lock:
+            if not failed:
+                state.failures = 0
+                return
+            state.failures += 1
+            delay = retry_after if retry_after is not None else self.base_backoff * 2 ** (state.failures - 1)
+            state.backoff_until = max(state.backoff_until, time.monotonic() + min(delay, self.max_backoff))
+        self._count('backoffs')
+
+    def _record_response(self, state, response):
+        if response.status_code in BACKOFF_STATUS_CODES:
+            self._record(state, retry_after_seconds(response.headers), failed=True)
+        else:
+            self._record(state)
+
+    def _host_state(self, url):
+        if not self.allowed(url):
+            self._count('robots_blocked')
+            raise RobotsDisallowed(f"robots.txt가 허용하지 않는 주소입니다: {url}")
+        host = urlparse(url).hostname or ''
+        return host, self._state(host)
+
+    @contextmanager
+    def stream(self, url, **options):
+        """
+        호스트 규칙을 지키며 GET 요청을 보내고, 본문을 조금씩 읽을 수 있는 응답을 돌려줍니다. (상태 코드 확인은 호출하는 쪽에서 함)
+        robots.txt가 막은 주소는 RobotsDisallowed, 오래 쉬는 호스트는 HostBackingOff를 발생시킵니다.
+        with 블록이 끝날 때까지 호스트의 동시 요청 자리를 차지하며, 끝나면 다 읽지 않았어도 연결을 닫습니다.
+        """
+        host, state = self._host_state(url)
+        with state.slots, ExitStack() as stack:
+            self._wait_turn(host, state)
+            self._count('requests')
+            try:
+                response = stack.enter_context(self.session.stream('GET', url, **options))
+            except Exception:
+                self._record(state, failed=True)
+                raise
+            self._record_response(state, response)
+            yield response
+
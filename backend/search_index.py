@@ -0,0 +1,324 @@
+# ================================
+# 기사 검색 색인 (역색인 + BM25)
+# ================================
+# 모든 기사의 검색용 문자열에서 검색어를 찾는 방식은 요청마다 전체 기사를 훑어야 한다. (기사 수 × 글자 수)
+# 기사의 제목, 요약, 언론사를 글자 2-gram(bigram)으로 나누어 토큰마다 그 토큰이 나오는 기사 목록(postings)을 만들어 두고,
+# 검색어의 토큰이 모두 나오는 기사만 찾아 BM25 점수로 순위를 매긴다.
+# 한국어는 띄어쓰기 단위(어절)에 조사가 붙으므로 단어가 아니라 글자 n-gram으로 나누어야 '관광객이', '관광객을'이 모두 찾아진다.
+# 토큰마다 기사 번호 순서의 목록(다른 토큰과의 교집합 확인용)과 점수 순서의 목록(상위 결과부터 읽기용)을 두어,
+# 자주 나오는 토큰이라도 상위 결과가 정해지는 즉시 읽기를 멈춘다. (색인은 만든 뒤 바뀌지 않으므로 여러 스레드에서 함께 써도 됨)
+# 만든 색인은 파일로 저장할 수 있고, 저장한 파일은 메모리 매핑(mmap)으로 열어 다시 만들지 않고 바로 검색한다.
+# 새 기사는 기존 색인을 고치지 않고 새 색인 조각(segment)으로 만들어, 여러 조각을 IndexView로 함께 검색한다.
+# (조각마다 기사 수가 달라도 점수를 비교할 수 있도록 IDF는 저장하지 않고 검색할 때 모든 조각을 합쳐서 계산)
+import base64  # 다음 쪽 커서 인코딩
+import heapq  # 상위 결과 유지
+import math  # IDF 계산
+import mmap  # 저장한 색인 파일을 읽지 않고 바로 사용
+import re  # 단어 나누기
+import struct  # 색인 파일의 머리말과 토큰 표
+import unicodedata  # 전각/반각 문자 통일
+from array import array  # 기사 번호와 점수를 작은 메모리로 저장
+from bisect import bisect_left  # 기사 번호 목록에서 기사 찾기
+from collections import Counter  # 기사 안의 토큰 빈도
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+# 색인 파일 형식: 머리말(식별자, 버전, 기사 수, 토큰 수, postings 수) 다음에 토큰 순서로 정렬한 토큰 표,
+# 기사 번호 순서의 기사 키('Q'), 키 순서로 정렬한 키('Q')와 그 기사 번호('I')가 오고, 그 뒤에 모든 토큰의 기사 번호('I'), 점수('f'), 점수 순서의 기사 번호('I'), 점수 순서의 점수('f')가 차례로 이어짐
+_FILE_MAGIC = b'NEWSSRCH'
+_FILE_VERSION = 2
+_HEADER = struct.Struct('<8sIIIQ4x')  # 뒤따르는 'Q' 영역이 8바이트 경계에 오도록 채움
+_TERM = struct.Struct('<8sII')  # 토큰(UTF-8, 최대 두 글자라 8바이트에 들어감), postings 시작 위치, 개수
+
+# 검색에 쓰는 기사 필드와 가중치 (제목에 나온 검색어를 더 중요하게 봄)
+DEFAULT_FIELDS = (('title', 2), ('summary', 1), ('source', 1))
+
+
+def tokenize(text):
+    """
+    텍스트를 검색 토큰 목록으로 바꿉니다. 단어(공백, 문장 부호로 나눔)마다 연속한 두 글자씩 토큰을 만들고,
+    한 글자 단어는 그 글자를 토큰으로 씁니다. 대소문자와 전각/반각 차이는 무시합니다.
+    """
+    tokens = []
+    for word in _NON_WORD.split(unicodedata.normalize('NFKC', text).lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens += [word[i:i + 2] for i in range(len(word) - 1)]
+    return tokens
+
+
+def encode_cursor(score, key):
+    """마지막으로 반환한 결과의 (점수, 기사 키)를 URL에 넣을 수 있는 문자열로 바꿉니다."""
+    return base64.urlsafe_b64encode(f"{score!r}/{key}".encode('ascii')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """encode_cursor로 만든 문자열을 (점수, 기사 키)로 되돌립니다. 형식이 틀리면 ValueError가 발생합니다."""
+    try:
+        score, key = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii').split('/')
+        return float(score), int(key)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+class _Postings:
+    # 토큰 하나의 기사 목록: 기사 번호 순서(교집합 확인용)와 점수 순서(상위 결과부터 읽기용)
+    # 점수는 BM25에서 IDF를 곱하기 전의 값 (array 또는 저장한 색인 파일의 memoryview, 어느 쪽이든 같은 방법으로 읽음)
+    __slots__ = ('docs', 'impacts', 'ranked_docs', 'ranked_impacts')
+
+    def __init__(self, docs, impacts, ranked_docs, ranked_impacts):
+        self.docs = docs
+        self.impacts = impacts
+        self.ranked_docs = ranked_docs
+        self.ranked_impacts = ranked_impacts
+
+    @classmethod
+    def build(cls, docs, impacts):
+        order = sorted(range(len(docs)), key=impacts.__getitem__, reverse=True)  # 점수가 같으면 기사 번호 순서
+        return cls(docs, impacts, array('I', (docs[i] for i in order)), array('f', (impacts[i] for i in order)))
+
+    def impact(self, doc_id):
+        # 이 토큰이 기사에 나오면 그 점수를, 나오지 않으면 None을 반환
+        i = bisect_left(self.docs, doc_id)
+        if i < len(self.docs) and self.docs[i] == doc_id:
+            return self.impacts[i]
+        return None
+
+
+class _TermKeys:
+    # 색인 파일의 토큰 표를 토큰 바이트의 정렬된 목록처럼 보여 줌 (bisect로 찾기 위함)
+    def __init__(self, table, count):
+        self._table = table
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        start = i * _TERM.size
+        return bytes(self._table[start:start + 8])
+
+
+class _MappedPostings:
+    # 저장한 색인 파일의 토큰 표에서 토큰을 찾아 postings를 만들어 주는 객체 (dict의 get과 같은 방법으로 사용)
+    def __init__(self, table, term_count, regions):
+        self._table = table
+        self._keys = _TermKeys(table, term_count)
+        self._docs, self._impacts, self._ranked_docs, self._ranked_impacts = regions
+
+    def get(self, token):
+        key = token.encode('utf-8').ljust(8, b'\0')
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            return None
+        _, start, count = _TERM.unpack_from(self._table, i * _TERM.size)
+        end = start + count
+        return _Postings(self._docs[start:end], self._impacts[start:end],
+                         self._ranked_docs[start:end], self._ranked_impacts[start:end])
+
+
+class SearchIndex:
+    """
+    기사 목록으로 만든 검색 색인(조각 하나)입니다. 만든 뒤에는 바뀌지 않습니다.
+    - documents: 검색할 기사(딕셔너리) 목록, 목록의 순서가 기사 번호
+    - keys: 기사마다 고유한 정수 키 (기사 저장소의 id 등, 없으면 기사 번호)
+      여러 조각을 함께 검색할 때 같은 기사를 알아보고, 점수가 같은 결과의 순서와 커서에 씀
+    - fields: (필드 이름, 가중치) 목록, 필드 값에 나온 토큰 수에 가중치를 곱해 빈도로 셈
+    - k1, b: BM25 매개변수 (k1은 빈도가 점수에 주는 영향의 상한, b는 긴 기사를 얼마나 불리하게 볼지)
+    - search(query, limit, cursor): 검색어의 토큰이 모두 나오는 기사를 점수 순으로 반환
+    - save(path), SearchIndex.load(path, documents): 색인을 파일로 저장하고, 저장한 파일을 메모리 매핑으로 열기
+    """
+
+    def __init__(self, documents, keys=None, fields=DEFAULT_FIELDS, k1=1.2, b=0.75):
+        self.documents = list(documents)
+        self.keys = array('Q', range(len(self.documents)) if keys is None else keys)
+        if len(self.keys) != len(self.documents):
+            raise ValueError(f"기사 키의 수({len(self.keys)})와 기사 수({len(self.documents)})가 다릅니다.")
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._sorted_keys = array('Q', (self.keys[i] for i in order))
+        self._sorted_docs = array('I', order)
+        self.k1 = k1
+        self.b = b
+        frequencies = {}  # 토큰 → (기사 번호 목록, 빈도 목록)
+        lengths = array('I')  # 기사 번호 → 토큰 수(가중치 적용)
+        for doc_id, document in enumerate(self.documents):
+            counts = Counter()
+            for field, weight in fields:
+                field_counts = Counter(tokenize(document.get(field) or ''))
+                if weight != 1:
+                    for token in field_counts:
+                        field_counts[token] *= weight
+                counts.update(field_counts)
+            lengths.append(sum(counts.values()))
+            for token, count in counts.items():
+                entry = frequencies.get(token)
+                if entry is None:
+                    entry = frequencies[token] = (array('I'), array('I'))
+                entry[0].append(doc_id)
+                entry[1].append(count)
+        total = len(self.documents)
+        average_length = (sum(lengths) / total) if total else 0.0
+        self._postings = {}
+        for token, (docs, counts) in frequencies.items():
+            impacts = array('f', (
+                count * (k1 + 1) / (count + k1 * (1 - b + b * lengths[doc_id] / average_length))
+                for doc_id, count in zip(docs, counts)
+            ))
+            self._postings[token] = _Postings.build(docs, impacts)
+
+    @classmethod
+    def load(cls, path, documents):
+        """
+        save()로 저장한 색인 파일을 메모리 매핑으로 엽니다. documents는 색인을 만들 때와 같은 순서의 기사 목록이며,
+        len()과 번호로 꺼내기만 되면 되므로 필요한 기사만 읽는 목록(ArticleSegment 등)을 넘길 수 있습니다.
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mapped)
+        magic, version, document_count, term_count, posting_count = _HEADER.unpack_from(buffer)
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            raise ValueError(f"검색 색인 파일 형식이 아닙니다: {path}")
+        if document_count != len(documents):
+            raise ValueError(f"검색 색인의 기사 수({document_count})와 기사 목록의 수({len(documents)})가 다릅니다.")
+        regions = []
+        position = _HEADER.size
+        for code, count in ((None, term_count * _TERM.size), ('Q', document_count), ('Q', document_count),
+                            ('I', document_count), *((code, posting_count) for code in 'IfIf')):
+            size = count * (struct.calcsize(code) if code else 1)
+            region = buffer[position:position + size]
+            regions.append(region.cast(code) if code else region)
+            position += size
+        index = cls.__new__(cls)
+        index.documents = documents
+        table, index.keys, index._sorted_keys, index._sorted_docs = regions[:4]
+        index._postings = _MappedPostings(table, term_count, regions[4:])
+        return index
+
+    def save(self, path):
+        """색인을 파일로 저장합니다. (load()로 다시 열 수 있음)"""
+        terms = sorted((token.encode('utf-8').ljust(8, b'\0'), postings) for token, postings in self._postings.items())
+        posting_count = sum(len(postings.docs) for _, postings in terms)
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, len(self.documents), len(terms), posting_count))
+            start = 0
+            for key, postings in terms:
+                f.write(_TERM.pack(key, start, len(postings.docs)))
+                start += len(postings.docs)
+            f.write(self.keys)
+            f.write(self._sorted_keys)
+            f.write(self._sorted_docs)
+            for field in _Postings.__slots__:
+                for _, postings in terms:
+                    f.write(getattr(postings, field))
+
+    def __len__(self):
+        return len(self.documents)
+
+    def postings(self, token):
+        """토큰의 기사 목록을 반환합니다. 이 조각에 없는 토큰이면 None입니다."""
+        return self._postings.get(token)
+
+    def find(self, key):
+        """키가 key인 기사의 번호를 반환합니다. 없으면 None입니다."""
+        i = bisect_left(self._sorted_keys, key)
+        if i < len(self._sorted_keys) and self._sorted_keys[i] == key:
+            return self._sorted_docs[i]
+        return None
+
+    def search(self, query, limit=20, cursor=None):
+        """이 색인 하나만 검색합니다. (IndexView.search 참고)"""
+        return IndexView([self]).search(query, limit, cursor)
+
+
+class IndexView:
+    """
+    여러 색인 조각을 하나의 색인처럼 검색합니다. 만든 뒤에는 바뀌지 않습니다.
+    - segments: SearchIndex 목록 (오래된 조각부터), 같은 키의 기사가 여러 조각에 있으면 가장 새 조각의 기사만 검색됨
+    - len(): 가려지지 않은 기사 수
+    - search(query, limit, cursor): 검색어의 토큰이 모두 나오는 기사를 점수 순으로 반환
+    """
+
+    def __init__(self, segments):
+        self.segments = list(segments)
+        # 조각마다 더 새 조각에 같은 키가 있어서 가려지는 기사 번호 (새 조각은 보통 작으므로 새 조각의 키로 찾음)
+        self._hidden = [set() for _ in self.segments]
+        for newer in range(1, len(self.segments)):
+            for key in self.segments[newer].keys:
+                for older in range(newer):
+                    doc_id = self.segments[older].find(key)
+                    if doc_id is not None:
+                        self._hidden[older].add(doc_id)
+        self._count = sum(len(segment) - len(hidden) for segment, hidden in zip(self.segments, self._hidden))
+
+    def __len__(self):
+        return self._count
+
+    def hidden(self, number):
+        """number번 조각에서 더 새 조각에 가려진 기사 번호의 집합을 반환합니다."""
+        return self._hidden[number]
+
+    def search(self, query, limit=20, cursor=None):
+        """
+        검색어의 토큰이 모두 나오는 기사를 BM25 점수가 높은 순서(같으면 기사 키 순서)로 최대 limit개 찾습니다.
+        (점수, 기사) 목록과 다음 쪽의 커서(다음 쪽이 없으면 None)를 반환합니다.
+        cursor를 주면 그 커서의 결과 다음부터 찾습니다. (기사 키를 건너뛰는 방식이라 쪽이 깊어져도 결과가 밀리지 않음)
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return [], None
+        after = decode_cursor(cursor) if cursor else None
+        lists = [[segment.postings(token) for token in tokens] for segment in self.segments]
+        # IDF는 모든 조각을 합친 기사 수와 토큰이 나오는 기사 수로 계산 (가려진 기사도 세지만, 기사 수를 넘지는 않게 함)
+        weights = []
+        for i in range(len(tokens)):
+            frequency = min(sum(len(postings[i].docs) for postings in lists if postings[i] is not None), self._count)
+            if frequency == 0:
+                return [], None
+            weights.append(math.log(1 + (self._count - frequency + 0.5) / (frequency + 0.5)))
+        wanted = limit + 1  # 하나 더 찾아서 다음 쪽이 있는지 확인
+        best = []  # (점수, -기사 키, 조각 번호, 기사 번호)의 최소 힙, 가장 나쁜 결과가 맨 앞
+        for number, postings in enumerate(lists):
+            if None not in postings:
+                entries = sorted(zip(weights, postings), key=lambda entry: len(entry[1].docs))
+                self._collect(number, entries, best, wanted, after)
+        ranked = sorted(best, reverse=True)
+        page = ranked[:limit]
+        next_cursor = encode_cursor(page[-1][0], -page[-1][1]) if len(ranked) > limit else None
+        return [(score, self.segments[number].documents[doc_id]) for score, _, number, doc_id in page], next_cursor
+
+    def _collect(self, number, entries, best, wanted, after):
+        # 조각 하나에서 모든 토큰의 기사 목록을 점수 순서로 한 칸씩 번갈아 읽고, 처음 본 기사는 나머지 토큰을 기사 번호로 찾아 점수를 계산
+        # (Fagin의 threshold algorithm: 아직 읽지 않은 기사의 점수는 각 목록의 현재 위치 점수의 합을 넘을 수 없음)
+        keys = self.segments[number].keys
+        hidden = self._hidden[number]
+        seen = set()
+        frontier = [weight * postings.ranked_impacts[0] for weight, postings in entries]
+        shortest = len(entries[0][1].docs)  # 모든 토큰이 나오는 기사는 가장 짧은 목록에 반드시 있음
+        for position in range(shortest):
+            for i, (weight, postings) in enumerate(entries):
+                if position >= len(postings.docs):
+                    continue
+                doc_id = postings.ranked_docs[position]
+                frontier[i] = weight * postings.ranked_impacts[position]
+                if doc_id in seen or doc_id in hidden:
+                    continue
+                seen.add(doc_id)
+                score = 0.0
+                for other_weight, other in entries:
+                    impact = other.impact(doc_id)
+                    if impact is None:
+                        break
+                    score += other_weight * impact
+                else:
+                    key = keys[doc_id]
+                    if after is not None and (score > after[0] or (score == after[0] and key <= after[1])):
+                        continue  # 이전 쪽에서 이미 반환한 결과
+                    entry = (score, -key, number, doc_id)
+                    if len(best) < wanted:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+            # 아직 읽지 않은 기사는 이 값보다 높은 점수를 받을 수 없으므로, 이미 찾은 결과가 모두 더 높으면 멈춤
+            if len(best) == wanted and best[0][0] > sum(frontier) + 1e-9:
+                break
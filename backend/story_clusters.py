@@ -0,0 +1,204 @@
+# ================================
+# 비슷한 기사 묶기 (MinHash + LSH)
+# ================================
+# 같은 사건을 연합뉴스, 뉴스1, YTN 등이 제목과 본문을 조금씩 바꿔 보도하는 경우가 많다.
+# 본문을 글자 n-gram(shingle) 집합으로 바꾸고 MinHash 서명을 만든 뒤, 서명을 여러 띠(band)로 나누어
+# 띠가 하나라도 같은 기사만 후보로 비교한다(LSH). 모든 기사 쌍을 비교하지 않으므로 기사 수에 거의 비례하는 시간이 든다.
+# 후보 중 추정 유사도(Jaccard)가 기준 이상인 기사가 있으면 같은 묶음(cluster)에 넣고,
+# 묶음마다 대표 기사 하나만 GPT로 평가하여 나머지 기사는 그 요약과 신뢰도를 함께 쓴다.
+# 묶음 정보는 파이프라인의 이벤트 루프에서만 사용한다. (서명 계산은 스레드에서 해도 됨)
+import random  # MinHash 해시 함수의 계수 생성
+import re  # 본문 정규화
+import unicodedata  # 전각/반각 문자 통일
+import zlib  # 실행마다 달라지지 않는 shingle 해시
+
+try:
+    import numpy  # 서명 계산을 한 번에 처리 (없으면 같은 계산을 파이썬으로 함)
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_PRIME = (1 << 31) - 1  # 해시 값은 모두 이 소수보다 작은 정수 (곱해도 64비트 안에 들어감)
+_NON_WORD = re.compile(r"[\W_]+")
+
+LEAD, WAIT, DONE = 'lead', 'wait', 'done'  # claim()의 결과: 대표로 평가, 대표의 평가를 기다림, 대표의 평가가 이미 있음
+
+
+def lsh_params(threshold, num_perm):
+    """
+    유사도 기준에 맞는 (띠 수, 띠당 행 수)를 고릅니다.
+    띠 b개, 행 r개일 때 후보가 되는 유사도의 경계는 대략 (1/b)^(1/r)이므로, 이 값이 기준에 가장 가까운 조합을 씁니다.
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """
+    텍스트를 MinHash 서명으로 바꿉니다.
+    - num_perm: 서명 길이 (길수록 유사도 추정이 정확하지만 느림)
+    - shingle_size: shingle로 사용할 글자 수 (공백과 문장 부호를 뺀 뒤 계산)
+    """
+
+    def __init__(self, num_perm=128, shingle_size=5, seed=1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        generator = random.Random(seed)
+        self._a = [generator.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [generator.randrange(0, _PRIME) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a_array = numpy.array(self._a, dtype=numpy.uint64)[:, None]
+            self._b_array = numpy.array(self._b, dtype=numpy.uint64)[:, None]
+
+    def shingles(self, text):
+        normalized = _NON_WORD.sub("", unicodedata.normalize('NFKC', text).lower())
+        size = self.shingle_size
+        return {zlib.crc32(normalized[i:i + size].encode('utf-8')) & _PRIME
+                for i in range(max(len(normalized) - size + 1, 1))}
+
+    def signature(self, text):
+        hashes = self.shingles(text)
+        if NUMPY_AVAILABLE:
+            values = numpy.fromiter(hashes, dtype=numpy.uint64, count=len(hashes))[None, :]
+            return tuple(((self._a_array * values + self._b_array) % _PRIME).min(axis=1).tolist())
+        return tuple(min((a * value + b) % _PRIME for value in hashes) for a, b in zip(self._a, self._b))
+
+
+def estimated_similarity(signature_a, signature_b):
+    """두 서명에서 같은 자리의 값이 같은 비율(Jaccard 유사도의 추정값)을 반환합니다."""
+    return sum(x == y for x, y in zip(signature_a, signature_b)) / len(signature_a)
+
+
+class LshIndex:
+    """서명을 띠로 나누어 버킷에 넣고, 띠가 하나라도 같은 항목을 후보로 찾는 색인입니다."""
+
+    def __init__(self, bands, rows):
+        self.bands = bands
+        self.rows = rows
+        self._buckets = [{} for _ in range(bands)]
+
+    def _bands(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def insert(self, key, signature):
+        for band, values in self._bands(signature):
+            self._buckets[band].setdefault(values, []).append(key)
+
+    def candidates(self, signature):
+        found = set()
+        for band, values in self._bands(signature):
+            found.update(self._buckets[band].get(values, ()))
+        return found
+
+
+class StoryClusters:
+    """
+    실행 중에 처리되는 기사들을 비슷한 기사끼리 묶고, 묶음마다 대표 기사 하나만 평가하도록 관리합니다.
+    - threshold: 같은 묶음으로 볼 추정 유사도(0~1)의 기준
+    - num_perm, shingle_size: MinHash 설정 (MinHasher 참고)
+    - min_length: 이보다 짧은 본문(본문 수집에 실패해 제목만 있는 기사 등)은 묶지 않음
+    - stats: articles(비교한 기사 수), clusters(기사가 둘 이상인 묶음 수), shared(대표의 평가를 함께 써서 줄인 평가 수)
+    """
+
+    def __init__(self, threshold=0.5, num_perm=128, shingle_size=5, min_length=200):
+        self.threshold = threshold
+        self.min_length = min_length
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self._bands = lsh_params(threshold, num_perm)
+        self.start_run()
+        self.stats = {'articles': 0, 'clusters': 0, 'shared': 0}
+
+    def start_run(self):
+        """묶음 정보를 비웁니다. 한 프로세스에서 파이프라인을 여러 번 실행할 때 실행마다 호출합니다."""
+        self._lsh = LshIndex(*self._bands)
+        self._signatures = []  # 기사 번호 → 서명
+        self._cluster_of = []  # 기사 번호 → 묶음 번호
+        self._clusters = []  # 묶음 번호 → {'members', 'followers', 'result', 'leader'}
+
+    def signature(self, text):
+        """본문의 서명을 만듭니다. 너무 짧은 본문이면 None을 반환합니다. (스레드에서 호출해도 됨)"""
+        if not text or len(text) < self.min_length:
+            return None
+        return self.hasher.signature(text)
+
+    def _best_match(self, signature):
+        best, best_similarity = None, self.threshold
+        for candidate in self._lsh.candidates(signature):
+            similarity = estimated_similarity(signature, self._signatures[candidate])
+            if similarity >= best_similarity:
+                best, best_similarity = candidate, similarity
+        return best
+
+    def claim(self, item, signature, metadata):
+        """
+        서명으로 비슷한 기사의 묶음을 찾아 기사(item)를 넣고, 직접 평가할지 결정합니다.
+        - (LEAD, None): 비슷한 기사가 없으므로 이 기사가 묶음의 대표로 평가됨
+        - (WAIT, None): 대표 기사가 평가 중이므로, 평가가 끝나면 finish()가 함께 돌려줌
+        - (DONE, 결과): 대표 기사의 평가 결과가 이미 있음
+        metadata는 같은 묶음의 다른 기사에 보여 줄 이 기사의 정보(언론사, 제목, 주소 등)입니다.
+        """
+        if signature is None:  # 비교할 수 없는 기사는 혼자 평가
+            return LEAD, None
+        self.stats['articles'] += 1
+        match = self._best_match(signature)
+        number = len(self._signatures)
+        self._signatures.append(signature)
+        self._lsh.insert(number, signature)
+        item['story_article'] = number
+        if match is None:
+            self._cluster_of.append(len(self._clusters))
+            self._clusters.append({'members': [], 'followers': [], 'result': None, 'leader': item})
+        else:
+            self._cluster_of.append(self._cluster_of[match])
+        cluster = self._clusters[self._cluster_of[number]]
+        item['story_member'] = len(cluster['members'])
+        cluster['members'].append(metadata)
+        if match is None:
+            return LEAD, None
+        if len(cluster['members']) == 2:
+            self.stats['clusters'] += 1
+        if cluster['result'] is not None:
+            self.stats['shared'] += 1
+            return DONE, cluster['result']
+        if cluster['leader'] is None:  # 이전 대표의 평가가 실패한 묶음
+            cluster['leader'] = item
+            return LEAD, None
+        self.stats['shared'] += 1
+        cluster['followers'].append(item)
+        return WAIT, None
+
+    def _cluster(self, item):
+        number = item.get('story_article')
+        return None if number is None else self._clusters[self._cluster_of[number]]
+
+    def finish(self, item, result):
+        """대표 기사의 평가 결과를 기록하고, 이 결과를 기다리던 기사들을 반환합니다."""
+        cluster = self._cluster(item)
+        if cluster is None or cluster['leader'] is not item:
+            return []
+        cluster['result'] = result
+        followers, cluster['followers'] = cluster['followers'], []
+        return followers
+
+    def fail(self, item):
+        """대표 기사의 평가가 실패하면 기다리던 기사들을 반환합니다. (이후 같은 묶음에 들어오는 기사는 새 대표가 됨)"""
+        cluster = self._cluster(item)
+        if cluster is None or cluster['leader'] is not item or cluster['result'] is not None:
+            return []
+        followers, cluster['followers'] = cluster['followers'], []
+        self.stats['shared'] -= len(followers)
+        cluster['leader'] = None
+        return followers
+
+    def related(self, item):
+        """같은 묶음에 들어 있는 다른 기사들의 정보(claim에 넘긴 metadata) 목록을 반환합니다."""
+        cluster = self._cluster(item)
+        if cluster is None:
+            return []
+        return [member for i, member in enumerate(cluster['members']) if i != item['story_member']]
@@ -0,0 +1,164 @@
+# ================================
+# 기사 페이지 스트리밍 추출 (본문과 대표 이미지를 찾으면 나머지는 받지 않음)
+# ================================
+# 언론사 페이지는 기사 뒤에 수백 KB의 스크립트, 광고, 주석이 붙어 있는 경우가 많다.
+# 응답을 조각(chunk)으로 받으면서 lxml의 증분 파서(HTMLPullParser)에 넣고, 언론사 규칙의
+# 본문 컨테이너가 닫히고 대표 이미지 태그가 나오면 그 자리에서 연결을 닫는다.
+# 읽을 최대 바이트 수와 최대 시간을 넘겨도 멈추고, 그때까지 받은 부분만으로 추출한다.
+# 바이트는 파이썬의 증분 디코더로 문자열로 바꿔 파서에 넣으므로, lxml이 모르는 인코딩 이름(ks_c_5601-1987 등)도 읽을 수 있고,
+# 그래도 증분 파서가 실패하면 제한 안에서 나머지를 받아 일반 추출기로 처리한다.
+# 증분 파서는 멈출 위치를 찾는 데 쓰고, 본문과 이미지는 설정된 추출 백엔드(EXTRACTION_BACKEND)로 찾는다.
+# (백엔드가 lxml이면 증분 파서가 만든 트리에 규칙을 바로 적용하고, 다른 백엔드면 받은 부분을 그 백엔드로 파싱함)
+import codecs  # 인코딩 이름 확인, 조각 단위 디코딩
+import itertools  # 첫 조각을 먼저 살펴본 뒤 다시 이어 붙이기 위한 도구
+import re  # 페이지 앞부분에서 문자 인코딩 선언 찾기
+import threading  # 여러 작업자가 동시에 통계를 갱신할 때 사용하는 잠금
+import time  # 읽기 시간 제한
+
+from extractors import LXML_AVAILABLE, LxmlExtractor  # 증분 파싱이 가능한 lxml 백엔드 (트리를 그대로 쓸 수 있는지 확인)
+
+if LXML_AVAILABLE:
+    from lxml import etree  # HTMLPullParser
+
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w-]+)", re.IGNORECASE)
+# 파이썬이 모르는 인코딩 이름 (한국어 페이지에서 흔함)
+_ENCODING_ALIASES = {'x-windows-949': 'cp949', 'windows-949': 'cp949', 'ks_c_5601': 'cp949'}
+
+
+def normalize_encoding(label, default='utf-8'):
+    """
+    인코딩 이름을 파이썬 코덱 이름으로 바꿉니다. 모르는 이름이면 default를 반환합니다.
+    브라우저처럼 EUC-KR 계열(ks_c_5601-1987 등)은 확장 문자까지 읽을 수 있는 CP949로 봅니다.
+    """
+    label = (label or '').strip().lower()
+    try:
+        name = codecs.lookup(_ENCODING_ALIASES.get(label, label)).name
+    except LookupError:
+        return default
+    return 'cp949' if name == 'euc_kr' else name
+
+
+def sniff_encoding(head, default='utf-8'):
+    """페이지 앞부분(바이트)의 <meta charset> 선언으로 문자 인코딩을 찾습니다. 없으면 default를 반환합니다."""
+    match = _META_CHARSET.search(head[:4096])
+    return normalize_encoding(match.group(1).decode('ascii'), default) if match else default
+
+
+class _CompletionWatcher:
+    """
+    증분 파서의 시작/끝 이벤트를 보고, 본문 컨테이너와 첫 번째 이미지 위치가 완성됐는지 판단합니다.
+    본문은 규칙의 모든 본문 선택자를 지켜보다가, 지금까지 찾은 것 중 가장 우선인 컨테이너가 닫히면 완성으로 봅니다.
+    (대체 선택자는 보통 우선 선택자를 감싸는 요소(article 등)라서, 우선 컨테이너가 있으면 그것이 먼저 닫힘)
+    """
+
+    def __init__(self, rule, want_body):
+        self.rule = rule
+        self.want_body = want_body
+        self.image_found = False
+        # 이미지 위치가 <meta> 태그라면 </head> 이후에는 나올 수 없으므로, 그때 이미지 찾기를 끝냄
+        self.image_in_head = rule.image[0].tag == 'meta'
+        self.containers = [None] * len(rule.body)  # 선택자별로 처음 일치한 컨테이너
+        self.closed = set()  # 닫힌 컨테이너의 선택자 번호
+
+    def _body_done(self):
+        best = next((i for i, container in enumerate(self.containers) if container is not None), None)
+        return best is not None and best in self.closed
+
+    def update(self, event, element):
+        if event == 'start' and isinstance(element.tag, str):
+            image = self.rule.image[0]
+            if not self.image_found and image.matches(element.tag, element.attrib) and element.get(image.attribute):
+                self.image_found = True
+            if self.want_body:
+                for i, selector in enumerate(self.rule.body):
+                    if self.containers[i] is None and selector.matches(element.tag, element.attrib):
+                        self.containers[i] = element
+        elif event == 'end':
+            for i, container in enumerate(self.containers):
+                if element is container:
+                    self.closed.add(i)
+            if element.tag == 'head' and self.image_in_head:
+                self.image_found = True  # 이미지가 없는 페이지로 확정
+        return self.image_found and (not self.want_body or self._body_done())
+
+
+class StreamingExtractor:
+    """
+    응답 본문을 조각 단위로 읽으면서 언론사 규칙으로 본문과 대표 이미지를 추출합니다.
+    - rule_extractor: 언론사 규칙 추출기 (규칙 저장소와 추출 백엔드를 그대로 사용하고, lxml이 없으면 페이지를 받은 뒤 추출)
+    - max_bytes: 한 페이지에서 읽을 최대 바이트 수
+    - max_seconds: 한 페이지를 읽는 데 쓸 최대 시간(초)
+    - stats: pages(페이지 수), early_stops(필요한 부분을 찾아 일찍 멈춘 수),
+      limit_stops(제한에 걸려 멈춘 수), bytes_read(실제로 읽은 바이트 수)
+    """
+
+    def __init__(self, rule_extractor, max_bytes=2_000_000, max_seconds=10.0):
+        self.rule_extractor = rule_extractor
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        # 증분 파서가 만든 트리는 lxml 트리이므로, 추출 백엔드가 lxml일 때만 그 트리에 규칙을 바로 적용함
+        self._reuse_tree = isinstance(rule_extractor.backend, LxmlExtractor)
+        self._lock = threading.Lock()
+        self.stats = {'pages': 0, 'early_stops': 0, 'limit_stops': 0, 'bytes_read': 0}
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _extract_whole(self, url, received, chunks, read, started, encoding, want_body):
+        # 이미 받은 조각(received)에 이어 제한 안에서 나머지를 받은 뒤 일반 추출기로 처리
+        for chunk in chunks:
+            received.append(chunk)
+            read += len(chunk)
+            if read >= self.max_bytes or time.monotonic() - started >= self.max_seconds:
+                self._count('limit_stops')
+                break
+        self._count('bytes_read', read)
+        html = b"".join(received).decode(encoding, errors='replace')
+        return self.rule_extractor.extract(url, html, want_body)
+
+    def extract(self, url, chunks, encoding=None, want_body=True):
+        """
+        바이트 조각들(response.iter_bytes())을 읽으며 (본문 텍스트, 대표 이미지 주소)를 반환합니다.
+        encoding이 None이면 문서 앞부분의 <meta charset>으로 판단하고, 그것도 없으면 UTF-8로 봅니다.
+        want_body=False면 이미지만 찾습니다.
+        """
+        rule = self.rule_extractor.registry.for_url(url)
+        self._count('pages')
+        started = time.monotonic()
+        chunks = iter(chunks)
+        first = next(chunks, b"")
+        encoding = normalize_encoding(encoding) if encoding else sniff_encoding(first)
+        chunks = itertools.chain([first], chunks)
+        if not LXML_AVAILABLE:  # lxml이 없으면 제한 안에서 받은 뒤 일반 추출기로 처리
+            return self._extract_whole(url, [], chunks, 0, started, encoding, want_body)
+        # 증분 파서가 실패하면 일반 추출기로 다시 처리할 수 있도록 받은 조각을 모아 둠 (최대 max_bytes)
+        received, read, finished = [], 0, False
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        parser = etree.HTMLPullParser(events=('start', 'end'))
+        watcher = _CompletionWatcher(rule, want_body)
+        try:
+            for chunk in chunks:
+                received.append(chunk)
+                read += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                for event, element in parser.read_events():
+                    if watcher.update(event, element):
+                        finished = True
+                if finished:
+                    self._count('early_stops')
+                    break
+                if read >= self.max_bytes or time.monotonic() - started >= self.max_seconds:
+                    self._count('limit_stops')
+                    break
+            else:
+                parser.feed(decoder.decode(b"", final=True))
+            root = parser.close()  # 닫히지 않은 태그는 파서가 알아서 닫아 줌
+        except etree.LxmlError:
+            return self._extract_whole(url, received, chunks, read, started, encoding, want_body)
+        self._count('bytes_read', read)
+        if not self._reuse_tree:  # 받은 부분만 설정된 백엔드로 파싱
+            return self.rule_extractor.extract(url, b"".join(received).decode(encoding, errors='replace'), want_body)
+        if root is None:
+            return None, None
+        return self.rule_extractor.extract_document(rule, root, want_body)
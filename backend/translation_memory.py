@@ -0,0 +1,104 @@
+# ================================
+# 번역 메모리 (원문 해시 + 출발/도착 언어 기반, SQLite)
+# ================================
+# 여러 언론사가 같은 제목을 쓰거나 캐시된 요약이 매 실행마다 다시 번역되는 것을 막기 위해,
+# (원문 텍스트의 해시, 출발 언어, 도착 언어)를 키로 번역 결과를 저장해 두고 언어별로 재사용한다.
+# 번역에 실패한 값("번역 오류" 등)은 절대 저장하지 않는다.
+import hashlib  # 원문 텍스트를 짧은 해시 키로 바꾸기 위한 라이브러리
+import os  # 저장 폴더 생성
+import sqlite3  # 파일 기반 데이터베이스
+import threading  # 여러 작업자가 동시에 접근할 때 사용하는 잠금
+import time  # 사용 시각 기록 (LRU 정리 기준)
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """
+    번역 결과를 언어 쌍별로 저장하는 번역 메모리입니다.
+    - max_entries: 저장할 최대 번역 수 (넘으면 가장 오래 사용하지 않은 번역부터 삭제)
+    """
+
+    def __init__(self, path, max_entries=500000):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS translation_memory (
+                   text_hash TEXT NOT NULL,
+                   from_lang TEXT NOT NULL,
+                   to_lang TEXT NOT NULL,
+                   translation TEXT NOT NULL,
+                   last_access REAL NOT NULL,
+                   PRIMARY KEY (text_hash, from_lang, to_lang)
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tm_access ON translation_memory(last_access)")
+        self._conn.commit()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def lookup(self, texts, from_lang, to_langs):
+        """
+        텍스트 목록의 언어별 번역을 찾습니다.
+        반환값은 텍스트와 같은 순서의 {도착 언어: 번역문} 목록이며, 저장되지 않은 언어는 빠져 있습니다.
+        """
+        hashes = [text_hash(text) for text in texts]
+        found = {}
+        with self._lock:
+            unique = list(set(hashes))
+            for start in range(0, len(unique), 500):  # SQLite 변수 개수 제한을 넘지 않도록 나누어 조회
+                chunk = unique[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                lang_placeholders = ",".join("?" * len(to_langs))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, to_lang, translation FROM translation_memory "
+                    f"WHERE from_lang = ? AND text_hash IN ({placeholders}) AND to_lang IN ({lang_placeholders})",
+                    [from_lang, *chunk, *to_langs],
+                ).fetchall()
+                for hash_value, to_lang, translation in rows:
+                    found.setdefault(hash_value, {})[to_lang] = translation
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE translation_memory SET last_access = ? WHERE text_hash = ? AND from_lang = ?",
+                    [(now, hash_value, from_lang) for hash_value in found],
+                )
+                self._conn.commit()
+            results = [dict(found.get(hash_value, {})) for hash_value in hashes]
+            for result in results:  # 여러 번역 작업자가 함께 부르므로 통계도 잠금 안에서 갱신
+                self.stats['hits'] += len(result)
+                self.stats['misses'] += len(to_langs) - len(result)
+        return results
+
+    def store(self, from_lang, entries):
+        """
+        (원문, {도착 언어: 번역문}) 목록을 한 번에 저장합니다.
+        번역 실패 값은 호출하는 쪽에서 걸러서 넘겨야 합니다.
+        """
+        now = time.time()
+        rows = [(text_hash(text), from_lang, to_lang, translation, now)
+                for text, translations in entries for to_lang, translation in translations.items()]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translation_memory (text_hash, from_lang, to_lang, translation, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM translation_memory").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM translation_memory WHERE rowid IN "
+                    "(SELECT rowid FROM translation_memory ORDER BY last_access LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,91 @@
+# ================================
+# Azure 번역기 묶음(batch) 요청
+# ================================
+# 기사마다 번역 요청을 한 번씩 보내는 대신, 여러 기사의 텍스트를 모아
+# API 한도(요청당 요소 수, 글자 수) 안에서 최대한 크게 묶어 보낸다.
+# 묶음들은 공용 HTTP 클라이언트(http_client)로 동시에 보내고, 결과는 원래 순서대로 돌려준다.
+import threading  # 여러 묶음을 보내는 스레드가 통계를 함께 갱신할 때 사용하는 잠금
+import uuid  # 요청 추적 ID 생성
+from concurrent.futures import ThreadPoolExecutor  # 여러 묶음을 동시에 보내기 위한 스레드 풀
+
+MAX_ELEMENTS_PER_REQUEST = 100  # 요청 하나에 담을 수 있는 최대 텍스트 수
+MAX_CHARS_PER_REQUEST = 50000  # 요청 하나에 담을 수 있는 최대 글자 수 (공백 포함)
+
+
+def pack_batches(texts, max_elements=MAX_ELEMENTS_PER_REQUEST, max_chars=MAX_CHARS_PER_REQUEST):
+    """텍스트 목록을 한도 안에 들어가는 묶음들로 나눕니다. 각 묶음은 원래 위치(인덱스)의 리스트입니다."""
+    batches, current, current_chars = [], [], 0
+    for i, text in enumerate(texts):
+        length = len(text)
+        if current and (len(current) >= max_elements or current_chars + length > max_chars):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(i)  # 한도보다 긴 텍스트 하나는 단독 묶음으로 보냄
+        current_chars += length
+    if current:
+        batches.append(current)
+    return batches
+
+
+class AzureTranslator:
+    """
+    Azure 번역기(Translator v3)에 묶음 요청을 보내는 클라이언트입니다.
+    - session: post를 제공하는 공용 HTTP 클라이언트 (HttpClient, 연결은 클라이언트가 관리하므로 닫지 않음)
+    - max_workers: 동시에 보낼 최대 묶음 수
+    - timeout: 요청 하나의 제한 시간(초)
+    """
+
+    def __init__(self, endpoint, key, region, session, max_workers=4, timeout=15):
+        self.url = f"{endpoint.rstrip('/')}/translate"
+        self.key = key
+        self.region = region
+        self.timeout = timeout
+        self.session = session
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'texts': 0, 'failed_requests': 0}
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _post(self, texts, target_languages, from_language):
+        headers = {
+            'Ocp-Apim-Subscription-Key': self.key,
+            'Ocp-Apim-Subscription-Region': self.region,
+            'Content-type': 'application/json',
+            'X-ClientTraceId': str(uuid.uuid4()),
+        }
+        params = {'api-version': '3.0', 'from': from_language, 'to': target_languages}
+        body = [{'text': text} for text in texts]
+        self._count('requests')
+        response = self.session.post(self.url, params=params, headers=headers, json=body, timeout=self.timeout)
+        response.raise_for_status()
+        # 응답은 요청 본문과 같은 순서의 목록이며, 각 항목에 언어별 번역이 들어 있음
+        return [{t['to']: t['text'] for t in result['translations']} for result in response.json()]
+
+    def translate(self, texts, target_languages, from_language='ko'):
+        """
+        텍스트 목록을 번역하여 같은 순서의 {언어코드: 번역문} 목록을 반환합니다.
+        요청에 실패한 묶음에 속한 텍스트는 None입니다.
+        """
+        results = [None] * len(texts)
+        if not texts:
+            return results
+        self._count('texts', len(texts))
+        batches = pack_batches(texts)
+        futures = {self._executor.submit(self._post, [texts[i] for i in batch], target_languages, from_language): batch
+                   for batch in batches}
+        for future, batch in futures.items():
+            try:
+                translated = future.result()
+            except Exception as e:
+                self._count('failed_requests')
+                print(f"Azure 번역 API 오류: {e}")
+                continue
+            for index, translation in zip(batch, translated):
+                results[index] = translation
+        return results
+
+    def close(self):
+        self._executor.shutdown(wait=False)
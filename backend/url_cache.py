@@ -0,0 +1,91 @@
+# ================================
+# 구글 뉴스 링크 → 원문 주소 캐시 (SQLite)
+# ================================
+# 매시간 실행될 때마다 같은 구글 뉴스 링크를 다시 변환하지 않도록,
+# 변환 결과를 디스크에 저장해 두고 다음 실행에서 먼저 찾아본다.
+# - TTL: 성공한 결과와 실패한 결과(부정 캐시)의 유효 기간을 따로 둔다.
+# - LRU: 최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 지운다.
+import os  # 캐시 파일이 들어갈 폴더 생성
+import sqlite3  # 별도 설치 없이 사용할 수 있는 파일 기반 데이터베이스
+import threading  # 여러 작업자가 동시에 접근할 때 사용하는 잠금
+import time  # 저장 시각 및 만료 판단
+
+
+class UrlCache:
+    """
+    구글 뉴스 링크를 키로 {original_url, image_url, resolved_at}을 저장하는 캐시입니다.
+    - ttl: 변환에 성공한 결과의 유효 기간(초)
+    - negative_ttl: 변환에 실패한 링크를 다시 시도하지 않을 기간(초)
+    - max_entries: 저장할 최대 항목 수 (넘으면 LRU 방식으로 정리)
+    """
+
+    def __init__(self, path, ttl=7 * 24 * 3600, negative_ttl=3600, max_entries=50000):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")  # 읽기와 쓰기가 서로 막지 않도록 설정
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS url_cache (
+                   link TEXT PRIMARY KEY,
+                   original_url TEXT,
+                   image_url TEXT,
+                   resolved_at REAL NOT NULL,
+                   last_access REAL NOT NULL,
+                   failed INTEGER NOT NULL DEFAULT 0
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_url_cache_access ON url_cache(last_access)")
+        self._conn.commit()
+        self.stats = {'hits': 0, 'negative_hits': 0, 'misses': 0}
+
+    def get(self, link):
+        """
+        저장된 결과를 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+        반환값의 'failed'가 True이면 최근에 변환에 실패한 링크라는 뜻입니다.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT original_url, image_url, resolved_at, failed FROM url_cache WHERE link = ?", (link,)
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            original_url, image_url, resolved_at, failed = row
+            if now - resolved_at > (self.negative_ttl if failed else self.ttl):  # 유효 기간이 지난 항목은 삭제
+                self._conn.execute("DELETE FROM url_cache WHERE link = ?", (link,))
+                self._conn.commit()
+                self.stats['misses'] += 1
+                return None
+            self._conn.execute("UPDATE url_cache SET last_access = ? WHERE link = ?", (now, link))
+            self._conn.commit()
+            self.stats['negative_hits' if failed else 'hits'] += 1
+        return {'original_url': original_url, 'image_url': image_url, 'resolved_at': resolved_at, 'failed': bool(failed)}
+
+    def put(self, link, original_url, image_url, failed=False):
+        """변환 결과를 저장합니다. 실패한 경우 failed=True로 저장하면 부정 캐시로 사용됩니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO url_cache (link, original_url, image_url, resolved_at, last_access, failed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (link, original_url, image_url, now, now, int(failed)),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        # 최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+        count = self._conn.execute("SELECT COUNT(*) FROM url_cache").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM url_cache WHERE link IN (SELECT link FROM url_cache ORDER BY last_access LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,21 +1,32 @@
 "use client";
 
-import { useRef, useState, MouseEvent } from 'react';
-import { NewsArticle } from '@/types';
+import { useEffect, useRef, useState, MouseEvent } from 'react';
+import { FeedArticle, FeedPage } from '@/types';
 import { useLanguage } from '@/components/LanguageSelector'; // 경로 수정
+import { fetchJson, apiUrl } from '@/lib/newsApi';
 
-interface FeaturedNewsProps {
-  articles: NewsArticle[];
-}
+const FEATURED_COUNT = 4; // 주요 뉴스에 보여 줄 기사 수
 
-export default function FeaturedNews({ articles }: FeaturedNewsProps) {
-  const featuredArticles = articles.slice(0, 4);
+// 주요 뉴스는 뉴스 API(/feed)의 최신 기사 첫 쪽만 불러오므로, 기사가 아무리 쌓여도 요청 크기는 같습니다.
+export default function FeaturedNews() {
   const { selectedLanguage } = useLanguage();
+  const [featuredArticles, setFeaturedArticles] = useState<FeedArticle[]>([]);
   const sliderRef = useRef<HTMLDivElement>(null);
   const [isDown, setIsDown] = useState(false);
   const [startX, setStartX] = useState(0);
   const [scrollLeft, setScrollLeft] = useState(0);
 
+  // 언어를 바꾸면 그 언어의 제목으로 다시 불러옴 (이전 언어의 요청은 취소)
+  useEffect(() => {
+    const controller = new AbortController();
+    fetchJson<FeedPage>(apiUrl('/feed', { lang: selectedLanguage, limit: String(FEATURED_COUNT) }), controller.signal)
+      .then(page => setFeaturedArticles(page.results))
+      .catch(error => {
+        if (error.name !== 'AbortError') console.error("주요 뉴스 요청 중 오류 발생:", error);
+      });
+    return () => controller.abort();
+  }, [selectedLanguage]);
+
   const handleMouseDown = (e: MouseEvent<HTMLDivElement>) => {
     if (!sliderRef.current) return;
     setIsDown(true);
@@ -55,7 +66,7 @@ export default function FeaturedNews({ articles }: FeaturedNewsProps) {
         >
           {featuredArticles.map((news) => (
             <a
-              key={news.link}
+              key={news.id}
               href={news.link}
               target="_blank"
               rel="noopener noreferrer"
@@ -68,7 +79,7 @@ export default function FeaturedNews({ articles }: FeaturedNewsProps) {
             >
               <div className="relative w-full h-40 bg-gray-200">
                 {news.imageUrl ? (
-                  <img src={news.imageUrl} alt={news.translatedTitles[selectedLanguage] || news.translatedTitles['ko']} className="w-full h-full object-cover" />
+                  <img src={news.imageUrl} alt={news.title} className="w-full h-full object-cover" />
                 ) : (
                   <div className="flex items-center justify-center w-full h-full">
                     <span className="text-gray-500 text-sm">이미지 없음</span>
@@ -77,7 +88,7 @@ export default function FeaturedNews({ articles }: FeaturedNewsProps) {
               </div>
               <div className="p-4">
                 <h3 className="font-bold text-md text-gray-800 line-clamp-2 h-12">
-                  {news.translatedTitles[selectedLanguage] || news.translatedTitles['ko']}
+                  {news.title}
                 </h3>
                 <p className="text-xs text-gray-500 mt-2">{news.source}</p>
               </div>
@@ -1,48 +1,103 @@
 "use client";
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import NewsCard from '@/components/NewsCard';
-import { NewsArticle, Publisher, NewsCategory, CATEGORIES, CATEGORY_TRANSLATIONS } from '@/types';
+import { FeedArticle, FeedPage, Publisher, NewsCategory, CATEGORIES, CATEGORY_TRANSLATIONS } from '@/types';
 import { useLanguage } from '@/components/LanguageSelector';
 import { uiTexts } from '@/lib/i18n';
+import { fetchJson, apiUrl } from '@/lib/newsApi';
 import { FaSearch } from 'react-icons/fa';
 
-interface NewsSectionProps {
-  allNews: NewsArticle[];
-}
+const PAGE_SIZE = 24; // 한 번에 불러오는 기사 수
+const SEARCH_DELAY_MS = 300; // 검색어 입력이 멈춘 뒤 요청하기까지 기다리는 시간
 
-export default function NewsSection({ allNews }: NewsSectionProps) {
+// 기사 목록은 서버가 조건(카테고리, 언론사, 검색어, 언어)으로 걸러 한 쪽씩 보내 주므로,
+// 전체 기사를 받지 않고 '더 보기'를 누를 때마다 다음 쪽만 불러옵니다.
+export default function NewsSection() {
   const { selectedLanguage } = useLanguage();
   
   const [selectedCategory, setSelectedCategory] = useState<NewsCategory | 'all'>('all');
   const [searchTerm, setSearchTerm] = useState<string>('');
+  const [submittedSearchTerm, setSubmittedSearchTerm] = useState<string>('');
+  const [selectedPublisher, setSelectedPublisher] = useState<Publisher | 'all'>('all');
+  const [publishers, setPublishers] = useState<Publisher[]>([]);
+  const [articles, setArticles] = useState<FeedArticle[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoading, setIsLoading] = useState<boolean>(false);
+  const loadMoreController = useRef<AbortController | null>(null);
 
-  const categoryFilteredNews = selectedCategory === 'all'
-    ? allNews
-    : allNews.filter(news => news.category === selectedCategory);
+  const category = selectedCategory === 'all' ? null : selectedCategory;
+  const feedParams = {
+    category,
+    source: selectedPublisher === 'all' ? null : selectedPublisher,
+    q: submittedSearchTerm.trim(),
+    lang: selectedLanguage,
+    limit: String(PAGE_SIZE),
+  };
 
-  const uniquePublishers = [...new Set(categoryFilteredNews.map(news => news.source))];
-  const [selectedPublisher, setSelectedPublisher] = useState<Publisher | 'all'>('all');
+  // 카테고리를 바꾸면 언론사 선택을 함께 풀어서, 이전 언론사 조건으로 한 번 더 요청하지 않도록 함
+  const selectCategory = (nextCategory: NewsCategory | 'all') => {
+    setSelectedCategory(nextCategory);
+    setSelectedPublisher('all');
+  };
 
+  // 검색어는 입력이 잠시 멈췄을 때 요청
   useEffect(() => {
-    setSelectedPublisher('all');
-  }, [selectedCategory]);
+    const timer = setTimeout(() => setSubmittedSearchTerm(searchTerm), SEARCH_DELAY_MS);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
 
-  let filteredNews = categoryFilteredNews.filter(news =>
-    selectedPublisher === 'all' || news.source === selectedPublisher
-  );
+  // 카테고리의 언론사 목록
+  useEffect(() => {
+    const controller = new AbortController();
+    fetchJson<{ results: { source: Publisher }[] }>(apiUrl('/sources', { category }), controller.signal)
+      .then(data => setPublishers(data.results.map(item => item.source)))
+      .catch(error => {
+        if (error.name !== 'AbortError') console.error("언론사 목록 요청 중 오류 발생:", error);
+      });
+    return () => controller.abort();
+  }, [category]);
 
-  if (searchTerm) {
-    const lowerCaseSearchTerm = searchTerm.toLowerCase();
-    filteredNews = filteredNews.filter(news => 
-      (news.translatedTitles[selectedLanguage] || news.translatedTitles['ko'])
-        .toLowerCase()
-        .includes(lowerCaseSearchTerm) ||
-      (news.translatedSummaries[selectedLanguage] || news.translatedSummaries['ko'])
-        .toLowerCase()
-        .includes(lowerCaseSearchTerm)
-    );
-  }
+  // 조건이 바뀌면 첫 쪽부터 다시 불러옴 (이전 조건의 요청은 취소)
+  const feedUrl = apiUrl('/feed', feedParams);
+  useEffect(() => {
+    const controller = new AbortController();
+    loadMoreController.current?.abort();
+    setIsLoading(true);
+    fetchJson<FeedPage>(feedUrl, controller.signal)
+      .then(page => {
+        setArticles(page.results);
+        setNextCursor(page.nextCursor);
+        setIsLoading(false);
+      })
+      .catch(error => {
+        if (error.name === 'AbortError') return;
+        console.error("뉴스 목록 요청 중 오류 발생:", error);
+        setArticles([]);
+        setNextCursor(null);
+        setIsLoading(false);
+      });
+    return () => controller.abort();
+  }, [feedUrl]);
+
+  // 다음 쪽을 불러와 목록 뒤에 붙임
+  const loadMore = () => {
+    if (!nextCursor || isLoading) return;
+    const controller = new AbortController();
+    loadMoreController.current = controller;
+    setIsLoading(true);
+    fetchJson<FeedPage>(apiUrl('/feed', { ...feedParams, cursor: nextCursor }), controller.signal)
+      .then(page => {
+        setArticles(previous => [...previous, ...page.results]);
+        setNextCursor(page.nextCursor);
+        setIsLoading(false);
+      })
+      .catch(error => {
+        if (error.name === 'AbortError') return;
+        console.error("뉴스 목록 요청 중 오류 발생:", error);
+        setIsLoading(false);
+      });
+  };
 
   const placeholderText: Record<string, string> = {
     ko: "뉴스 검색...",
@@ -52,6 +107,22 @@ export default function NewsSection({ allNews }: NewsSectionProps) {
     fr: "Rechercher des nouvelles...",
   };
 
+  const loadMoreText: Record<string, string> = {
+    ko: "더 보기",
+    en: "Load more",
+    ja: "もっと見る",
+    'zh-Hans': "加载更多",
+    fr: "Voir plus",
+  };
+
+  const emptyText: Record<string, string> = {
+    ko: "표시할 뉴스가 없습니다.",
+    en: "No news to show.",
+    ja: "表示するニュースがありません。",
+    'zh-Hans': "没有可显示的新闻。",
+    fr: "Aucune actualité à afficher.",
+  };
+
   return (
     <main className="bg-gray-50 overflow-hidden">
       {/* --- 분야별 뉴스 선택 UI (상단) --- */}
@@ -75,7 +146,7 @@ export default function NewsSection({ allNews }: NewsSectionProps) {
 
           <div className="flex justify-center flex-wrap gap-x-4 gap-y-2">
             <button
-              onClick={() => setSelectedCategory('all')}
+              onClick={() => selectCategory('all')}
               className={`px-4 py-2 rounded-full font-semibold transition-colors text-sm md:text-base ${
                 selectedCategory === 'all'
                   ? 'bg-blue-600 text-white'
@@ -87,7 +158,7 @@ export default function NewsSection({ allNews }: NewsSectionProps) {
             {(Object.keys(CATEGORIES) as NewsCategory[]).map(category => (
               <button
                 key={category}
-                onClick={() => setSelectedCategory(category)}
+                onClick={() => selectCategory(category)}
                 className={`px-4 py-2 rounded-full font-semibold transition-colors text-sm md:text-base ${
                   selectedCategory === category
                     ? 'bg-blue-600 text-white'
@@ -106,20 +177,36 @@ export default function NewsSection({ allNews }: NewsSectionProps) {
       <div className="flex flex-col md:flex-row gap-12 pt-18 pb-8 px-8">
       {/* ▲▲▲ [수정] ▲▲▲ */}
         
-        <section className="flex-grow grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-3 gap-6">
-          {filteredNews.map((news, index) => (
-            <NewsCard
-              key={news.link + index}
-              link={news.link}
-              title={news.translatedTitles[selectedLanguage] || news.translatedTitles['ko']}
-              source={news.source}
-              date={news.date}
-              summary={news.translatedSummaries[selectedLanguage] || news.translatedSummaries['ko']}
-              reliability={news.reliability}
-              imageUrl={news.imageUrl}
-            />
-          ))}
-        </section>
+        <div className="flex-grow flex flex-col gap-8">
+          <section className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-3 gap-6">
+            {articles.map(news => (
+              <NewsCard
+                key={news.id}
+                link={news.link}
+                title={news.title}
+                source={news.source}
+                date={news.date}
+                summary={news.summary}
+                reliability={news.reliability}
+                imageUrl={news.imageUrl ?? undefined}
+              />
+            ))}
+          </section>
+
+          {!isLoading && articles.length === 0 && (
+            <p className="text-center text-gray-500 py-10">{emptyText[selectedLanguage] || emptyText.ko}</p>
+          )}
+
+          {nextCursor && (
+            <button
+              onClick={loadMore}
+              disabled={isLoading}
+              className="self-center px-6 py-2 rounded-full font-semibold transition-colors bg-white text-gray-700 hover:bg-gray-100 shadow-sm disabled:opacity-50"
+            >
+              {loadMoreText[selectedLanguage] || loadMoreText.en}
+            </button>
+          )}
+        </div>
 
         <aside className="w-full md:w-32 flex-shrink-0">
           <h2 className="text-xl font-bold mb-4 text-center md:text-left">{uiTexts.newsByPublisher[selectedLanguage]}</h2>
@@ -135,7 +222,7 @@ export default function NewsSection({ allNews }: NewsSectionProps) {
             >
               {uiTexts.all[selectedLanguage]}
             </button>
-            {uniquePublishers.map(publisher => (
+            {publishers.map(publisher => (
               <button
                 key={publisher}
                 onClick={() => setSelectedPublisher(publisher)}
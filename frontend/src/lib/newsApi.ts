@@ -0,0 +1,20 @@
+// 뉴스 API 서버 주소 (backend/api.py)
+export const NEWS_API_URL = process.env.NEXT_PUBLIC_NEWS_API_URL || 'http://localhost:8000';
+
+// 뉴스 API의 JSON 응답 (잘못된 커서/날짜의 400 등 실패 응답은 오류로 바꿔 catch에서 처리)
+export const fetchJson = async <T,>(url: string, signal: AbortSignal): Promise<T> => {
+  const response = await fetch(url, { signal });
+  if (!response.ok) {
+    throw new Error(`뉴스 API 요청 실패 (${response.status}): ${url}`);
+  }
+  return response.json() as Promise<T>;
+};
+
+// 값이 있는 조건만 쿼리 문자열로 붙인 API 주소
+export const apiUrl = (path: string, params: Record<string, string | null | undefined>) => {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value) query.set(key, value);
+  });
+  return `${NEWS_API_URL}${path}?${query}`;
+};
@@ -66,23 +66,26 @@ export const CATEGORY_TRANSLATIONS: Record<NewsCategory, Record<LanguageCode, st
 };
 
 /**
- * 개별 뉴스 기사 데이터 구조 타입
- * HTML의 다국어 제목 구조를 반영하여 수정합니다.
+ * 뉴스 API(/feed)가 반환하는 기사 한 개
+ * lang을 주고 요청하므로 제목과 요약은 그 언어 하나만 들어 있습니다. (번역이 없으면 한국어)
  */
-export type NewsArticle = {
-  category: NewsCategory;
-  subCategory: NewsSubCategory;
-  
-  // ▼▼▼ [수정] 단일 제목(title) 대신 다국어 제목 객체(translatedTitles)를 사용합니다. ▼▼▼
-  translatedTitles: Record<LanguageCode, string>;
-  // 다국어 요약 객체
-  translatedSummaries: Record<LanguageCode, string>;
-  // ▲▲▲ [수정] ▲▲▲
-
+export type FeedArticle = {
+  id: number;
+  title: string;
+  summary: string;
   link: string;
   source: Publisher;
   date: string;
   reliability: Reliability;
-  evaluation?: string;
-  imageUrl?: string;
+  imageUrl?: string | null;
+  categories: [NewsCategory, NewsSubCategory][];
+  language: LanguageCode;
+};
+
+/**
+ * 뉴스 API(/feed)의 한 쪽 응답 (nextCursor를 cursor로 넘기면 다음 쪽, 없으면 마지막 쪽)
+ */
+export type FeedPage = {
+  results: FeedArticle[];
+  nextCursor: string | null;
 };
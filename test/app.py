@@ -1,14 +1,25 @@
 import os
+import sys
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from bs4 import BeautifulSoup
 
+# 검색 색인은 backend 폴더의 모듈을 함께 사용
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+from search_index import SearchIndex  # 제목/요약/언론사의 역색인과 BM25 순위
+from article_snapshot import ArticleSnapshot, SnapshotWatcher, SnapshotCompactor, read_manifest  # 파이프라인이 만든 기사 스냅샷 (메모리 매핑)
+
 # ================================
 # 1. 설정
 # ================================
 # 사용자께서 알려주신 뉴스 파일 저장 경로
 output_directory = 'C:/Users/admin/Desktop/news/test1/output'
-NEWS_DATA = [] # 뉴스 데이터를 메모리에 저장할 리스트
+NEWS_DATA = [] # 뉴스 데이터 목록 (스냅샷이 있으면 필요한 기사만 파일에서 읽는 ArticleSnapshot)
+SEARCH_INDEX = SearchIndex([]) # NEWS_DATA로 만든 검색 색인 (데이터를 불러오기 전에는 빈 색인, 스냅샷이면 스냅샷 자체)
+SNAPSHOT_POLL_SECONDS = 5 # 파이프라인이 스냅샷에 새 조각을 덧붙였는지 확인하는 간격
+SNAPSHOT_COMPACT_SECONDS = 600 # 쌓인 스냅샷 조각을 합치는 간격
+SEARCH_PAGE_SIZE = 20 # 검색 결과 한 쪽의 기본 기사 수
+SEARCH_MAX_PAGE_SIZE = 100 # 한 번에 요청할 수 있는 최대 기사 수
 
 # ================================
 # 2. Flask 앱 초기화
@@ -22,11 +33,22 @@ CORS(app)
 # ================================
 def load_news_data():
     """
-    서버가 시작될 때 output 폴더의 모든 HTML 파일에서 기사 정보를 읽어
-    NEWS_DATA 리스트에 저장합니다. 검색 속도를 높이기 위한 전처리 과정입니다.
+    서버가 시작될 때 파이프라인이 만든 기사 스냅샷과 검색 색인을 메모리 매핑으로 엽니다.
+    (기사는 검색 결과로 요청될 때만 읽으므로 기사 수와 관계없이 바로 시작)
+    스냅샷이 없는 예전 결과 폴더는 모든 HTML 파일에서 기사 정보를 읽어 NEWS_DATA 리스트에 저장하고 색인을 만듭니다.
     """
-    global NEWS_DATA
-    if NEWS_DATA: # 데이터가 이미 로드된 경우 중복 실행 방지
+    global NEWS_DATA, SEARCH_INDEX
+    if NEWS_DATA: # 데이터가 이미 로드된 경우 중복 실행 방지 (스냅샷은 아래 감시 스레드가 새 조각을 반영)
+        return
+
+    snapshot_directory = os.path.join(output_directory, 'snapshot')
+    if read_manifest(snapshot_directory) is not None:
+        NEWS_DATA = SEARCH_INDEX = ArticleSnapshot(snapshot_directory)
+        print(f"✅ 스냅샷 조각 {len(NEWS_DATA.segments)}개에서 {len(NEWS_DATA)}개의 뉴스 기사 열기 완료.")
+        # 파이프라인이 새 조각을 덧붙이면 새 스냅샷을 열어 전역 변수를 바꿔 끼움
+        # (바꿔 끼우는 것은 한 번의 대입이라 검색 요청은 기다리지 않고, 처리 중인 요청은 이전 스냅샷으로 끝남)
+        SnapshotWatcher(NEWS_DATA, swap_snapshot, SNAPSHOT_POLL_SECONDS).start()
+        SnapshotCompactor(snapshot_directory, SNAPSHOT_COMPACT_SECONDS).start()
         return
 
     print("서버 시작 전 뉴스 데이터 로딩 중...")
@@ -74,13 +96,20 @@ def load_news_data():
                         'date': date,
                         'summary': summary_text,
                         'reliability': reliability,
-                        # 검색 효율을 위해 주요 텍스트를 합쳐서 저장
-                        'searchText': f"{title} {summary_text} {source}".lower()
                     })
         except Exception as e:
             print(f"'{file_path}' 파일 처리 중 오류 발생: {e}")
 
     print(f"✅ 총 {len(NEWS_DATA)}개의 뉴스 기사 로딩 완료.")
+    # 제목, 요약, 언론사로 검색 색인을 만들어 요청마다 전체 기사를 훑지 않도록 함
+    SEARCH_INDEX = SearchIndex(NEWS_DATA)
+    print("✅ 검색 색인 생성 완료.")
+
+def swap_snapshot(snapshot):
+    """새 조각을 반영한 스냅샷으로 NEWS_DATA와 SEARCH_INDEX를 바꿉니다. (SnapshotWatcher가 호출)"""
+    global NEWS_DATA, SEARCH_INDEX
+    NEWS_DATA = SEARCH_INDEX = snapshot
+    print(f"✅ 스냅샷 갱신: 조각 {len(snapshot.segments)}개, 뉴스 기사 {len(snapshot)}개")
 
 # ================================
 # 4. 검색 API 엔드포인트 생성
@@ -88,23 +117,44 @@ def load_news_data():
 @app.route('/search')
 def search_news():
     """
-    '/search?q=검색어' 형태로 요청이 오면 검색 결과를 JSON으로 반환합니다.
+    '/search?q=검색어' 형태로 요청이 오면 검색 결과를 관련도 순으로 JSON으로 반환합니다.
+    limit이나 cursor를 주면 {"results": 한 쪽(기본 20개)의 기사, "nextCursor": 다음 쪽 커서}를 반환하고,
+    다음 쪽은 응답의 nextCursor를 cursor로 넘겨 요청합니다.
+    둘 다 주지 않으면 예전처럼 모든 검색 결과를 기사 목록(JSON 배열) 그대로 반환합니다. (기존 호출 쪽과의 호환)
     """
     query = request.args.get('q', '').lower().strip()
+    cursor = request.args.get('cursor') or None
+    paged = 'limit' in request.args or cursor is not None
 
     if not query:
         return jsonify({"error": "검색어가 필요합니다."}), 400
+    try:
+        limit = min(max(int(request.args.get('limit', SEARCH_PAGE_SIZE)), 1), SEARCH_MAX_PAGE_SIZE)
+    except ValueError:
+        return jsonify({"error": "limit은 숫자여야 합니다."}), 400
 
     print(f"'{query}' 검색 요청 수신")
-    
-    # 미리 로드된 NEWS_DATA에서 'searchText' 필터를 사용해 검색
-    search_results = [
-        article for article in NEWS_DATA if query in article['searchText']
-    ]
-    
+
+    if not paged:  # 예전 형식: 모든 결과를 쪽 단위로 모아서 한 번에 반환
+        search_results, next_cursor = [], None
+        while True:
+            hits, next_cursor = SEARCH_INDEX.search(query, limit=SEARCH_MAX_PAGE_SIZE, cursor=next_cursor)
+            search_results.extend(article for _, article in hits)
+            if next_cursor is None:
+                break
+        print(f"'{query}'에 대한 검색 결과: {len(search_results)}건")
+        return jsonify(search_results)
+
+    # 미리 만든 검색 색인에서 검색어의 토큰이 모두 나오는 기사를 찾음
+    try:
+        hits, next_cursor = SEARCH_INDEX.search(query, limit=limit, cursor=cursor)
+    except ValueError as e:  # 잘못된 커서
+        return jsonify({"error": str(e)}), 400
+    search_results = [article for _, article in hits]
+
     print(f"'{query}'에 대한 검색 결과: {len(search_results)}건")
 
-    return jsonify(search_results)
+    return jsonify({"results": search_results, "nextCursor": next_cursor})
 
 # ================================
 # 5. 서버 실행
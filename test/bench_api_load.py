@@ -0,0 +1,241 @@
+# ================================
+# 뉴스 API 부하 벤치마크 (backend/api.py)
+# ================================
+# 임시 폴더에 기사 N개의 스냅샷을 만들고 uvicorn으로 api.py를 띄운 뒤,
+# 여러 keep-alive 연결에서 요청을 쉬지 않고 보내 초당 요청 수와 응답 시간 분포(p50/p90/p99)를 잰다.
+# 요청 종류(mix): list(카테고리 목록), feed(프론트엔드 목록), search(검색), article(기사 상세), mixed(모두 섞음)
+# 일부 요청은 이전 응답의 ETag로 If-None-Match를 보내 304가 나오는지도 함께 센다.
+# 부하 생성기는 asyncio 소켓으로 HTTP/1.1 요청을 직접 써서, 클라이언트가 서버보다 먼저 CPU를 다 쓰지 않도록 한다.
+# 실행: python test/bench_api_load.py [--articles 20000] [--connections 32] [--seconds 10] [--mix mixed]
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import quote, urlencode
+from urllib.request import urlopen
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(TEST_DIR, '..', 'backend')
+sys.path.insert(0, BACKEND_DIR)
+from article_snapshot import write_snapshot
+
+CATEGORIES = {
+    '정치': ['대통령실', '국회', '정당', '행정', '외교', '국방/북한'],
+    '경제': ['금융/증권', '산업/재계', '중기/벤처', '부동산', '글로벌', '생활'],
+    '사회': ['사건사고', '교육', '노동', '언론', '환경'],
+    '세계': ['아시아/호주', '미국/중남미', '유럽', '중동/아프리카', '세계'],
+    '여행': ['국내 여행'],
+}
+SOURCES = ['연합뉴스', '뉴스1', '조선일보', 'YTN', '한겨레', '경향신문']
+LANGUAGES = ['en', 'ja', 'fr', 'zh-Hans']
+MIXES = ('list', 'feed', 'search', 'article', 'mixed')
+REVALIDATE_SHARE = 0.2  # ETag를 받은 요청을 다시 보낼 때 If-None-Match를 붙이는 비율
+
+
+# ================================
+# 1. 스냅샷과 서버
+# ================================
+def build_records(count, rng):
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+    vocabulary = ["".join(rng.choice(syllables) for _ in range(rng.choice((2, 3, 3, 4)))) for _ in range(20000)]
+    cumulative, total = [], 0.0
+    for rank in range(len(vocabulary)):
+        total += 1 / (rank + 1)
+        cumulative.append(total)
+    pairs = [(main, sub) for main, subs in CATEGORIES.items() for sub in subs]
+    records = []
+    for i in range(count):
+        title = " ".join(rng.choices(vocabulary, cum_weights=cumulative, k=8))
+        summary = " ".join(rng.choices(vocabulary, cum_weights=cumulative, k=40))
+        records.append({
+            'id': i + 1, 'title': title, 'link': f"https://www.yna.co.kr/view/{i}", 'imageUrl': None,
+            'source': rng.choice(SOURCES),
+            'date': time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(1757000000 + i * 25)),
+            'summary': summary, 'reliability': rng.choice(['높음', '보통', '낮음']),
+            'categories': [list(pair) for pair in rng.sample(pairs, rng.choice((1, 1, 2)))],
+            'translatedTitles': {lang: f"[{lang}] {title}" for lang in LANGUAGES},
+            'translatedSummaries': {lang: f"[{lang}] {summary}" for lang in LANGUAGES},
+            'related': [],
+        })
+    records.reverse()  # 파이프라인처럼 최신 기사부터
+    return records, vocabulary[:1500]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(snapshot_path, port):
+    env = dict(os.environ, NEWS_SNAPSHOT_PATH=snapshot_path)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'api:app', '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env=env)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urlopen(f"http://127.0.0.1:{port}/news?limit=1", timeout=2):
+                return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("API 서버가 시작하지 못했습니다.")
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("API 서버가 60초 안에 응답하지 않았습니다.")
+
+
+# ================================
+# 2. 부하 생성기
+# ================================
+class Load:
+    """keep-alive 연결들로 요청을 보내고 응답 시간과 상태 코드를 모읍니다."""
+
+    def __init__(self, port, mix, words, article_count, seed):
+        self.port = port
+        self.mix = mix
+        self.words = words
+        self.article_count = article_count
+        self.rng = random.Random(seed)
+        self.latencies = []
+        self.codes = {}
+        self.etags = {}
+        self.body_bytes = 0
+
+    def request(self):
+        kind = self.mix
+        if kind == 'mixed':
+            kind = self.rng.choices(('list', 'feed', 'search', 'article'), (35, 25, 25, 15))[0]
+        params = {} if self.rng.random() < 0.5 else {'lang': self.rng.choice(LANGUAGES)}
+        main = self.rng.choice(list(CATEGORIES))
+        if kind == 'list':
+            path = f"/news/{main}" if self.rng.random() < 0.4 else f"/news/{main}/{self.rng.choice(CATEGORIES[main])}"
+            if self.rng.random() < 0.2:
+                params['limit'] = self.rng.choice((50, 100))
+            return path, params
+        if kind == 'feed':
+            params['category'] = main
+            if self.rng.random() < 0.3:
+                params['source'] = self.rng.choice(SOURCES)
+            if self.rng.random() < 0.2:
+                params['q'] = self.rng.choice(self.words)
+            return '/feed', params
+        if kind == 'search':
+            query = self.rng.choice(self.words)
+            params['q'] = query if self.rng.random() < 0.7 else f"{query} {self.rng.choice(self.words[:300])}"
+            return '/search', params
+        return f"/articles/{self.rng.randint(1, self.article_count)}", params
+
+    async def _read_response(self, reader):
+        status = await reader.readline()
+        if not status:
+            return None, None, True  # 서버가 연결을 닫음
+        code = int(status.split()[1])
+        length, chunked, etag, close = None, False, None, False
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name, value = name.lower(), value.strip()
+            if name == 'content-length':
+                length = int(value)
+            elif name == 'transfer-encoding' and 'chunked' in value:
+                chunked = True
+            elif name == 'etag':
+                etag = value
+            elif name == 'connection' and value.lower() == 'close':
+                close = True
+        if chunked:
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                self.body_bytes += size
+                await reader.readexactly(size + 2)
+        elif length:
+            self.body_bytes += length
+            await reader.readexactly(length)
+        return code, etag, close
+
+    async def _connection(self, end):
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        while time.perf_counter() < end:
+            path, params = self.request()
+            key = (path, tuple(sorted(params.items())))
+            target = quote(path) + (f"?{urlencode(params)}" if params else '')
+            revalidate = f"If-None-Match: {self.etags[key]}\r\n" if key in self.etags and self.rng.random() < REVALIDATE_SHARE else ''
+            started = time.perf_counter()
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\nAccept-Encoding: br, gzip\r\n{revalidate}\r\n".encode())
+            code, etag, close = await self._read_response(reader)
+            if code is None:  # 서버가 연결을 닫았으면 다시 연결하여 계속
+                writer.close()
+                reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+                continue
+            self.latencies.append(time.perf_counter() - started)
+            self.codes[code] = self.codes.get(code, 0) + 1
+            if code == 200 and etag:
+                self.etags[key] = etag
+            if close:
+                writer.close()
+                reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        writer.close()
+
+    async def run(self, connections, seconds):
+        end = time.perf_counter() + seconds
+        started = time.perf_counter()
+        await asyncio.gather(*(self._connection(end) for _ in range(connections)))
+        return time.perf_counter() - started
+
+
+def percentile(sorted_values, share):
+    return sorted_values[min(len(sorted_values) - 1, int(share * len(sorted_values)))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="api.py에 부하를 주어 초당 요청 수와 응답 시간을 잽니다.")
+    parser.add_argument('--articles', type=int, default=20000, help="스냅샷의 기사 수")
+    parser.add_argument('--connections', type=int, default=32, help="동시 keep-alive 연결 수")
+    parser.add_argument('--seconds', type=float, default=10, help="요청 종류마다 부하를 주는 시간(초)")
+    parser.add_argument('--mix', choices=MIXES + ('all',), default='all', help="요청 종류 (all이면 종류별로 차례로 실행)")
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix='news_api_load_')
+    process = None
+    failures = 0
+    try:
+        started = time.perf_counter()
+        records, words = build_records(args.articles, random.Random(0))
+        snapshot_path = os.path.join(folder, 'snapshot')
+        write_snapshot(snapshot_path, records, 0)
+        print(f"스냅샷: 기사 {args.articles}개 ({time.perf_counter() - started:.1f}초)")
+        port = free_port()
+        process = start_server(snapshot_path, port)
+        print(f"연결 {args.connections}개, 종류마다 {args.seconds:.0f}초\n")
+        print(f"{'종류':<8} {'요청 수':>8} {'초당':>7} {'p50 ms':>7} {'p90 ms':>7} {'p99 ms':>7} {'최대 ms':>8} {'KB/응답':>8}  상태 코드")
+        for mix in (MIXES if args.mix == 'all' else (args.mix,)):
+            load = Load(port, mix, words, args.articles, seed=1)
+            elapsed = asyncio.run(load.run(args.connections, args.seconds))
+            latencies = sorted(load.latencies)
+            unexpected = {code: count for code, count in load.codes.items() if code not in (200, 304)}
+            failures += bool(unexpected) or not latencies
+            print(f"{mix:<8} {len(latencies):>8} {len(latencies) / elapsed:>7.0f} {percentile(latencies, 0.5):>7.1f} "
+                  f"{percentile(latencies, 0.9):>7.1f} {percentile(latencies, 0.99):>7.1f} {latencies[-1] * 1000:>8.1f} "
+                  f"{load.body_bytes / len(latencies) / 1024:>8.1f}  {dict(sorted(load.codes.items()))}")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+        shutil.rmtree(folder, ignore_errors=True)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# ================================
+# 본문 추출 백엔드 벤치마크 (backend/extractors.py)
+# ================================
+# 크기와 구조가 다른 기사 페이지들을 만들어 설치된 추출 백엔드(bs4, lxml, selectolax)로
+# extract()를 실행하고, 페이지당 시간, 파이썬 메모리 최고치, bs4 결과와 다른 페이지 수를 비교한다.
+# (메모리는 tracemalloc으로 재므로 C 라이브러리 안쪽의 메모리는 포함되지 않음)
+# 페이지 종류: <article>, BODY_SELECTORS의 id/class, <div> 문단(dic_area), 컨테이너 없음
+# 페이지 크기: 본문 앞뒤의 <script> 수로 조절 (작은 페이지 ~ 수 MB 페이지)
+# 실행: python test/bench_extractors.py [--repeat 3]
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_DIR, '..', 'backend'))
+from extractors import EXTRACTORS, get_extractor
+
+WORDS = "정부 여행 관광객 증가 서울 부산 제주 항공권 가격 인상 발표 기자 뉴스 경제 사회".split()
+PAGE_KINDS = ('article', 'id', 'class', 'dic_area', 'none')
+SCRIPT_COUNTS = (5, 200, 1000)  # 2KB짜리 <script> 수 (페이지 크기)
+
+
+def paragraph(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+
+
+def build_page(kind, scripts, rng):
+    """kind 구조의 본문과 scripts개의 큰 <script>를 가진 기사 페이지를 만듭니다."""
+    script = "".join(f"<script>var x{i}='<p>가짜 문단</p>';{'a' * 2000}</script>" for i in range(scripts))
+    body = "".join(f"<p>{paragraph(rng)} <b>강조</b>&nbsp;<a href='#'>링크</a><!-- 주석 --> <span> 끝 </span></p>"
+                   for _ in range(20))
+    # 텍스트에서 빠져야 하는 태그(rt, script, style)와 빈 문단, <br>이 섞인 문단
+    body += "<p>루비 <ruby>漢<rt>한</rt></ruby> 글자<script>s()</script><style>.a{}</style></p><p>   </p><p>가<br>나</p>"
+    container = {
+        'article': f"<article>{body}</article>",
+        'id': f"<div id='articleBodyContents' class='x'>{body}</div>",
+        'class': f"<div class='foo  article_body\tbar'>{body}</div>",
+        'dic_area': f"<div id='dic_area'>{body.replace('<p>', '<div>').replace('</p>', '</div>')}</div>",
+        'none': f"<div class='content'>{body}</div>",
+    }[kind]
+    og_image = "" if kind == 'none' else "<meta property='og:image' content='https://img.example/a.jpg?x=1&amp;y=2'>"
+    return (f"<!DOCTYPE html><html><head><meta charset='utf-8'>{og_image}<title>제목</title>{script}</head>"
+            f"<body><nav><ul>{'<li><a>메뉴</a></li>' * 300}</ul></nav>{container}"
+            f"<footer>{'<div>광고</div>' * 500}</footer>{script}</body></html>")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추출 백엔드별 페이지당 시간과 메모리를 비교합니다.")
+    parser.add_argument('--repeat', type=int, default=3, help="시간을 잴 때 전체 페이지를 반복하는 횟수 (가장 빠른 값을 사용)")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    pages = [(kind, scripts, build_page(kind, scripts, rng)) for kind in PAGE_KINDS for scripts in SCRIPT_COUNTS]
+    sizes = [len(html.encode('utf-8')) for _, _, html in pages]
+    print(f"페이지 {len(pages)}개, 평균 {sum(sizes) // len(sizes) // 1024}KB, 최대 {max(sizes) // 1024}KB\n")
+
+    reference = [get_extractor('bs4').extract(html) for _, _, html in pages]
+    largest = max(pages, key=lambda page: len(page[2]))[2]
+    print(f"{'백엔드':<11} {'ms/페이지':>10} {'큰 페이지 ms':>12} {'파이썬 메모리(MB)':>15}  bs4와 다른 페이지")
+    failures = 0
+    for name in EXTRACTORS:
+        try:
+            extractor = get_extractor(name)
+        except ValueError as e:
+            print(f"{name:<11} 건너뜀: {e}")
+            continue
+        best = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            results = [extractor.extract(html) for _, _, html in pages]
+            best = min(best, time.perf_counter() - started)
+        started = time.perf_counter()
+        extractor.extract(largest)
+        largest_ms = (time.perf_counter() - started) * 1000
+        tracemalloc.start()
+        extractor.extract(largest)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        mismatches = [f"{kind}/{scripts}" for (kind, scripts, _), result, expected in zip(pages, results, reference)
+                      if result != expected]
+        failures += bool(mismatches)
+        print(f"{name:<11} {best / len(pages) * 1000:>10.1f} {largest_ms:>12.1f} {peak / 1e6:>15.1f}  "
+              f"{', '.join(mismatches) or '없음'}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
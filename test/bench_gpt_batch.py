@@ -0,0 +1,110 @@
+# ================================
+# GPT 묶음 평가 벤치마크 (backend/gpt_batch.py, GPT_BATCH_SIZE)
+# ================================
+# 같은 기사들을 K=1/4/8/16개씩 묶어 가짜 Azure OpenAI 서버(fake_openai_server.py)에 평가를 요청하고,
+# K별 요청 수, 기사당 토큰 수, 429 수, 전체 시간을 비교한다.
+# 요청은 main.py의 request_gpt_batch/gpt_evaluate처럼 만든다. (공통 프롬프트 + [기사 N] 묶음, 기사당 512 응답 토큰 확보,
+# RateLimiter를 거쳐 재시도) 서버는 응답 글자 수에 비례해 늦게 답하고 분당 토큰 할당량을 적용한다.
+# 실행: python test/bench_gpt_batch.py [--articles 32] [--workers 4] [--tpm 50000]
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_DIR, '..', 'backend'))
+import openai
+from openai import AzureOpenAI
+from fake_openai_server import FakeOpenAIServer  # 할당량과 응답 지연을 흉내 내는 로컬 서버
+from gpt_batch import BatchEvaluator, BatchRejected, BATCH_FORMAT_INSTRUCTION, build_batch_content
+from http_client import HttpClient
+from rate_limiter import RateLimiter
+
+BATCH_SIZES = (1, 4, 8, 16)
+GPT_READ_TIMEOUT = 180  # main.py의 GPT_READ_TIMEOUT (공용 HttpClient의 15초를 쓰면 K=8부터 응답을 끝까지 받지 못함)
+BATCH_COMPLETION_TOKENS = 512  # main.py의 GPT_BATCH_COMPLETION_TOKENS
+SINGLE_COMPLETION_TOKENS = 1024  # main.py의 gpt_evaluate가 요청하는 응답 토큰 수
+
+
+def build_messages(prompt, article_content, extra_instruction=None):
+    # main.py의 build_evaluation_messages와 같은 구성 (시스템 역할, 프롬프트, 기사 내용)
+    prompt_text = f"{prompt}\n\n{extra_instruction}" if extra_instruction else prompt
+    return [{"role": "system", "content": "당신은 뉴스 기사를 요약하고 신뢰도를 평가하는 도우미입니다."},
+            {"role": "user", "content": prompt_text}, {"role": "user", "content": article_content}]
+
+
+def run(batch_size, texts, args, server_url, http_client):
+    client = AzureOpenAI(azure_endpoint=server_url, api_key="fake", api_version="2025-01-01-preview",
+                         max_retries=0, http_client=http_client.client,
+                         timeout=openai.Timeout(GPT_READ_TIMEOUT, connect=5))
+    limiter = RateLimiter(args.tpm // 1000 * 6, args.tpm, max_retries=8, base_delay=0.2)
+    prompt = "다음 기준에 따라 기사를 평가하세요. " * (args.prompt_chars // 20)
+
+    def complete(messages, max_completion_tokens, **options):
+        return limiter.call(
+            lambda: client.chat.completions.create(model="gpt-4o", messages=messages,
+                                                   max_completion_tokens=max_completion_tokens, **options),
+            sum(len(message['content']) for message in messages) + max_completion_tokens,
+            is_rate_limited=lambda e: isinstance(e, openai.RateLimitError),
+            is_retryable=lambda e: isinstance(e, (openai.APIConnectionError, openai.InternalServerError)),
+            usage_of=lambda result: result.usage.total_tokens if result.usage else None,
+        )
+
+    def request_batch(batch_texts):
+        messages = build_messages(prompt, build_batch_content(batch_texts), BATCH_FORMAT_INSTRUCTION)
+        try:
+            completion = complete(messages, min(BATCH_COMPLETION_TOKENS * len(batch_texts), 16384),
+                                  response_format={"type": "json_object"})
+        except openai.BadRequestError as e:
+            raise BatchRejected(str(e)) from e
+        return completion.choices[0].message.content, completion.usage.total_tokens
+
+    def evaluate_single(text):
+        completion = complete(build_messages(prompt, text), SINGLE_COMPLETION_TOKENS)
+        content = completion.choices[0].message.content
+        reliability = re.search(r'신뢰도:\s*(높음|보통|낮음)', content)
+        return {'raw': content, 'summary': content, 'reliability': reliability.group(1) if reliability else "알 수 없음",
+                'tokens': completion.usage.total_tokens}
+
+    evaluator = BatchEvaluator(request_batch, evaluate_single)
+    chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:  # 파이프라인의 평가 단계 작업자 수
+        results = [result for chunk_results in executor.map(evaluator.evaluate, chunks) for result in chunk_results]
+    return results, time.perf_counter() - started, limiter.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="K개씩 묶은 GPT 평가 요청의 비용과 시간을 비교합니다.")
+    parser.add_argument('--articles', type=int, default=32, help="평가할 기사 수")
+    parser.add_argument('--article-chars', type=int, default=800, help="기사 1개의 글자 수")
+    parser.add_argument('--prompt-chars', type=int, default=1500, help="기사마다 반복되는 공통 프롬프트의 글자 수")
+    parser.add_argument('--workers', type=int, default=4, help="동시에 요청하는 작업자 수")
+    parser.add_argument('--tpm', type=int, default=50000, help="분당 토큰 할당량 (main.py의 deployment_tpm_quota)")
+    args = parser.parse_args()
+
+    texts = [f"[{i}번 기사] " + "정부가 새 정책을 발표했다. " * (args.article_chars // 16) for i in range(args.articles)]
+    print(f"기사 {args.articles}건, 기사당 {args.article_chars}자, 공통 프롬프트 {args.prompt_chars}자, "
+          f"작업자 {args.workers}, 할당량 {args.tpm} TPM\n")
+    print(f"{'K':>3} {'요청':>5} {'429':>5} {'입력토큰/기사':>13} {'출력토큰/기사':>13} {'시간(초)':>9} {'기사/초':>8}  결과")
+    http_client = HttpClient()
+    failures = 0
+    for batch_size in BATCH_SIZES:
+        # 응답 토큰 1개에 10ms (gpt-4o의 생성 속도와 비슷한 비율), 요청마다 0.3초의 기본 지연, 기사당 요약 200자
+        with FakeOpenAIServer(args.tpm // 1000 * 6, args.tpm, latency=0.3, latency_per_token=0.01,
+                              summary_chars=200) as server:
+            results, elapsed, limiter_stats = run(batch_size, texts, args, server.url, http_client)
+            stats = server.stats
+        complete = sum(1 for result in results if result and result['summary'])
+        failures += complete != len(texts)
+        print(f"{batch_size:>3} {stats['ok']:>5} {stats['throttled']:>5} "
+              f"{stats['prompt_tokens'] / len(texts):>13.0f} {stats['completion_tokens'] / len(texts):>13.0f} "
+              f"{elapsed:>9.1f} {len(texts) / elapsed:>8.2f}  {complete}/{len(texts)}")
+    http_client.close()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
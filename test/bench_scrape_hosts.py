@@ -0,0 +1,145 @@
+# ================================
+# 여러 언론사(호스트) 본문 수집 벤치마크 (backend/scraper.py)
+# ================================
+# 로컬 HTTP 서버 하나를 127.0.0.1 ~ 127.0.0.N의 여러 호스트처럼 사용하여,
+# 기사 페이지를 한 건씩 차례로 받을 때와 PoliteFetcher로 호스트별 병렬 수집할 때의 시간을 비교한다.
+# 호스트마다 성격이 다르다:
+# - 127.0.0.2: 응답이 느림
+# - 127.0.0.3: robots.txt에 막힌 경로와 Crawl-delay가 있음
+# - 127.0.0.4: 첫 요청에 429와 Retry-After를 돌려줌
+# - 127.0.0.5: robots.txt가 403 (호스트 전체를 수집하지 않음)
+# 호스트별 최대 동시 요청 수가 per_host를 넘지 않는지, 막힌 주소는 요청하지 않는지도 확인한다.
+# (127.0.0.x 주소는 Linux와 Windows 모두 루프백으로 연결됨)
+# 실행: python test/bench_scrape_hosts.py [--hosts 10] [--articles 100] [--workers 16]
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_DIR, '..', 'backend'))
+from http_client import HttpClient
+from scraper import PoliteFetcher, RobotsDisallowed, HostBackingOff
+
+PAGE_DELAY = 0.2  # 보통 호스트의 응답 시간(초)
+SLOW_HOST, ROBOTS_HOST, THROTTLE_HOST, FORBIDDEN_HOST = '127.0.0.2', '127.0.0.3', '127.0.0.4', '127.0.0.5'
+CRAWL_DELAY = 0.1
+PAGE = ("<html><body><article>" + "<p>기사 본문 문단입니다.</p>" * 200 + "</article></body></html>").encode('utf-8')
+
+
+class NewsHosts(BaseHTTPRequestHandler):
+    """여러 언론사 역할을 하는 요청 처리기입니다. 호스트별 요청 수와 최대 동시 요청 수를 기록합니다."""
+    protocol_version = 'HTTP/1.1'
+    lock = threading.Lock()
+    hits, in_flight, peak, robots_hits = {}, {}, {}, {}
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        host = self.headers['Host'].split(':')[0]
+        if self.path == '/robots.txt':
+            with self.lock:
+                self.robots_hits[host] = self.robots_hits.get(host, 0) + 1
+            if host == ROBOTS_HOST:
+                return self._send(200, f"User-agent: *\nDisallow: /private\nCrawl-delay: {CRAWL_DELAY}\n".encode())
+            if host == FORBIDDEN_HOST:
+                return self._send(403)
+            return self._send(404)
+        with self.lock:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+            count = self.hits[host] = self.hits.get(host, 0) + 1
+        time.sleep(PAGE_DELAY * 5 if host == SLOW_HOST else PAGE_DELAY)
+        with self.lock:
+            self.in_flight[host] -= 1
+        if host == THROTTLE_HOST and count == 1:
+            return self._send(429, b"slow down", [('Retry-After', '1')])
+        self._send(200, PAGE, [('Content-Type', 'text/html; charset=utf-8')])
+
+    @classmethod
+    def reset(cls):
+        for table in (cls.hits, cls.in_flight, cls.peak, cls.robots_hits):
+            table.clear()
+
+
+def read_page(fetcher, url):
+    with fetcher.stream(url, timeout=10) as response:
+        return response.status_code, sum(len(chunk) for chunk in response.iter_bytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="호스트별 병렬 수집과 차례 수집의 시간을 비교합니다.")
+    parser.add_argument('--hosts', type=int, default=10, help="언론사(호스트) 수")
+    parser.add_argument('--articles', type=int, default=100, help="기사 수 (호스트에 고르게 나눔)")
+    parser.add_argument('--workers', type=int, default=16, help="병렬 수집 작업자 수 (파이프라인의 수집 단계 동시 실행 수)")
+    parser.add_argument('--per-host', type=int, default=4, help="호스트 하나에 동시에 보낼 최대 요청 수")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('0.0.0.0', 0), NewsHosts)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_port
+    urls = [f"http://127.0.0.{1 + i % args.hosts}:{port}/news/{i}" for i in range(args.articles)]
+    urls.append(f"http://{ROBOTS_HOST}:{port}/private/secret")  # robots.txt가 막은 주소
+    http_client = HttpClient()
+    failures = 0
+
+    # 1) 한 건씩 차례로 (예전 수집 방식, 예의 규칙 없이 모든 주소를 요청)
+    started = time.perf_counter()
+    for url in urls:
+        with http_client.stream('GET', url) as response:
+            response.read()
+    sequential = time.perf_counter() - started
+    print(f"차례 수집: {len(urls)}건 {sequential:.1f}초")
+
+    # 2) PoliteFetcher로 호스트별 병렬 수집
+    NewsHosts.reset()
+    fetcher = PoliteFetcher(http_client, per_host=args.per_host)
+    outcomes = {}
+
+    def fetch(url):
+        try:
+            outcomes[url] = read_page(fetcher, url)[0]
+        except (RobotsDisallowed, HostBackingOff) as e:
+            outcomes[url] = type(e).__name__
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        list(executor.map(fetch, urls))
+    parallel = time.perf_counter() - started
+    print(f"병렬 수집: {len(urls)}건 {parallel:.1f}초 ({sequential / parallel:.1f}배), 작업자 {args.workers}, 호스트당 {args.per_host}")
+    print(f"  수집기 통계: {fetcher.stats}")
+    print(f"  호스트별 최대 동시 요청 수: {dict(sorted(NewsHosts.peak.items()))}")
+    print(f"  robots.txt 요청 수: {dict(sorted(NewsHosts.robots_hits.items()))}")
+    print(f"  결과: { {outcome: list(outcomes.values()).count(outcome) for outcome in set(outcomes.values())} }")
+
+    checks = [
+        ("호스트별 동시 요청 수가 per_host 이하", max(NewsHosts.peak.values()) <= args.per_host),
+        ("robots.txt는 호스트마다 한 번만 요청", all(count == 1 for count in NewsHosts.robots_hits.values())),
+        ("robots.txt가 막은 경로는 요청하지 않음", outcomes[urls[-1]] == 'RobotsDisallowed'),
+        ("robots.txt가 403인 호스트는 요청하지 않음", FORBIDDEN_HOST not in NewsHosts.hits),
+        ("429를 받은 호스트도 Retry-After만큼 쉰 뒤 나머지를 수집", fetcher.stats['backoffs'] >= 1
+         and NewsHosts.hits.get(THROTTLE_HOST, 0) == sum(f"//{THROTTLE_HOST}:" in url for url in urls)),
+    ]
+    for name, ok in checks:
+        failures += not ok
+        print(f"{'OK  ' if ok else 'FAIL'} {name}")
+    http_client.close()
+    server.shutdown()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
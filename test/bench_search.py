@@ -0,0 +1,106 @@
+# ================================
+# 검색 색인 벤치마크 (backend/search_index.py)
+# ================================
+# 기사 N개를 만들어, 예전 /search 방식(모든 기사의 searchText에서 검색어 찾기)과
+# 역색인(SearchIndex) 검색의 시간을 검색어 종류별로 비교한다. (색인은 첫 쪽과 다음 쪽을 따로 잼)
+# 색인을 파일로 저장했다가 메모리 매핑으로 다시 여는 시간도 잰다.
+# 단어는 실제 기사처럼 일부 단어가 아주 자주 나오도록(지프 분포) 뽑는다.
+# 한 단어 검색어는 예전 방식으로 찾은 기사가 모두 색인 결과에도 있는지 확인한다.
+# 실행: python test/bench_search.py [--articles 100000]
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_DIR, '..', 'backend'))
+from search_index import SearchIndex
+
+SOURCES = ['연합뉴스', '뉴스1', '조선일보', 'YTN', '한겨레']
+PAGE_SIZE = 20  # test/app.py의 SEARCH_PAGE_SIZE
+REPEAT = 20  # 색인 검색 시간은 여러 번 잰 평균
+
+
+def build_articles(count, rng):
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+    vocabulary = ["".join(rng.choice(syllables) for _ in range(rng.choice((2, 2, 3, 3, 4)))) for _ in range(30000)]
+    cumulative, total = [], 0.0
+    for rank in range(len(vocabulary)):
+        total += 1 / (rank + 1)
+        cumulative.append(total)
+
+    def words(k):
+        return " ".join(rng.choices(vocabulary, cum_weights=cumulative, k=k))
+
+    articles = [{'title': words(8), 'summary': words(40), 'source': rng.choice(SOURCES)} for _ in range(count)]
+    for article in articles:  # test/app.py가 기사마다 만드는 검색용 문자열
+        article['searchText'] = f"{article['title']} {article['summary']} {article['source']}".lower()
+    return articles, vocabulary
+
+
+def all_hits(index, query):
+    hits, cursor = [], None
+    while True:
+        page, cursor = index.search(query, 1000, cursor)
+        hits += page
+        if not cursor:
+            return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 훑기와 역색인 검색의 시간을 비교합니다.")
+    parser.add_argument('--articles', type=int, default=100000, help="기사 수")
+    args = parser.parse_args()
+
+    articles, vocabulary = build_articles(args.articles, random.Random(0))
+    started = time.perf_counter()
+    index = SearchIndex(articles)
+    print(f"기사 {len(articles)}개, 색인 만들기 {time.perf_counter() - started:.1f}초")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'search.idx')
+        started = time.perf_counter()
+        index.save(path)
+        saved = time.perf_counter() - started
+        started = time.perf_counter()
+        mapped = SearchIndex.load(path, articles)
+        print(f"파일 저장 {saved:.2f}초 ({os.path.getsize(path) / 1e6:.0f}MB), 메모리 매핑으로 열기 "
+              f"{(time.perf_counter() - started) * 1000:.1f}ms\n")
+
+        queries = {
+            '자주 나오는 단어': vocabulary[0],
+            '중간 빈도 단어': vocabulary[200],
+            '드문 단어': vocabulary[20000],
+            '두 단어': f"{vocabulary[3]} {vocabulary[50]}",
+            '언론사 이름': '연합뉴스',
+        }
+        print(f"{'검색어':<12} {'훑기 ms':>9} {'훑기 결과':>9} {'색인 ms':>8} {'다음 쪽 ms':>10} {'매핑 색인 ms':>12}")
+        failures = 0
+        for label, query in queries.items():
+            started = time.perf_counter()
+            scanned = [article for article in articles if query.lower() in article['searchText']]
+            scan_ms = (time.perf_counter() - started) * 1000
+            timings = []
+            for searcher in (index, mapped):
+                started = time.perf_counter()
+                for _ in range(REPEAT):
+                    _, cursor = searcher.search(query, PAGE_SIZE)
+                timings.append((time.perf_counter() - started) * 1000 / REPEAT)
+            started = time.perf_counter()
+            if cursor:
+                index.search(query, PAGE_SIZE, cursor)
+            next_ms = (time.perf_counter() - started) * 1000
+            print(f"{label:<12} {scan_ms:>9.1f} {len(scanned):>9} {timings[0]:>8.2f} {next_ms:>10.2f} {timings[1]:>12.2f}")
+            if ' ' not in query:  # 한 단어 검색어는 훑기로 찾은 기사가 모두 색인 결과에 있어야 함
+                found = {id(article) for _, article in all_hits(index, query)}
+                missing = sum(1 for article in scanned if id(article) not in found)
+                if missing:
+                    print(f"  FAIL 훑기로 찾았지만 색인 결과에 없는 기사 {missing}건")
+                    failures += 1
+        del mapped
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# ================================
+# 언론사별 본문 추출 회귀 확인 (backend/publisher_rules.py)
+# ================================
+# extraction_corpus/ 폴더의 언론사별 기사 페이지를 RuleExtractor로 추출하여 expected.json의 본문/대표 이미지와 비교한다.
+# 페이지에는 실제 언론사 페이지처럼 빼야 하는 요소들(기자 정보, 사진 설명, 광고, 관련 기사, 메뉴, 스크립트,
+# 본문 밖의 다른 <article>)이 섞여 있고, expected.json의 본문은 원래 문단만 줄바꿈으로 이은 것이다.
+# 설치된 모든 추출 백엔드로 확인한다. (백엔드마다 결과가 같아야 함)
+# 파이프라인처럼 페이지를 조각으로 나누어 스트리밍 추출기(StreamingExtractor)에 넣는 경로도 백엔드마다 확인한다.
+# 언론사 규칙을 고치거나 추가하면 이 폴더에 그 언론사의 페이지와 기대 결과를 넣고 다시 실행한다.
+# 실행: python test/extraction_corpus_check.py
+import json
+import os
+import sys
+import time
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_DIR, '..', 'backend'))
+from extractors import EXTRACTORS, get_extractor
+from publisher_rules import PUBLISHER_RULES, RuleRegistry, RuleExtractor
+from streaming_extractor import StreamingExtractor
+
+CORPUS_DIR = os.path.join(TEST_DIR, 'extraction_corpus')
+CHUNK_SIZE = 4096  # 스트리밍 경로에서 응답 조각 하나의 크기 (response.iter_bytes()와 비슷하게)
+
+
+def load_corpus():
+    with open(os.path.join(CORPUS_DIR, 'expected.json'), encoding='utf-8') as f:
+        expected = json.load(f)
+    pages = []
+    for name, case in expected.items():
+        with open(os.path.join(CORPUS_DIR, f"{name}.html"), encoding='utf-8') as f:
+            pages.append((name, case, f.read()))
+    return pages
+
+
+def normalize(text):
+    return "\n".join(" ".join(line.split()) for line in (text or "").splitlines() if line.strip())
+
+
+def check(extract, pages):
+    """extract(url, html) → (본문, 이미지)로 모든 페이지를 추출하여 (틀린 페이지 목록, 페이지당 ms)를 반환합니다."""
+    wrong = []
+    started = time.perf_counter()
+    results = [extract(case['url'], html) for _, case, html in pages]
+    elapsed = (time.perf_counter() - started) * 1000 / len(pages)
+    for (name, case, _), (body, image) in zip(pages, results):
+        if normalize(body) != normalize(case['body']) or image != case['image']:
+            wrong.append((name, body, image))
+    return wrong, elapsed
+
+
+def main():
+    pages = load_corpus()
+    print(f"페이지 {len(pages)}개 ({', '.join(name for name, _, _ in pages)})\n")
+    failures = 0
+
+    for name in EXTRACTORS:
+        try:
+            backend = get_extractor(name)
+        except ValueError as e:
+            print(f"{'언론사 규칙 + ' + name:<22} 건너뜀: {e}")
+            continue
+        extractor = RuleExtractor(RuleRegistry(PUBLISHER_RULES), backend)
+        streaming = StreamingExtractor(extractor)
+
+        def extract_streaming(url, html):
+            data = html.encode('utf-8')
+            return streaming.extract(url, (data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE)))
+
+        for label, extract in ((f"언론사 규칙 + {name}", extractor.extract), (f"스트리밍 + {name}", extract_streaming)):
+            wrong, elapsed = check(extract, pages)
+            failures += len(wrong)
+            print(f"{label:<22} 정확 {len(pages) - len(wrong):>2}/{len(pages)}  {elapsed:6.1f} ms/페이지")
+            for page_name, body, image in wrong:
+                print(f"  FAIL {page_name}: 이미지={image!r} 본문={(body or '')[:120]!r}")
+    print("\n모든 페이지 일치" if not failures else f"\n실패 {failures}건")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+# ================================
+# 가짜 Azure OpenAI 서버 (backend/rate_limiter.py, backend/gpt_batch.py 확인용)
+# ================================
+# chat completions 요청에 Azure처럼 답하는 로컬 HTTP 서버이다.
+# - 요청마다 (메시지 글자 수 + max_completion_tokens)만큼 서버 쪽 토큰 버킷에서 빼고,
+#   모자라면 retry-after-ms / Retry-After 헤더와 함께 429를 돌려준다. (Azure처럼 10초 단위로 할당량을 적용)
+# - throttle_every를 주면 N번째 요청마다 할당량과 관계없이 429를 돌려준다.
+# - response_format이 json_object이면 [기사 N] 수만큼 묶음 평가 JSON을, 아니면 단일 평가 형식으로 답한다.
+# 직접 실행하면 여러 작업자가 RateLimiter를 거쳐 이 서버를 호출하고,
+# 429/재시도/대기 시간과 서버가 받은 토큰 수를 출력한다.
+# 실행: python test/fake_openai_server.py [--workers 8] [--calls 60] [--tpm 60000]
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_DIR, '..', 'backend'))
+
+QUOTA_WINDOW_SECONDS = 10  # 할당량을 적용하는 구간 (분당 할당량의 1/6까지만 한 번에 보낼 수 있음)
+_ARTICLE_MARKER = re.compile(r"\[기사 (\d+)\]")
+
+
+class FakeOpenAIServer:
+    """
+    로컬에서 Azure OpenAI의 chat completions API를 흉내 내는 서버입니다.
+    - requests_per_minute, tokens_per_minute: 서버 쪽 할당량 (None이면 제한 없음)
+    - throttle_every: N번째 요청마다 강제로 429를 돌려줌 (0이면 사용 안 함)
+    - latency, latency_per_token: 응답 지연 = latency + 응답 토큰 수 × latency_per_token (초)
+    - summary_chars: 기사 1개의 요약 길이 (응답 토큰 수를 정함)
+    - stats: requests, throttled, ok, prompt_tokens, completion_tokens
+    """
+
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None, throttle_every=0,
+                 latency=0.05, latency_per_token=0.0, summary_chars=24):
+        self.summary_chars = summary_chars
+        self.throttle_every = throttle_every
+        self.latency = latency
+        self.latency_per_token = latency_per_token
+        self._lock = threading.Lock()
+        self._buckets = {}
+        for name, per_minute in (('requests', requests_per_minute), ('tokens', tokens_per_minute)):
+            if per_minute:
+                capacity = per_minute * QUOTA_WINDOW_SECONDS / 60
+                self._buckets[name] = [capacity, capacity, per_minute / 60, time.monotonic()]  # 크기, 남은 양, 초당 충전량, 갱신 시각
+        self.stats = {'requests': 0, 'throttled': 0, 'ok': 0, 'prompt_tokens': 0, 'completion_tokens': 0}
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- 할당량 ---
+    def _admit(self, charge):
+        """할당량 안이면 0을, 넘으면 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            self.stats['requests'] += 1
+            if self.throttle_every and self.stats['requests'] % self.throttle_every == 0:
+                self.stats['throttled'] += 1
+                return 1.0
+            now = time.monotonic()
+            wait = 0.0
+            for name, bucket in self._buckets.items():
+                capacity, tokens, rate, updated = bucket
+                bucket[1] = tokens = min(capacity, tokens + (now - updated) * rate)
+                bucket[3] = now
+                amount = min(charge[name], capacity)
+                if tokens < amount:
+                    wait = max(wait, (amount - tokens) / rate)
+            if wait > 0:
+                self.stats['throttled'] += 1
+                return wait
+            for name, bucket in self._buckets.items():
+                bucket[1] -= min(charge[name], bucket[0])
+            return 0.0
+
+    # --- 응답 ---
+    def _answer(self, request):
+        content = request['messages'][-1]['content']
+        summary = ("기사의 요약입니다. " * (self.summary_chars // 10 + 1))[:self.summary_chars]
+        if (request.get('response_format') or {}).get('type') == 'json_object':
+            numbers = _ARTICLE_MARKER.findall(content)
+            answer = {number: {"summary": f"[{number}] {summary}", "reliability": "보통"} for number in numbers}
+            return json.dumps(answer, ensure_ascii=False)
+        return f"1) {summary}\n2) 신뢰도: 보통"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status, data, headers=()):
+                body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                prompt_tokens = sum(len(message['content']) for message in request['messages'])
+                max_tokens = request.get('max_completion_tokens') or request.get('max_tokens') or 0
+                wait = server._admit({'requests': 1, 'tokens': prompt_tokens + max_tokens})
+                if wait > 0:
+                    return self._send_json(429, {'error': {'code': '429', 'message': 'Rate limit is exceeded.'}},
+                                           [('retry-after-ms', str(int(wait * 1000))),
+                                            ('Retry-After', str(max(1, round(wait))))])
+                answer = server._answer(request)
+                time.sleep(server.latency + len(answer) * server.latency_per_token)
+                with server._lock:
+                    server.stats['ok'] += 1
+                    server.stats['prompt_tokens'] += prompt_tokens
+                    server.stats['completion_tokens'] += len(answer)
+                self._send_json(200, {
+                    'id': 'chatcmpl-fake', 'object': 'chat.completion', 'created': int(time.time()),
+                    'model': request.get('model', 'gpt-4o'),
+                    'choices': [{'index': 0, 'finish_reason': 'stop',
+                                 'message': {'role': 'assistant', 'content': answer}}],
+                    'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': len(answer),
+                              'total_tokens': prompt_tokens + len(answer)},
+                })
+
+        return Handler
+
+
+# ================================
+# 속도 제한기를 거친 호출 확인
+# ================================
+def main():
+    import openai
+    from openai import AzureOpenAI
+    from http_client import HttpClient
+    from rate_limiter import RateLimiter
+
+    parser = argparse.ArgumentParser(description="가짜 Azure OpenAI 서버로 RateLimiter의 429 처리를 확인합니다.")
+    parser.add_argument('--workers', type=int, default=8, help="동시에 호출하는 작업자 수")
+    parser.add_argument('--calls', type=int, default=60, help="전체 호출 수")
+    parser.add_argument('--tpm', type=int, default=60000, help="서버와 제한기의 분당 토큰 할당량")
+    parser.add_argument('--prompt-chars', type=int, default=600, help="요청 1건의 기사 글자 수")
+    parser.add_argument('--throttle-every', type=int, default=0, help="N번째 요청마다 강제로 429")
+    args = parser.parse_args()
+    rpm = args.tpm // 1000 * 6  # Azure는 1000 TPM당 6 RPM을 할당
+
+    http_client = HttpClient()
+    with FakeOpenAIServer(rpm, args.tpm, throttle_every=args.throttle_every) as server:
+        client = AzureOpenAI(azure_endpoint=server.url, api_key="fake", api_version="2025-01-01-preview",
+                             max_retries=0, http_client=http_client.client)
+        limiter = RateLimiter(rpm, args.tpm, max_retries=8, base_delay=0.2)
+        messages = [{"role": "user", "content": "기사 " * (args.prompt_chars // 3)}]
+        max_completion_tokens = 200
+        estimated = sum(len(message['content']) for message in messages) + max_completion_tokens
+        remaining = iter(range(args.calls))
+        done, failed = [], []
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        return
+                try:
+                    result = limiter.call(
+                        lambda: client.chat.completions.create(model="gpt-4o", messages=messages,
+                                                               max_completion_tokens=max_completion_tokens),
+                        estimated,
+                        is_rate_limited=lambda e: isinstance(e, openai.RateLimitError),
+                        is_retryable=lambda e: isinstance(e, (openai.APIConnectionError, openai.InternalServerError)),
+                        usage_of=lambda result: result.usage.total_tokens if result.usage else None,
+                    )
+                    with lock:
+                        done.append(result.usage.total_tokens)
+                except Exception as e:
+                    with lock:
+                        failed.append(e)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker) for _ in range(args.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        print(f"호출 {args.calls}건 (작업자 {args.workers}, 할당량 {args.tpm} TPM / {rpm} RPM, 요청당 추정 {estimated} 토큰)")
+        print(f"  성공 {len(done)}건, 실패 {len(failed)}건, {elapsed:.1f}초")
+        print(f"  서버: {server.stats}")
+        print(f"  제한기: {limiter.stats}")
+        print(f"  제한기 토큰 버킷 잔량: {limiter.tokens.tokens:.0f} / {limiter.tokens.capacity}")
+        if server.stats['throttled']:
+            print(f"  429 비율: {server.stats['throttled'] / server.stats['requests']:.1%}")
+    http_client.close()
+    if failed:
+        print(f"FAIL 첫 번째 실패: {failed[0]!r}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
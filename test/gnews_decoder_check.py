@@ -0,0 +1,117 @@
+# ================================
+# 구글 뉴스 링크 디코더 확인 (backend/gnews_decoder.py)
+# ================================
+# gnews_fixtures.json의 링크들을 디코더로 풀어 보고, 기대한 원문 주소와 통계가 나오는지 확인한다.
+# 새 형식(AU_yqL...) 링크는 구글 뉴스 대신 이 파일의 로컬 HTTP 서버가 응답한다.
+# (기사 페이지의 서명/타임스탬프, batchexecute 응답, 원문으로의 리디렉션, 404와 깨진 응답)
+# 실행: python test/gnews_decoder_check.py
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TEST_DIR, '..', 'backend'))
+from gnews_decoder import GoogleNewsDecoder  # 확인할 디코더
+from http_client import HttpClient  # 파이프라인과 같은 공유 HTTP 클라이언트
+
+FIXTURES = os.path.join(TEST_DIR, 'gnews_fixtures.json')
+SERVER_DELAY = 0.05  # 로컬 서버가 응답마다 기다리는 시간 (구글 뉴스까지의 왕복 시간 흉내)
+TIMESTAMP = "1714521600"
+
+with open(FIXTURES, encoding='utf-8') as f:
+    fixtures = json.load(f)
+BATCH_URLS = {case['id']: case['expected'] for case in fixtures['batchexecute']}
+REDIRECT_URLS = {case['id']: case['expected'] for case in fixtures['redirect']}
+BROKEN_IDS = {case['id'] for case in fixtures['miss'] if 'Broken' in case['id']}
+
+
+# ================================
+# 1. 구글 뉴스 대신 응답하는 로컬 서버
+# ================================
+class GoogleNewsStandIn(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(SERVER_DELAY)
+        self.requests_seen.append(('GET', self.path))
+        article_id = self.path.rstrip('/').rsplit('/', 1)[-1]
+        if article_id in REDIRECT_URLS:
+            return self._send(302, headers=[('Location', REDIRECT_URLS[article_id])])
+        if article_id in BATCH_URLS or article_id in BROKEN_IDS:
+            page = f'<html><body><c-wiz><div jscontroller="x" data-n-a-sg="sig-{article_id}" data-n-a-ts="{TIMESTAMP}"></div></c-wiz></body></html>'
+            return self._send(200, page.encode('utf-8'), [('Content-Type', 'text/html; charset=utf-8')])
+        return self._send(404)
+
+    def do_POST(self):
+        time.sleep(SERVER_DELAY)
+        self.requests_seen.append(('POST', self.path))
+        form = parse_qs(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+        inner = json.loads(json.loads(form['f.req'][0])[0][0][1])
+        article_id, timestamp, signature = inner[2], str(inner[3]), inner[4]
+        if article_id in BROKEN_IDS:
+            return self._send(200, b")]}'\n\nnot json")
+        if article_id not in BATCH_URLS or signature != f"sig-{article_id}" or timestamp != TIMESTAMP:
+            return self._send(400)
+        result = json.dumps(["garturlres", BATCH_URLS[article_id], 1])
+        body = ")]}'\n\n" + json.dumps([["wrb.fr", "Fbv4je", result, None, None, None, "generic"]])
+        return self._send(200, body.encode('utf-8'), [('Content-Type', 'application/json; charset=utf-8')])
+
+
+# ================================
+# 2. 디코딩 결과 확인
+# ================================
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), GoogleNewsStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    client = HttpClient()
+    decoder = GoogleNewsDecoder(base_url=base_url, session=client)
+
+    cases = [(case['url'], case['expected'], 'offline') for case in fixtures['offline']]
+    for kind in ('batchexecute', 'redirect', 'miss'):
+        cases += [(f"https://news.google.com/rss/articles/{case['id']}?oc=5", case.get('expected'), kind)
+                  for case in fixtures[kind]]
+
+    failures = 0
+    for url, expected, kind in cases:
+        started = time.perf_counter()
+        result = decoder.decode(url)
+        elapsed = (time.perf_counter() - started) * 1000
+        ok = result == expected
+        failures += not ok
+        print(f"{'OK  ' if ok else 'FAIL'} {kind:<12} {elapsed:7.1f}ms  {result}")
+
+    expected_stats = {
+        'offline_hits': len(fixtures['offline']),
+        'http_hits': len(fixtures['batchexecute']) + len(fixtures['redirect']),
+        'misses': len(fixtures['miss']),
+    }
+    print(f"\n통계: {decoder.stats} (브라우저 없이 해결한 비율 {decoder.hit_rate():.0%})")
+    print(f"로컬 서버가 받은 요청 수: {len(GoogleNewsStandIn.requests_seen)}")
+    if decoder.stats != expected_stats:
+        print(f"FAIL 통계가 다릅니다. 기대값: {expected_stats}")
+        failures += 1
+
+    client.close()
+    server.shutdown()
+    print("\n모든 확인 통과" if not failures else f"\n실패 {failures}건")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())